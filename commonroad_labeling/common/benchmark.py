@@ -0,0 +1,417 @@
+import csv
+import json
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from commonroad.planning.planning_problem import PlanningProblemSet
+from commonroad.scenario.scenario import Scenario
+
+from commonroad_labeling.common.detector_registry import DETECTORS, DetectorDependency
+from commonroad_labeling.common.general import find_scenario_files, find_scenario_tags, get_planned_routes
+from commonroad_labeling.common.lanelet_network_index import clear_lanelet_network_indexes, get_lanelet_network_index
+from commonroad_labeling.common.map_cache import MapTagCache
+from commonroad_labeling.common.route import RouteMode
+from commonroad_labeling.common.route_evaluation import RouteTagEvaluator
+from commonroad_labeling.common.synthetic_scenario import (
+    PLANNING_PROBLEM_ID_OFFSET,
+    create_synthetic_scenario,
+    get_obstacle_state_count,
+)
+from commonroad_labeling.road_configuration.scenario.scenario_obstacle import get_obstacle_lanelet_occupancy
+
+if TYPE_CHECKING:
+    # Criticality metrics are only computed if a `CMComputer` is passed, so that CommonRoad-CriMe is not imported
+    from commonroad_labeling.criticality.computer.cm_computer import CMComputer
+
+try:
+    import resource
+except ImportError:  # pragma: no cover, the module is not available on Windows
+    resource = None
+
+# Stages of `common.general.find_scenario_tags` that are timed by the benchmark
+BENCHMARK_STAGES = ["load", "lanelet_assignment", "map_tags", "obstacle_tags", "route_planning", "route_tags"]
+
+# Files of the bundled scenario folder that are labeled by the smoke benchmark. They cover intersections, highways,
+# traffic signs and scenarios with and without dynamic obstacles, while being fast enough to be run by the tests.
+SMOKE_SCENARIO_NAMES = [
+    "DEU_BadEssen-2_5_I-1-1.cr.xml",
+    "DEU_Hoerstein-1_1_I-1.cr.xml",
+    "USA_Lanker-1_12_I-1-1.cr.xml",
+    "USA_US101-13_5_I-1-1.cr.xml",
+    "ZAM_Tjunction-1_97_T-1.xml",
+]
+
+
+class BenchmarkResult:
+    """
+    Result of a benchmark run, i.e. the time spent in every stage of the labeling summed over all files, the total
+    time, the throughput and the peak memory usage of the process.
+    """
+
+    def __init__(
+        self,
+        files: int,
+        failed_files: int,
+        stage_seconds: dict[str, float],
+        total_seconds: float,
+        peak_rss_bytes: int | None,
+        metadata: dict[str, str] | None = None,
+    ):
+        """
+        Initializes the result with the given measurements.
+        :param files: Number of labeled files.
+        :param failed_files: Number of files whose labeling raised an exception.
+        :param stage_seconds: Wall time in seconds spent in every stage of `BENCHMARK_STAGES`, summed over all files.
+        :param total_seconds: Wall time in seconds spent labeling all files.
+        :param peak_rss_bytes: Peak resident set size of the process in bytes, `None` if it cannot be determined.
+        :param metadata: Optional description of the environment, e.g. the Python version and the platform.
+        """
+        self.files = files
+        self.failed_files = failed_files
+        self.stage_seconds = stage_seconds
+        self.total_seconds = total_seconds
+        self.peak_rss_bytes = peak_rss_bytes
+        self.metadata = metadata if metadata is not None else {}
+
+    @property
+    def files_per_second(self) -> float:
+        """
+        Throughput of the benchmark run.
+        :returns: Number of labeled files per second.
+        """
+        return self.files / self.total_seconds if self.total_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        This method converts the result to a dictionary, e.g. for a baseline JSON file.
+        :returns: A dictionary with the measurements and the metadata of the result.
+        """
+        return {
+            "files": self.files,
+            "failed_files": self.failed_files,
+            "stage_seconds": self.stage_seconds,
+            "total_seconds": self.total_seconds,
+            "files_per_second": self.files_per_second,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, result_dict: dict) -> "BenchmarkResult":
+        """
+        This method creates a result from a dictionary returned by `to_dict`.
+        :param result_dict: Dictionary with the measurements and the metadata of a result.
+        :returns: The `BenchmarkResult` described by the dictionary.
+        """
+        return cls(
+            result_dict["files"],
+            result_dict["failed_files"],
+            result_dict["stage_seconds"],
+            result_dict["total_seconds"],
+            result_dict["peak_rss_bytes"],
+            result_dict.get("metadata"),
+        )
+
+
+class BenchmarkRegression:
+    """
+    A measurement of a benchmark run that is worse than the baseline by more than the allowed threshold.
+    """
+
+    def __init__(self, measurement: str, baseline: float, current: float):
+        """
+        Initializes the regression.
+        :param measurement: Name of the measurement, i.e. a stage, `failed_files`, `total_seconds`,
+        `files_per_second` or `peak_rss_bytes`.
+        :param baseline: Value of the measurement in the baseline.
+        :param current: Value of the measurement in the current run.
+        """
+        self.measurement = measurement
+        self.baseline = baseline
+        self.current = current
+
+    @property
+    def relative_change(self) -> float:
+        """
+        Relative change of the measurement compared to the baseline.
+        :returns: The relative change, e.g. 0.2 if a stage takes 20% longer or the throughput is 20% higher.
+        """
+        return (self.current - self.baseline) / self.baseline if self.baseline else float("inf")
+
+    def __repr__(self) -> str:
+        return (
+            f"BenchmarkRegression({self.measurement}: baseline {self.baseline:.6g}, current {self.current:.6g}, "
+            f"change {self.relative_change:+.1%})"
+        )
+
+
+def get_benchmark_files(path: Path, smoke: bool = False) -> list[Path]:
+    """
+    This function returns the CommonRoad files labeled by a benchmark.
+    :param path: Path to a folder containing CommonRoad scenarios or a single file.
+    :param smoke: If True, only the files of `SMOKE_SCENARIO_NAMES` are returned.
+    :returns: A sorted list of the paths to the files.
+    """
+    paths = find_scenario_files(path)
+    if smoke:
+        paths = [file_path for file_path in paths if file_path.name in SMOKE_SCENARIO_NAMES]
+    return paths
+
+
+def get_peak_rss_bytes() -> int | None:
+    """
+    This function determines the peak resident set size of the current process. Since it is a maximum over the
+    lifetime of the process, benchmarks whose memory usage is compared should be run in a fresh process.
+    :returns: The peak resident set size in bytes, `None` if it cannot be determined on the current platform.
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def run_benchmark(paths: list[Path], repeat: int = 1) -> BenchmarkResult:
+    """
+    This function labels the given files in the current process and measures the time spent in every stage of
+    `find_scenario_tags`. Every repetition starts with an empty map tag cache and without shared lanelet network
+    indexes, so that all repetitions perform the same work regardless of previous repetitions and runs. If the files
+    are labeled several times, the fastest repetition of every stage is reported, which reduces the influence of other
+    processes on the measurements.
+    :param paths: Paths to the CommonRoad files, see `get_benchmark_files`.
+    :param repeat: Number of times all files are labeled.
+    :returns: The `BenchmarkResult` of the run.
+    """
+    stage_seconds = {stage: float("inf") for stage in BENCHMARK_STAGES}
+    total_seconds = float("inf")
+    failed_files = 0
+
+    for _ in range(repeat):
+        map_tag_cache = MapTagCache()
+        clear_lanelet_network_indexes()
+        repetition_stage_seconds = dict.fromkeys(BENCHMARK_STAGES, 0.0)
+        failed_files = 0
+        start_time = time.perf_counter()
+        for path in paths:
+            timings = {}
+            try:
+                find_scenario_tags(path, map_tag_cache, timings)
+            except Exception:
+                failed_files += 1
+            for stage, seconds in timings.items():
+                repetition_stage_seconds[stage] += seconds
+        total_seconds = min(total_seconds, time.perf_counter() - start_time)
+        for stage, seconds in repetition_stage_seconds.items():
+            stage_seconds[stage] = min(stage_seconds[stage], seconds)
+
+    return BenchmarkResult(
+        len(paths),
+        failed_files,
+        stage_seconds,
+        total_seconds,
+        get_peak_rss_bytes(),
+        {"python": platform.python_version(), "platform": platform.platform(), "repeat": str(repeat)},
+    )
+
+
+def compare_benchmarks(
+    baseline: BenchmarkResult, current: BenchmarkResult, threshold: float = 0.1, min_seconds: float = 1e-3
+) -> list[BenchmarkRegression]:
+    """
+    This function compares a benchmark run with a baseline and reports all measurements that are worse than the
+    baseline by more than the threshold, i.e. stages and the total time that take longer, a lower throughput and a
+    higher peak memory usage. Any additional failed file is a regression regardless of the threshold, since failing
+    files skip stages and would otherwise appear as a speed-up.
+    :param baseline: Result of the baseline run, e.g. loaded with `load_benchmark`.
+    :param current: Result of the current run.
+    :param threshold: Allowed relative deterioration, e.g. 0.1 for 10%.
+    :param min_seconds: Stages that take less time than this in both runs are not compared, since their timings are
+    dominated by noise.
+    :returns: A list of the regressions, which is empty if the current run is not worse than the baseline.
+    :raises ValueError: If the runs labeled a different number of files.
+    """
+    if baseline.files != current.files:
+        raise ValueError(f"Cannot compare a run of {current.files} files with a baseline of {baseline.files} files")
+
+    regressions = []
+    if current.failed_files > baseline.failed_files:
+        regressions.append(BenchmarkRegression("failed_files", baseline.failed_files, current.failed_files))
+    for stage in BENCHMARK_STAGES:
+        baseline_seconds = baseline.stage_seconds.get(stage, 0.0)
+        current_seconds = current.stage_seconds.get(stage, 0.0)
+        is_measurable = max(baseline_seconds, current_seconds) >= min_seconds
+        if is_measurable and current_seconds > baseline_seconds * (1 + threshold):
+            regressions.append(BenchmarkRegression(stage, baseline_seconds, current_seconds))
+
+    if current.total_seconds > baseline.total_seconds * (1 + threshold):
+        regressions.append(BenchmarkRegression("total_seconds", baseline.total_seconds, current.total_seconds))
+    if current.files_per_second < baseline.files_per_second * (1 - threshold):
+        regressions.append(BenchmarkRegression("files_per_second", baseline.files_per_second, current.files_per_second))
+    if (
+        baseline.peak_rss_bytes is not None
+        and current.peak_rss_bytes is not None
+        and current.peak_rss_bytes > baseline.peak_rss_bytes * (1 + threshold)
+    ):
+        regressions.append(BenchmarkRegression("peak_rss_bytes", baseline.peak_rss_bytes, current.peak_rss_bytes))
+    return regressions
+
+
+def save_benchmark(result: BenchmarkResult, path: Path):
+    """
+    This function writes a benchmark result to a JSON file, e.g. to be used as baseline.
+    :param result: Result of a benchmark run.
+    :param path: Path to the JSON file.
+    """
+    with open(path, "w") as file:
+        json.dump(result.to_dict(), file, indent=2)
+
+
+def load_benchmark(path: Path) -> BenchmarkResult:
+    """
+    This function reads a benchmark result written by `save_benchmark`.
+    :param path: Path to the JSON file.
+    :returns: The `BenchmarkResult` stored in the file.
+    """
+    with open(path) as file:
+        return BenchmarkResult.from_dict(json.load(file))
+
+
+class ScalingMeasurement:
+    """
+    Runtime of every detector and of the shared preprocessing steps for a synthetic scenario, together with the size
+    of the scenario, see `run_scaling_benchmark`.
+    """
+
+    def __init__(self, parameters: dict[str, Any], lanelets: int, obstacle_states: int, seconds: dict[str, float]):
+        """
+        Initializes the measurement.
+        :param parameters: Parameters of `common.synthetic_scenario.create_synthetic_scenario` used to generate the
+        scenario.
+        :param lanelets: Number of lanelets of the scenario.
+        :param obstacle_states: Number of obstacle states of the scenario.
+        :param seconds: Wall time in seconds of every preprocessing step and detector, see
+        `measure_synthetic_scenario`.
+        """
+        self.parameters = parameters
+        self.lanelets = lanelets
+        self.obstacle_states = obstacle_states
+        self.seconds = seconds
+
+    def to_dict(self) -> dict:
+        """
+        This method converts the measurement to a dictionary, e.g. for a JSON report.
+        :returns: A dictionary with the parameters, the size and the runtimes of the measurement.
+        """
+        return {
+            "parameters": self.parameters,
+            "lanelets": self.lanelets,
+            "obstacle_states": self.obstacle_states,
+            "seconds": self.seconds,
+        }
+
+
+def measure_synthetic_scenario(
+    scenario: Scenario,
+    planning_problem_set: PlanningProblemSet,
+    cm_computer: "CMComputer | None" = None,
+) -> dict[str, float]:
+    """
+    This function measures the runtime of every detector for a scenario held in memory. The lanelet network index,
+    the assignment of obstacles to lanelets and the routes are shared by the detectors and measured separately as
+    `lanelet_network_index`, `lanelet_assignment` and `route_planning`. Every route detector is evaluated by its own
+    `RouteTagEvaluator`, so that its runtime does not depend on the results memoized for other detectors. Lanelet
+    network indexes shared between identical road networks are cleared first, so that scenarios generated with the same
+    road network do not reuse the index of a previous measurement.
+    :param scenario: Scenario, e.g. created by `common.synthetic_scenario.create_synthetic_scenario`.
+    :param planning_problem_set: Planning problem set of the scenario.
+    :param cm_computer: Optional `CMComputer`, whose criticality metrics are computed for the obstacle the planning
+    problem is based on and measured as `CMComputer`. Since the computation modifies the trajectory of that obstacle,
+    it is measured last.
+    :returns: A dictionary mapping the preprocessing steps and the class names of the detectors to their runtime in
+    seconds.
+    """
+    seconds = {}
+
+    def measure(name: str, function, *args):
+        start_time = time.perf_counter()
+        result = function(*args)
+        seconds[name] = time.perf_counter() - start_time
+        return result
+
+    clear_lanelet_network_indexes()
+    measure("lanelet_network_index", get_lanelet_network_index, scenario.lanelet_network)
+    measure("lanelet_assignment", get_obstacle_lanelet_occupancy, scenario)
+    routes = measure(
+        "route_planning", get_planned_routes, scenario, planning_problem_set, None, RouteMode.LANELET_SEQUENCE
+    )
+
+    for detector in DETECTORS:
+        if DetectorDependency.ROUTES in detector.dependencies:
+            evaluator = RouteTagEvaluator(scenario, routes)
+            measure(detector.detector_class.__name__, evaluator.find_tags, [detector.detector_class])
+        else:
+            measure(detector.detector_class.__name__, detector.detector_class(scenario).get_tag_if_fulfilled)
+
+    dynamic_obstacle_ids = {obstacle.obstacle_id for obstacle in scenario.dynamic_obstacles}
+    ego_ids = [
+        planning_problem_id - PLANNING_PROBLEM_ID_OFFSET
+        for planning_problem_id in planning_problem_set.planning_problem_dict
+        if planning_problem_id - PLANNING_PROBLEM_ID_OFFSET in dynamic_obstacle_ids
+    ]
+    if cm_computer is not None and ego_ids:
+        with tempfile.TemporaryDirectory() as output_dir:
+            scenario_path = str(Path(output_dir).joinpath(f"{scenario.scenario_id}.xml"))
+            measure("CMComputer", cm_computer.compute_metrics_for_id, scenario, ego_ids[0], scenario_path, output_dir)
+
+    return seconds
+
+
+def run_scaling_benchmark(
+    parameter_sets: Iterable[dict[str, Any]], cm_computer: "CMComputer | None" = None
+) -> list[ScalingMeasurement]:
+    """
+    This function generates a synthetic scenario for every set of parameters and measures the runtime of every
+    detector, e.g. to obtain the runtime as a function of the number of lanelets by increasing the grid size or as a
+    function of the number of obstacle states by increasing the number of dynamic obstacles and time steps.
+    :param parameter_sets: Keyword arguments of `common.synthetic_scenario.create_synthetic_scenario`, one dictionary
+    per scenario.
+    :param cm_computer: Optional `CMComputer`, whose criticality metrics are measured as well, see
+    `measure_synthetic_scenario`.
+    :returns: A list with a `ScalingMeasurement` for every set of parameters.
+    """
+    measurements = []
+    for parameters in parameter_sets:
+        scenario, planning_problem_set = create_synthetic_scenario(**parameters)
+        lanelets = len(scenario.lanelet_network.lanelets)
+        obstacle_states = get_obstacle_state_count(scenario)
+        seconds = measure_synthetic_scenario(scenario, planning_problem_set, cm_computer)
+        measurements.append(ScalingMeasurement(dict(parameters), lanelets, obstacle_states, seconds))
+    return measurements
+
+
+def save_scaling_csv(measurements: list[ScalingMeasurement], path: Path):
+    """
+    This function writes scaling measurements to a CSV file with one row per scenario, whose columns are the
+    parameters of the scenarios, the number of lanelets and obstacle states and the runtime of every measured step.
+    :param measurements: Measurements returned by `run_scaling_benchmark`.
+    :param path: Path to the CSV file.
+    """
+    parameter_names = list(dict.fromkeys(name for measurement in measurements for name in measurement.parameters))
+    step_names = list(dict.fromkeys(name for measurement in measurements for name in measurement.seconds))
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow([*parameter_names, "lanelets", "obstacle_states", *step_names])
+        for measurement in measurements:
+            writer.writerow(
+                [
+                    *(measurement.parameters.get(name, "") for name in parameter_names),
+                    measurement.lanelets,
+                    measurement.obstacle_states,
+                    *(measurement.seconds.get(name, "") for name in step_names),
+                ]
+            )
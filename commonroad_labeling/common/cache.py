@@ -0,0 +1,56 @@
+import os
+import tempfile
+import weakref
+from functools import wraps
+from pathlib import Path
+from typing import IO, Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def cache_per_object(function: Callable[[Any], T]) -> Callable[[Any], T]:
+    """
+    Decorator that caches the result of a single-argument function for every argument object. Arguments are identified
+    by their identity rather than by equality, because hashing CommonRoad scenarios and lanelet networks traverses all
+    of their elements. A cache entry is dropped as soon as its argument object is garbage collected, hence the cached
+    value must not hold a reference to the argument object itself.
+    :param function: Function with a single argument whose results should be cached.
+    :returns: The wrapped function with an additional `cache_clear` method.
+    """
+    cache: dict[int, tuple[weakref.ref, T]] = {}
+
+    @wraps(function)
+    def wrapper(obj: Any) -> T:
+        key = id(obj)
+        entry = cache.get(key)
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+
+        value = function(obj)
+        cache[key] = (weakref.ref(obj, lambda _: cache.pop(key, None)), value)
+        return value
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+def write_file_atomically(path: Path, write: Callable[[IO], None], binary: bool = False):
+    """
+    This function writes a file in a cache directory. The content is written to a temporary file in the same directory
+    first and then moved to the given path, so that concurrent readers never see a partially written file. The temporary
+    file is removed if writing fails.
+    :param path: Path of the file that is written.
+    :param write: Function that writes the content to the given file object.
+    :param binary: Whether the file is opened in binary mode.
+    """
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb" if binary else "w") as file:
+            write(file)
+        os.replace(temporary_path, path)
+    except BaseException:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        raise
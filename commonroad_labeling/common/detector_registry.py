@@ -0,0 +1,223 @@
+import enum
+from collections.abc import Iterable
+from enum import Enum
+from typing import NamedTuple
+
+from commonroad_labeling.common.tag import Tag, TagEnum, TagGroupEnum
+from commonroad_labeling.common.tag_query import get_tags_of_group
+from commonroad_labeling.ego_vehicle_goal.ego_vehicle_goal_intersection import (
+    EgoVehicleGoalIntersectionProceedStraight,
+    EgoVehicleGoalIntersectionTurnLeft,
+    EgoVehicleGoalIntersectionTurnRight,
+)
+from commonroad_labeling.road_configuration.route.route_lanelet_layout import (
+    RouteLaneletLayoutBidirectional,
+    RouteLaneletLayoutDivergingLane,
+    RouteLaneletLayoutIntersection,
+    RouteLaneletLayoutMergingLane,
+    RouteLaneletLayoutMultiLane,
+    RouteLaneletLayoutOneWay,
+    RouteLaneletLayoutRoundabout,
+    RouteLaneletLayoutSingleLane,
+)
+from commonroad_labeling.road_configuration.route.route_obstacle import (
+    RouteObstacleOtherDynamic,
+    RouteObstacleStatic,
+    RouteOncomingTraffic,
+    RouteTrafficAhead,
+    RouteTrafficBehind,
+)
+from commonroad_labeling.road_configuration.route.route_traffic_sign import (
+    RouteTrafficSignNoRightOfWay,
+    RouteTrafficSignRightOfWay,
+    RouteTrafficSignSpeedLimit,
+    RouteTrafficSignStopLine,
+    RouteTrafficSignTrafficLight,
+)
+from commonroad_labeling.road_configuration.scenario.scenario_lanelet_layout import (
+    LaneletLayoutBidirectional,
+    LaneletLayoutDivergingLane,
+    LaneletLayoutIntersection,
+    LaneletLayoutMergingLane,
+    LaneletLayoutMultiLane,
+    LaneletLayoutOneWay,
+    LaneletLayoutRoundabout,
+    LaneletLayoutSingleLane,
+)
+from commonroad_labeling.road_configuration.scenario.scenario_obstacle import (
+    ObstacleOtherDynamic,
+    ObstacleStatic,
+    ObstacleTraffic,
+)
+from commonroad_labeling.road_configuration.scenario.scenario_traffic_sign import (
+    TrafficSignNoRightOfWay,
+    TrafficSignRightOfWay,
+    TrafficSignSpeedLimit,
+    TrafficSignStopLine,
+    TrafficSignTrafficLight,
+)
+
+
+@enum.unique
+class DetectorDependency(str, Enum):
+    """
+    This is an enum class that defines the parts of a CommonRoad file a detector depends on: the lanelet network
+    (`MAP`), the obstacles (`OBSTACLES`), the assignment of obstacles to lanelets (`OBSTACLE_LANELET_ASSIGNMENT`) and
+    the planned routes (`ROUTES`). Each of them has its own cost during labeling, so that parts no requested detector
+    depends on are not computed.
+    """
+
+    MAP = "map"
+    OBSTACLES = "obstacles"
+    OBSTACLE_LANELET_ASSIGNMENT = "obstacle_lanelet_assignment"
+    ROUTES = "routes"
+
+
+class Detector(NamedTuple):
+    """
+    Entry of the detector registry.
+    """
+
+    detector_class: type[Tag]
+    """Class of the detector. Detectors depending on routes are constructed with a route and the scenario, all other
+    detectors with the scenario only."""
+    tags: frozenset[TagEnum]
+    """Tags the detector can return."""
+    dependencies: frozenset[DetectorDependency]
+    """Parts of a CommonRoad file the detector depends on."""
+
+
+def _detector(detector_class: type[Tag], tags: Iterable[TagEnum], *dependencies: DetectorDependency) -> Detector:
+    return Detector(detector_class, frozenset(tags), frozenset(dependencies))
+
+
+_MAP = DetectorDependency.MAP
+_OBSTACLES = DetectorDependency.OBSTACLES
+_OBSTACLE_LANELET_ASSIGNMENT = DetectorDependency.OBSTACLE_LANELET_ASSIGNMENT
+_ROUTES = DetectorDependency.ROUTES
+
+# All detectors in the order in which `common.general.find_scenario_tags` executes them
+DETECTORS: list[Detector] = [
+    # Scenario lanelet layout and traffic sign detectors
+    _detector(LaneletLayoutSingleLane, [TagEnum.SCENARIO_LANELET_LAYOUT_SINGLE_LANE], _MAP),
+    _detector(LaneletLayoutMultiLane, [TagEnum.SCENARIO_LANELET_LAYOUT_MULTI_LANE], _MAP),
+    _detector(LaneletLayoutBidirectional, [TagEnum.SCENARIO_LANELET_LAYOUT_BIDIRECTIONAL], _MAP),
+    _detector(LaneletLayoutOneWay, [TagEnum.SCENARIO_LANELET_LAYOUT_ONE_WAY], _MAP),
+    _detector(LaneletLayoutIntersection, [TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION], _MAP),
+    _detector(LaneletLayoutDivergingLane, [TagEnum.SCENARIO_LANELET_LAYOUT_DIVERGING_LANE], _MAP),
+    _detector(LaneletLayoutMergingLane, [TagEnum.SCENARIO_LANELET_LAYOUT_MERGING_LANE], _MAP),
+    _detector(LaneletLayoutRoundabout, [TagEnum.SCENARIO_LANELET_LAYOUT_ROUNDABOUT], _MAP),
+    _detector(TrafficSignSpeedLimit, [TagEnum.SCENARIO_TRAFFIC_SIGN_SPEED_LIMIT], _MAP),
+    _detector(TrafficSignRightOfWay, [TagEnum.SCENARIO_TRAFFIC_SIGN_RIGHT_OF_WAY], _MAP),
+    _detector(TrafficSignNoRightOfWay, [TagEnum.SCENARIO_TRAFFIC_SIGN_NO_RIGHT_OF_WAY], _MAP),
+    _detector(TrafficSignStopLine, [TagEnum.SCENARIO_TRAFFIC_SIGN_STOP_LINE], _MAP),
+    _detector(TrafficSignTrafficLight, [TagEnum.SCENARIO_TRAFFIC_SIGN_TRAFFIC_LIGHT], _MAP),
+    # Scenario obstacle detectors
+    _detector(ObstacleStatic, [TagEnum.SCENARIO_OBSTACLE_STATIC], _OBSTACLES),
+    _detector(ObstacleTraffic, [TagEnum.SCENARIO_OBSTACLE_TRAFFIC], _OBSTACLES, _OBSTACLE_LANELET_ASSIGNMENT),
+    _detector(
+        ObstacleOtherDynamic, [TagEnum.SCENARIO_OBSTACLE_OTHER_DYNAMIC], _OBSTACLES, _OBSTACLE_LANELET_ASSIGNMENT
+    ),
+    # Route lanelet layout detectors
+    _detector(RouteLaneletLayoutSingleLane, [TagEnum.ROUTE_LANELET_LAYOUT_SINGLE_LANE], _MAP, _ROUTES),
+    _detector(RouteLaneletLayoutMultiLane, [TagEnum.ROUTE_LANELET_LAYOUT_MULTI_LANE], _MAP, _ROUTES),
+    _detector(RouteLaneletLayoutBidirectional, [TagEnum.ROUTE_LANELET_LAYOUT_BIDIRECTIONAL], _MAP, _ROUTES),
+    _detector(RouteLaneletLayoutOneWay, [TagEnum.ROUTE_LANELET_LAYOUT_ONE_WAY], _MAP, _ROUTES),
+    _detector(RouteLaneletLayoutIntersection, [TagEnum.ROUTE_LANELET_LAYOUT_INTERSECTION], _MAP, _ROUTES),
+    _detector(RouteLaneletLayoutDivergingLane, [TagEnum.ROUTE_LANELET_LAYOUT_DIVERGING_LANE], _MAP, _ROUTES),
+    _detector(RouteLaneletLayoutMergingLane, [TagEnum.ROUTE_LANELET_LAYOUT_MERGING_LANE], _MAP, _ROUTES),
+    _detector(RouteLaneletLayoutRoundabout, [TagEnum.ROUTE_LANELET_LAYOUT_ROUNDABOUT], _MAP, _ROUTES),
+    # Route obstacle detectors
+    _detector(
+        RouteObstacleStatic,
+        [TagEnum.ROUTE_OBSTACLE_STATIC],
+        _MAP,
+        _OBSTACLES,
+        _OBSTACLE_LANELET_ASSIGNMENT,
+        _ROUTES,
+    ),
+    _detector(
+        RouteObstacleOtherDynamic,
+        [TagEnum.ROUTE_OBSTACLE_OTHER_DYNAMIC],
+        _MAP,
+        _OBSTACLES,
+        _OBSTACLE_LANELET_ASSIGNMENT,
+        _ROUTES,
+    ),
+    _detector(
+        RouteTrafficAhead,
+        [TagEnum.ROUTE_OBSTACLE_TRAFFIC_AHEAD],
+        _MAP,
+        _OBSTACLES,
+        _OBSTACLE_LANELET_ASSIGNMENT,
+        _ROUTES,
+    ),
+    _detector(
+        RouteTrafficBehind,
+        [TagEnum.ROUTE_OBSTACLE_TRAFFIC_BEHIND],
+        _MAP,
+        _OBSTACLES,
+        _OBSTACLE_LANELET_ASSIGNMENT,
+        _ROUTES,
+    ),
+    _detector(
+        RouteOncomingTraffic,
+        [TagEnum.ROUTE_OBSTACLE_ONCOMING_TRAFFIC, TagEnum.ROUTE_OBSTACLE_NO_ONCOMING_TRAFFIC],
+        _MAP,
+        _OBSTACLES,
+        _OBSTACLE_LANELET_ASSIGNMENT,
+        _ROUTES,
+    ),
+    # Route traffic sign detectors
+    _detector(RouteTrafficSignSpeedLimit, [TagEnum.ROUTE_TRAFFIC_SIGN_SPEED_LIMIT], _MAP, _ROUTES),
+    _detector(RouteTrafficSignRightOfWay, [TagEnum.ROUTE_TRAFFIC_SIGN_RIGHT_OF_WAY], _MAP, _ROUTES),
+    _detector(RouteTrafficSignNoRightOfWay, [TagEnum.ROUTE_TRAFFIC_SIGN_NO_RIGHT_OF_WAY], _MAP, _ROUTES),
+    _detector(RouteTrafficSignStopLine, [TagEnum.ROUTE_TRAFFIC_SIGN_STOP_LINE], _MAP, _ROUTES),
+    _detector(RouteTrafficSignTrafficLight, [TagEnum.ROUTE_TRAFFIC_SIGN_TRAFFIC_LIGHT], _MAP, _ROUTES),
+    # Ego vehicle goal detectors
+    _detector(EgoVehicleGoalIntersectionTurnLeft, [TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_TURN_LEFT], _MAP, _ROUTES),
+    _detector(EgoVehicleGoalIntersectionTurnRight, [TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_TURN_RIGHT], _MAP, _ROUTES),
+    _detector(
+        EgoVehicleGoalIntersectionProceedStraight,
+        [TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_PROCEED_STRAIGHT],
+        _MAP,
+        _ROUTES,
+    ),
+]
+
+
+def get_requested_tags(
+    tags: Iterable[TagEnum] | None = None, groups: Iterable[TagGroupEnum] | None = None
+) -> set[TagEnum]:
+    """
+    This function combines requested tags and tag groups to a set of tags.
+    :param tags: Optional tags that are requested.
+    :param groups: Optional tag groups whose tags are requested.
+    :returns: The set of requested tags, all tags if neither tags nor groups are given.
+    """
+    if tags is None and groups is None:
+        return set(TagEnum)
+
+    requested_tags = set(tags or ())
+    for tag_group in groups or ():
+        requested_tags.update(get_tags_of_group(tag_group))
+    return requested_tags
+
+
+def get_detectors(requested_tags: Iterable[TagEnum]) -> list[Detector]:
+    """
+    This function selects the detectors needed to detect the given tags.
+    :param requested_tags: Tags that are requested.
+    :returns: A list of all detectors that can return any of the requested tags, in the order of `DETECTORS`.
+    """
+    requested_tags = set(requested_tags)
+    return [detector for detector in DETECTORS if not detector.tags.isdisjoint(requested_tags)]
+
+
+def get_dependencies(detectors: Iterable[Detector]) -> set[DetectorDependency]:
+    """
+    This function collects the dependencies of several detectors.
+    :param detectors: Detectors of the registry.
+    :returns: The set of parts of a CommonRoad file any of the detectors depends on.
+    """
+    return set().union(*(detector.dependencies for detector in detectors))
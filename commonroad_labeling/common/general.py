@@ -1,191 +1,497 @@
-import os
+import signal
+import threading
+import time
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from multiprocessing import get_context
 from pathlib import Path
+from typing import NamedTuple
 
+import numpy as np
 from commonroad.common.file_reader import CommonRoadFileReader
 from commonroad.planning.planning_problem import PlanningProblemSet
 from commonroad.scenario.scenario import Scenario
-from commonroad_route_planner.reference_path import ReferencePath
-from commonroad_route_planner.reference_path_planner import ReferencePathPlanner
-from commonroad_route_planner.route_planner import RoutePlanner
 
-from commonroad_labeling.common.tag import TagEnum
-from commonroad_labeling.common.util import print_parsing_error, print_scenario_tags
-from commonroad_labeling.ego_vehicle_goal.ego_vehicle_goal_intersection import (
-    EgoVehicleGoalIntersectionProceedStraight,
-    EgoVehicleGoalIntersectionTurnLeft,
-    EgoVehicleGoalIntersectionTurnRight,
-)
-from commonroad_labeling.road_configuration.route.route_lanelet_layout import (
-    RouteLaneletLayoutBidirectional,
-    RouteLaneletLayoutDivergingLane,
-    RouteLaneletLayoutIntersection,
-    RouteLaneletLayoutMergingLane,
-    RouteLaneletLayoutMultiLane,
-    RouteLaneletLayoutOneWay,
-    RouteLaneletLayoutRoundabout,
-    RouteLaneletLayoutSingleLane,
-)
-from commonroad_labeling.road_configuration.route.route_obstacle import (
-    RouteObstacleOtherDynamic,
-    RouteObstacleStatic,
-    RouteOncomingTraffic,
-    RouteTrafficAhead,
-    RouteTrafficBehind,
-)
-from commonroad_labeling.road_configuration.route.route_traffic_sign import (
-    RouteTrafficSignNoRightOfWay,
-    RouteTrafficSignRightOfWay,
-    RouteTrafficSignSpeedLimit,
-    RouteTrafficSignStopLine,
-    RouteTrafficSignTrafficLight,
-)
-from commonroad_labeling.road_configuration.scenario.scenario_lanelet_layout import (
-    LaneletLayoutBidirectional,
-    LaneletLayoutDivergingLane,
-    LaneletLayoutIntersection,
-    LaneletLayoutMergingLane,
-    LaneletLayoutMultiLane,
-    LaneletLayoutOneWay,
-    LaneletLayoutRoundabout,
-    LaneletLayoutSingleLane,
-)
-from commonroad_labeling.road_configuration.scenario.scenario_obstacle import (
-    ObstacleOtherDynamic,
-    ObstacleStatic,
-    ObstacleTraffic,
-)
-from commonroad_labeling.road_configuration.scenario.scenario_traffic_sign import (
-    TrafficSignNoRightOfWay,
-    TrafficSignRightOfWay,
-    TrafficSignSpeedLimit,
-    TrafficSignStopLine,
-    TrafficSignTrafficLight,
+from commonroad_labeling.common.detector_registry import (
+    DetectorDependency,
+    get_dependencies,
+    get_detectors,
+    get_requested_tags,
 )
+from commonroad_labeling.common.map_cache import MapTagCache, default_map_tag_cache
+from commonroad_labeling.common.profiling import Profiler, get_active_profiler
+from commonroad_labeling.common.result_cache import ResultCache, get_file_content_hash
+from commonroad_labeling.common.route import Route, RouteMode, plan_lanelet_routes
+from commonroad_labeling.common.route_cache import RouteCache, plan_reference_paths
+from commonroad_labeling.common.route_evaluation import RouteTagEvaluator
+from commonroad_labeling.common.tag import TagEnum, TagGroupEnum
+from commonroad_labeling.common.tag_mask import get_tag_mask_array
+from commonroad_labeling.common.util import print_parsing_error, print_scenario_tags
+from commonroad_labeling.road_configuration.scenario.scenario_obstacle import get_obstacle_lanelet_occupancy
+
+POOL_TIMEOUT_MARGIN = 10.0
+"""Seconds added to the time limit of a chunk labeled in a pool, which covers starting a process and its imports."""
+
+
+class LabelingResult(NamedTuple):
+    """
+    Result of the automatic labeling of a single CommonRoad file.
+    """
+
+    path: Path
+    """Path to the CommonRoad file."""
+    tags: set[TagEnum] | None
+    """Set of detected tags if all detectors were executed successfully, `None` otherwise."""
+    error: str | None
+    """Description of the error that occurred, `None` if the labeling was successful."""
+    timings: dict[str, float]
+    """Time in seconds spent in the stages of the labeling, see `find_scenario_tags`, and in total."""
 
 
-def get_detected_tags_by_file(path: Path) -> dict[Path, set[TagEnum] | None]:
+def get_detected_tags_by_file(
+    path: Path,
+    workers: int = 1,
+    timeout: float | None = None,
+    chunk_size: int = 8,
+    result_cache: ResultCache | None = None,
+) -> dict[Path, set[TagEnum] | None]:
     """
     This function performs the automatic labeling for all CommonRoad files in a folder/single CommonRoad file provided
     by the specified path and returns a dictionary containing file paths with the results.
     :param path: Path to a folder containing CommonRoad scenarios or a single file.
+    :param workers: Number of processes used to label the files in parallel. Files are labeled in the current process
+    if it is 1. Since worker processes are spawned, scripts using more workers must guard their entry point with
+    `if __name__ == "__main__":`.
+    :param timeout: Optional time limit in seconds for labeling a single file. Files exceeding it are treated as if an
+    error occurred. It is enforced on platforms that support `SIGALRM` and, for files that hang in native code, by
+    terminating the worker processes if more than one worker is used.
+    :param chunk_size: Number of files submitted to a process at once. Consecutive files of a folder often share the
+    same road network, so that larger chunks make better use of the map tag cache of each process.
+    :param result_cache: Optional cache of the results of previous runs. Files whose content has not changed since
+    they were labeled successfully by the same detectors are not parsed again.
     :return: A dictionary with file paths as keys and, as values, a set of tags if all detectors were executed
-    successfully, `None` if error occurred.
+    successfully, `None` if error occurred. The keys are sorted by path.
     """
     tags_by_file = {}
+    for result in iter_detected_tags(path, workers, timeout, chunk_size, result_cache):
+        if result.error is None:
+            print_scenario_tags(result.path, result.tags)
+        else:
+            print_parsing_error(result.path, result.error)
+        tags_by_file[result.path] = result.tags
+
+    return dict(sorted(tags_by_file.items()))
+
+
+def get_detected_tag_masks(
+    path: Path,
+    workers: int = 1,
+    timeout: float | None = None,
+    chunk_size: int = 8,
+    result_cache: ResultCache | None = None,
+) -> tuple[list[Path], np.ndarray, np.ndarray]:
+    """
+    This function performs the automatic labeling for all CommonRoad files in a folder/single CommonRoad file provided
+    by the specified path like `get_detected_tags_by_file`, but returns the tags of all files as an array of tag masks,
+    see `common.tag_mask.TagMask`, so that filtering and statistics over large datasets can be vectorized.
+    :param path: Path to a folder containing CommonRoad scenarios or a single file.
+    :param workers: Number of processes used to label the files in parallel, see `get_detected_tags_by_file`.
+    :param timeout: Optional time limit in seconds for labeling a single file.
+    :param chunk_size: Number of files submitted to a process at once.
+    :param result_cache: Optional cache of the results of previous runs.
+    :return: A tuple of the paths of all files sorted by path, a NumPy array of unsigned 64-bit integers with the tag
+    mask of every file and a boolean NumPy array indicating which files were labeled successfully. Files whose
+    labeling failed have the tag mask 0.
+    """
+    results = sorted(
+        ((result.path, result.tags) for result in iter_detected_tags(path, workers, timeout, chunk_size, result_cache)),
+        key=lambda result: result[0],
+    )
+    paths = [file_path for file_path, _ in results]
+    masks = get_tag_mask_array(tags for _, tags in results)
+    labeled = np.fromiter((tags is not None for _, tags in results), dtype=bool, count=len(results))
+    return paths, masks, labeled
+
 
+def iter_detected_tags(
+    path: Path,
+    workers: int = 1,
+    timeout: float | None = None,
+    chunk_size: int = 8,
+    result_cache: ResultCache | None = None,
+) -> Iterator[LabelingResult]:
+    """
+    This function performs the automatic labeling for all CommonRoad files in a folder/single CommonRoad file provided
+    by the specified path and yields the result of every file as soon as it is available. Only a bounded number of
+    results is kept in memory at any time, regardless of the number of files.
+    :param path: Path to a folder containing CommonRoad scenarios or a single file.
+    :param workers: Number of processes used to label the files in parallel, see `get_detected_tags_by_file`.
+    :param timeout: Optional time limit in seconds for labeling a single file.
+    :param chunk_size: Number of files submitted to a process at once.
+    :param result_cache: Optional cache of the results of previous runs. Successfully labeled files are added to it.
+    :return: An iterator over a `LabelingResult`, i.e. a tuple `(path, tags, error, timings)`, for every file. Results
+    are yielded in the order of the paths, except that cached results are yielded first and files that are retried
+    after a process terminated abruptly are yielded at the end. Timings of cached results only contain the time for
+    hashing the file and reading the cache as `total`.
+    """
+    paths = find_scenario_files(path)
+    if result_cache is None:
+        yield from iter_labeling_results(paths, workers, timeout, chunk_size)
+        return
+
+    content_hash_by_path = {}
+    for file_path in paths:
+        start_time = time.perf_counter()
+        content_hash = get_file_content_hash(file_path)
+        tags = result_cache.get(content_hash)
+        if tags is None:
+            content_hash_by_path[file_path] = content_hash
+        else:
+            yield LabelingResult(file_path, tags, None, {"total": time.perf_counter() - start_time})
+
+    for result in iter_labeling_results(list(content_hash_by_path), workers, timeout, chunk_size):
+        if result.error is None:
+            result_cache.put(content_hash_by_path[result.path], result.tags)
+        yield result
+
+
+def iter_labeling_results(
+    paths: list[Path], workers: int, timeout: float | None, chunk_size: int
+) -> Iterator[LabelingResult]:
+    """
+    This function labels the given CommonRoad files in the current process or in a pool of processes. Chunks of files
+    whose process terminated abruptly are retried file by file, and files that still fail in a process of their own.
+    :param paths: Paths to the CommonRoad files.
+    :param workers: Number of processes. Files are labeled in the current process if it is 1.
+    :param timeout: Optional time limit in seconds for labeling a single file.
+    :param chunk_size: Number of files submitted to a process at once.
+    :return: An iterator over a `LabelingResult` for every file.
+    """
+    if workers <= 1:
+        for path in paths:
+            yield label_file(path, timeout)
+        return
+
+    crashed_paths = yield from iter_labeling_results_in_pool(paths, workers, timeout, chunk_size)
+    if crashed_paths:
+        crashed_paths = yield from iter_labeling_results_in_pool(crashed_paths, workers, timeout, 1)
+    for crashed_path in crashed_paths:
+        if (yield from iter_labeling_results_in_pool([crashed_path], 1, timeout, 1)):
+            yield LabelingResult(crashed_path, None, "Process labeling the file terminated abruptly.", {})
+
+
+def find_scenario_files(path: Path) -> list[Path]:
+    """
+    This function collects all CommonRoad files in a folder and its subfolders or a single CommonRoad file.
+    :param path: Path to a folder containing CommonRoad scenarios or a single file.
+    :return: A list of paths to CommonRoad files, sorted by path.
+    """
     if path.is_dir():
-        for filename in os.listdir(path):
-            new_path = path.joinpath(filename)
-            if new_path.is_dir():
-                tags_by_file.update(get_detected_tags_by_file(new_path))
-            elif new_path.is_file() and new_path.suffix == ".xml":
-                tags_by_file[new_path] = parse_file(new_path)
+        return sorted(file_path for file_path in path.rglob("*.xml") if file_path.is_file())
     elif path.is_file():
-        tags_by_file[path] = parse_file(path)
+        return [path]
+    return []
+
+
+def iter_labeling_results_in_pool(
+    paths: list[Path], workers: int, timeout: float | None, chunk_size: int
+) -> Generator[LabelingResult, None, list[Path]]:
+    """
+    This function labels CommonRoad files in a pool of processes and yields the results in the order of the paths.
+    Files are submitted in chunks of consecutive files, and at most two chunks per process are submitted at once, so
+    that results do not pile up in memory if they are consumed slowly. If a process terminates abruptly, the pool is
+    replaced and labeling continues with the chunks that have not been submitted yet. Since `time_limit` cannot
+    interrupt a process that hangs in native code, a chunk that does not finish within the time limit of all of its
+    files plus `POOL_TIMEOUT_MARGIN` is handled like a terminated process after terminating the pool, except for a
+    chunk of a single file, whose result is a `TimeoutError`. If a profiler is enabled, the files are labeled with
+    `label_files_profiled` and the profiles of all completed chunks are merged into the enabled profiler.
+    :param paths: Paths to the CommonRoad files.
+    :param workers: Number of processes.
+    :param timeout: Optional time limit in seconds for labeling a single file.
+    :param chunk_size: Number of files submitted to a process at once.
+    :return: A generator of the results of all files whose chunk was completed. Its return value is a list of paths of
+    all files whose chunk could not be completed because a process terminated abruptly or did not respond.
+    """
+    pending_chunks = deque()
+    for path in paths:
+        if not pending_chunks or len(pending_chunks[-1]) == chunk_size:
+            pending_chunks.append([])
+        pending_chunks[-1].append(path)
+
+    profiler = get_active_profiler()
+    crashed_paths = []
+    while pending_chunks:
+        # Processes are spawned instead of forked, because the route planner uses native thread pools that deadlock
+        # in forked processes once they have been used in the parent process
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(pending_chunks)), mp_context=get_context("spawn"))
+        submitted_chunks = deque()
+        try:
+            while pending_chunks or submitted_chunks:
+                while pending_chunks and len(submitted_chunks) < 2 * workers:
+                    chunk = pending_chunks.popleft()
+                    if profiler is None:
+                        future = executor.submit(label_files, chunk, timeout)
+                    else:
+                        future = executor.submit(label_files_profiled, chunk, timeout)
+                    submitted_chunks.append((chunk, future))
+
+                chunk, future = submitted_chunks.popleft()
+                # All previously submitted chunks are completed, hence the chunk is already being labeled or its
+                # process is idle
+                chunk_timeout = None if timeout is None else timeout * len(chunk) + POOL_TIMEOUT_MARGIN
+                try:
+                    results = future.result(chunk_timeout)
+                except FutureTimeoutError:
+                    terminate_pool(executor)
+                    if len(chunk) == 1:
+                        yield LabelingResult(chunk[0], None, f"Labeling did not finish within {timeout} seconds.", {})
+                        chunk = []
+                except BrokenProcessPool:
+                    pass
+                else:
+                    if profiler is not None:
+                        results, chunk_profiler = results
+                        profiler.merge(chunk_profiler)
+                    yield from results
+                    continue
 
-    return tags_by_file
+                crashed_paths.extend(chunk)
+                for submitted_chunk, _ in submitted_chunks:
+                    crashed_paths.extend(submitted_chunk)
+                break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
+    return crashed_paths
 
-def parse_file(path: Path) -> set[TagEnum] | None:
+
+def terminate_pool(executor: ProcessPoolExecutor):
+    """
+    This function terminates all processes of a pool, including processes that are busy.
+    :param executor: Pool of processes.
+    """
+    # `ProcessPoolExecutor` can only wait for busy processes before Python 3.14
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+
+
+def label_files(paths: list[Path], timeout: float | None = None) -> list[LabelingResult]:
+    """
+    This function performs the automatic labeling for several CommonRoad files one after another.
+    :param paths: Paths to the CommonRoad XML files.
+    :param timeout: Optional time limit in seconds for labeling a single file.
+    :return: A list with a `LabelingResult` for every file.
+    """
+    return [label_file(path, timeout) for path in paths]
+
+
+def label_files_profiled(paths: list[Path], timeout: float | None = None) -> tuple[list[LabelingResult], Profiler]:
+    """
+    This function performs the automatic labeling for several CommonRoad files one after another like `label_files`
+    while a profiler of its own is enabled, e.g. in a worker process whose measurements are merged into the profiler of
+    the main process with `Profiler.merge`.
+    :param paths: Paths to the CommonRoad XML files.
+    :param timeout: Optional time limit in seconds for labeling a single file.
+    :return: A tuple of a list with a `LabelingResult` for every file and the disabled `Profiler` of the files.
+    """
+    with Profiler() as profiler:
+        results = label_files(paths, timeout)
+    return results, profiler
+
+
+def label_file(path: Path, timeout: float | None = None) -> LabelingResult:
+    """
+    This function performs the automatic labeling for a single CommonRoad file, catching any exception.
+    :param path: A path to the CommonRoad XML file.
+    :param timeout: Optional time limit in seconds, after which the labeling is aborted. It is only enforced in the
+    main thread on platforms that support `SIGALRM`.
+    :return: A `LabelingResult` of the file.
+    """
+    timings = {}
+    start_time = time.perf_counter()
+    try:
+        with time_limit(timeout):
+            tags = find_scenario_tags(path, timings=timings)
+        error = None
+    except Exception as e:
+        tags = None
+        error = str(e) or type(e).__name__
+    timings["total"] = time.perf_counter() - start_time
+
+    return LabelingResult(path, tags, error, timings)
+
+
+def parse_file(path: Path, timeout: float | None = None) -> set[TagEnum] | None:
     """
     This function performs the automatic labeling for a single CommonRoad file provided
     by the specified path and returns a set of detected tags.
     :param path: A path to the CommonRoad XML file.
+    :param timeout: Optional time limit in seconds, after which the labeling is aborted. It is only enforced in the
+    main thread on platforms that support `SIGALRM`.
     :return: A set of detected tags if executed successfully, `None` otherwise.
     """
+    result = label_file(path, timeout)
+    if result.error is None:
+        print_scenario_tags(path, result.tags)
+    else:
+        print_parsing_error(path, result.error)
+    return result.tags
+
+
+@contextmanager
+def time_limit(timeout: float | None):
+    """
+    Context manager that raises a `TimeoutError` inside its block once the given time limit has passed. It has no
+    effect if no time limit is given or if `SIGALRM` cannot be used, i.e. outside the main thread or on Windows.
+    :param timeout: Time limit in seconds.
+    """
+    if timeout is None or not hasattr(signal, "SIGALRM") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def raise_timeout(signum, frame):
+        raise TimeoutError(f"Labeling did not finish within {timeout} seconds.")
+
+    previous_handler = signal.signal(signal.SIGALRM, raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
     try:
-        new_tags = find_scenario_tags(path)
-        print_scenario_tags(path, new_tags)
-        return new_tags
-    except Exception as e:
-        print_parsing_error(path, e)
-        return None
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
 
 
-def get_planned_routes(scenario: Scenario, planning_problem_set: PlanningProblemSet) -> list[ReferencePath]:
+def get_planned_routes(
+    scenario: Scenario,
+    planning_problem_set: PlanningProblemSet,
+    route_cache: RouteCache | None = None,
+    route_mode: RouteMode = RouteMode.REFERENCE_PATH,
+) -> list[Route]:
     """
     This function extracts all possible routes that an ego vehicle can take in a given scenario.
     :param scenario: Scenario for which the routes need to be extracted.
     :param planning_problem_set: Planning problem set that is related to the given scenario.
+    :param route_cache: Optional cache of planned reference paths. Reference paths are only planned if they are not
+    cached yet. Lanelet sequences are planned faster than they could be loaded and are therefore never cached.
+    :param route_mode: Representation of the routes. `RouteMode.REFERENCE_PATH` returns a `ReferencePath` for every
+    route, `RouteMode.LANELET_SEQUENCE` returns a `LaneletRoute`, which skips planning the reference polylines.
     :return: A list of all possible routes an ego vehicle can take in the given scenario.
     """
     routes = []
     for planning_problem in list(planning_problem_set.planning_problem_dict.values()):
-        route_planner = RoutePlanner(scenario.lanelet_network, planning_problem)
-        calculated_routes = route_planner.plan_routes()
-        reference_path_planner = ReferencePathPlanner(scenario.lanelet_network, planning_problem, calculated_routes)
-
-        reference_paths, _ = reference_path_planner.plan_all_reference_paths()
-
-        routes.extend(reference_paths)
+        if route_mode == RouteMode.LANELET_SEQUENCE:
+            routes.extend(plan_lanelet_routes(scenario.lanelet_network, planning_problem))
+        elif route_cache is None:
+            routes.extend(plan_reference_paths(scenario.lanelet_network, planning_problem))
+        else:
+            routes.extend(route_cache.get_routes(scenario.lanelet_network, planning_problem))
 
     return routes
 
 
-def find_scenario_tags(path_to_file: Path) -> set[TagEnum]:
+def find_scenario_tags(
+    path_to_file: Path,
+    map_tag_cache: MapTagCache | None = None,
+    timings: dict[str, float] | None = None,
+    tags: Iterable[TagEnum] | None = None,
+    groups: Iterable[TagGroupEnum] | None = None,
+    route_cache: RouteCache | None = None,
+    route_mode: RouteMode = RouteMode.LANELET_SEQUENCE,
+    reader_lanelet_assignment: bool = False,
+) -> set[TagEnum]:
     """
-    This method performs all possible checks for tags for a given CommonRoad file.
+    This method performs all possible checks for tags for a given CommonRoad file. If tags or tag groups are requested,
+    only the detectors of the requested tags are executed and only the parts of the file they depend on are computed,
+    e.g. routes are only planned if route or ego vehicle goal tags are requested.
     :param path_to_file: Path to a CommonRoad file for which the automatic tag detection is to be performed.
-    :return: A set of tags that describe the scenario.
-    """
-
-    scenario, planning_problem_set = CommonRoadFileReader(path_to_file).open(lanelet_assignment=True)
-
-    detected_tags = set()
-
-    # Lanelet layout tags
-    detected_tags.add(LaneletLayoutSingleLane(scenario).get_tag_if_fulfilled())
-    detected_tags.add(LaneletLayoutMultiLane(scenario).get_tag_if_fulfilled())
-    detected_tags.add(LaneletLayoutBidirectional(scenario).get_tag_if_fulfilled())
-    detected_tags.add(LaneletLayoutOneWay(scenario).get_tag_if_fulfilled())
-    detected_tags.add(LaneletLayoutIntersection(scenario).get_tag_if_fulfilled())
-    detected_tags.add(LaneletLayoutDivergingLane(scenario).get_tag_if_fulfilled())
-    detected_tags.add(LaneletLayoutMergingLane(scenario).get_tag_if_fulfilled())
-    detected_tags.add(LaneletLayoutRoundabout(scenario).get_tag_if_fulfilled())
-
-    # Obstacles tags
-    detected_tags.add(ObstacleStatic(scenario).get_tag_if_fulfilled())
-    detected_tags.add(ObstacleTraffic(scenario).get_tag_if_fulfilled())
-    detected_tags.add(ObstacleOtherDynamic(scenario).get_tag_if_fulfilled())
-
-    # Traffic sign tags
-    detected_tags.add(TrafficSignSpeedLimit(scenario).get_tag_if_fulfilled())
-    detected_tags.add(TrafficSignRightOfWay(scenario).get_tag_if_fulfilled())
-    detected_tags.add(TrafficSignNoRightOfWay(scenario).get_tag_if_fulfilled())
-    detected_tags.add(TrafficSignStopLine(scenario).get_tag_if_fulfilled())
-    detected_tags.add(TrafficSignTrafficLight(scenario).get_tag_if_fulfilled())
-
-    # Route tags
-    routes = get_planned_routes(scenario, planning_problem_set)
-
-    for route in routes:
-        # Route lanelet layout tags
-        detected_tags.add(RouteLaneletLayoutSingleLane(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteLaneletLayoutMultiLane(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteLaneletLayoutBidirectional(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteLaneletLayoutOneWay(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteLaneletLayoutIntersection(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteLaneletLayoutDivergingLane(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteLaneletLayoutMergingLane(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteLaneletLayoutRoundabout(route, scenario).get_tag_if_fulfilled())
+    :param map_tag_cache: Cache of tags that depend only on the lanelet network. Defaults to a cache shared by all calls
+    within the current process.
+    :param timings: Optional dictionary, to which the time in seconds spent in the stages `load`,
+    `lanelet_assignment`, `map_tags`, `obstacle_tags`, `route_planning` and `route_tags` is written.
+    :param tags: Optional tags that are requested.
+    :param groups: Optional tag groups whose tags are requested. All tags are detected if neither tags nor groups are
+    given.
+    :param route_cache: Optional cache of planned reference paths, see `get_planned_routes`.
+    :param route_mode: Representation of the planned routes, see `get_planned_routes`. Since no detector uses the
+    reference polylines, planning only the lanelet sequences of the routes yields the same tags.
+    :param reader_lanelet_assignment: If True and a requested detector uses the assignment of obstacles to lanelets,
+    the file is opened with the lanelet assignment of the `CommonRoadFileReader`, which is reused by the detectors. If
+    False, the reader's assignment is skipped and obstacles are assigned to lanelets with a single batched query,
+    which is considerably faster, since the reader additionally assigns the shapes of dynamic obstacles at every time
+    step.
+    :return: A set of tags that describe the scenario, restricted to the requested tags.
+    """
+
+    if map_tag_cache is None:
+        map_tag_cache = default_map_tag_cache
+    if timings is None:
+        timings = {}
+
+    requested_tags = get_requested_tags(tags, groups)
+    detectors = get_detectors(requested_tags)
+    dependencies = get_dependencies(detectors)
+    map_detectors = [detector for detector in detectors if detector.dependencies == {DetectorDependency.MAP}]
+    route_detectors = [detector for detector in detectors if DetectorDependency.ROUTES in detector.dependencies]
+    obstacle_detectors = [
+        detector for detector in detectors if detector not in map_detectors and detector not in route_detectors
+    ]
+
+    profiler = get_active_profiler()
+    if profiler is not None:
+        profiler.start_file(path_to_file)
+
+    stage_start_time = time.perf_counter()
+
+    def finish_stage(stage: str):
+        nonlocal stage_start_time
+        stage_end_time = time.perf_counter()
+        timings[stage] = stage_end_time - stage_start_time
+        stage_start_time = stage_end_time
+        if profiler is not None:
+            profiler.record_stage(stage, timings[stage])
+
+    try:
+        scenario, planning_problem_set = CommonRoadFileReader(path_to_file).open(
+            lanelet_assignment=reader_lanelet_assignment
+            and DetectorDependency.OBSTACLE_LANELET_ASSIGNMENT in dependencies
+        )
+        finish_stage("load")
+
+        # Obstacles are assigned to lanelets once and shared by all detectors, see `get_obstacle_lanelet_occupancy`
+        if DetectorDependency.OBSTACLE_LANELET_ASSIGNMENT in dependencies:
+            get_obstacle_lanelet_occupancy(scenario)
+        finish_stage("lanelet_assignment")
+
+        detected_tags = set()
+
+        # Lanelet layout and traffic sign tags, detected once per road network
+        if map_detectors:
+            detected_tags.update(
+                map_tag_cache.get_map_tags(scenario, None if tags is None and groups is None else requested_tags)
+            )
+        finish_stage("map_tags")
 
         # Obstacles tags
-        detected_tags.add(RouteObstacleStatic(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteObstacleOtherDynamic(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteTrafficAhead(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteTrafficBehind(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteOncomingTraffic(route, scenario).get_tag_if_fulfilled())
-
-        # Traffic sign tags
-        detected_tags.add(RouteTrafficSignSpeedLimit(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteTrafficSignRightOfWay(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteTrafficSignNoRightOfWay(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteTrafficSignStopLine(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(RouteTrafficSignTrafficLight(route, scenario).get_tag_if_fulfilled())
-
-        # Ego vehicle goal tags
-        detected_tags.add(EgoVehicleGoalIntersectionTurnLeft(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(EgoVehicleGoalIntersectionTurnRight(route, scenario).get_tag_if_fulfilled())
-        detected_tags.add(EgoVehicleGoalIntersectionProceedStraight(route, scenario).get_tag_if_fulfilled())
-
-    return set(filter(lambda tag: tag is not None, detected_tags))
+        for detector in obstacle_detectors:
+            detected_tags.add(detector.detector_class(scenario).get_tag_if_fulfilled())
+        finish_stage("obstacle_tags")
+
+        # Route tags
+        routes = get_planned_routes(scenario, planning_problem_set, route_cache, route_mode) if route_detectors else []
+        finish_stage("route_planning")
+
+        # Route tags are evaluated for all routes at once, see `RouteTagEvaluator`
+        detected_tags.update(
+            RouteTagEvaluator(scenario, routes).find_tags(detector.detector_class for detector in route_detectors)
+        )
+        finish_stage("route_tags")
+    finally:
+        # Measurements after a failed file are not attributed to it
+        if profiler is not None:
+            profiler.finish_file()
+
+    return detected_tags.intersection(requested_tags)
@@ -0,0 +1,124 @@
+import json
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from commonroad_labeling.common.general import LabelingResult
+from commonroad_labeling.common.tag import TagEnum
+
+
+class JsonlResultWriter:
+    """
+    This class appends labeling results to a JSON Lines file, one JSON object per CommonRoad file. The file is flushed
+    periodically, after a number of results or after some time has passed, so that other processes can read the
+    results while the labeling is still running and at most a few results are lost if the labeling is interrupted.
+    """
+
+    def __init__(self, path: Path, flush_every: int = 100, flush_interval: float = 5.0):
+        """
+        Opens the given file for appending.
+        :param path: Path to the JSON Lines file. It is created if it does not exist.
+        :param flush_every: Number of results after which the file is flushed.
+        :param flush_interval: Time in seconds after which the file is flushed when the next result is written.
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._file = open(path, "a", encoding="utf-8")
+        self._unflushed_count = 0
+        self._last_flush_time = time.monotonic()
+
+    def __enter__(self) -> "JsonlResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, result: LabelingResult):
+        """
+        This method appends a single labeling result to the file.
+        :param result: Labeling result of a CommonRoad file.
+        """
+        self._file.write(json.dumps(result_to_json(result)) + "\n")
+        self._unflushed_count += 1
+        if self._unflushed_count >= self.flush_every or time.monotonic() - self._last_flush_time >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        This method writes all buffered results to the file.
+        """
+        self._file.flush()
+        self._unflushed_count = 0
+        self._last_flush_time = time.monotonic()
+
+    def close(self):
+        """
+        This method flushes and closes the file.
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def result_to_json(result: LabelingResult) -> dict:
+    """
+    This function converts a labeling result to a JSON-serializable dictionary.
+    :param result: Labeling result of a CommonRoad file.
+    :returns: A dictionary with the keys `path`, `tags`, `error` and `timings`. Tags are given as sorted tag values.
+    """
+    return {
+        "path": str(result.path),
+        "tags": sorted(tag.value for tag in result.tags) if result.tags is not None else None,
+        "error": result.error,
+        "timings": result.timings,
+    }
+
+
+def result_from_json(result_json: dict) -> LabelingResult:
+    """
+    This function converts a dictionary created by `result_to_json` back to a labeling result.
+    :param result_json: Dictionary with the keys `path`, `tags`, `error` and `timings`.
+    :returns: The corresponding `LabelingResult`.
+    """
+    return LabelingResult(
+        Path(result_json["path"]),
+        {TagEnum(value) for value in result_json["tags"]} if result_json["tags"] is not None else None,
+        result_json["error"],
+        result_json["timings"],
+    )
+
+
+def write_results_jsonl(
+    results: Iterable[LabelingResult], path: Path, flush_every: int = 100, flush_interval: float = 5.0
+) -> int:
+    """
+    This function appends labeling results to a JSON Lines file while they are produced, e.g. by
+    `common.general.iter_detected_tags`.
+    :param results: Labeling results that are written.
+    :param path: Path to the JSON Lines file.
+    :param flush_every: Number of results after which the file is flushed.
+    :param flush_interval: Time in seconds after which the file is flushed when the next result is written.
+    :returns: The number of written results.
+    """
+    count = 0
+    with JsonlResultWriter(path, flush_every, flush_interval) as writer:
+        for result in results:
+            writer.write(result)
+            count += 1
+
+    return count
+
+
+def read_results_jsonl(path: Path) -> Iterator[LabelingResult]:
+    """
+    This function reads labeling results from a JSON Lines file one by one. An incomplete last line, which can occur
+    while the file is still being written, is skipped.
+    :param path: Path to the JSON Lines file.
+    :returns: An iterator over the labeling results in the file.
+    """
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.endswith("\n"):
+                break
+            yield result_from_json(json.loads(line))
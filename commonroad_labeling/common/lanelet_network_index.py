@@ -0,0 +1,419 @@
+import copy
+import enum
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from enum import Enum
+from functools import cached_property
+
+import numpy as np
+from commonroad.scenario.intersection import Intersection
+from commonroad.scenario.lanelet import Lanelet, LaneletNetwork
+
+from commonroad_labeling.common.cache import cache_per_object
+from commonroad_labeling.common.lanelet_spatial_index import LaneletSpatialIndex
+
+
+@enum.unique
+class IntersectionManeuver(str, Enum):
+    """
+    This is an enum class that defines the maneuvers of a vehicle driving from an incoming of an intersection onto one
+    of its successor lanelets.
+    """
+
+    LEFT = "left"
+    RIGHT = "right"
+    STRAIGHT = "straight"
+
+
+class LaneletNetworkIndex:
+    """
+    This class holds lookup structures of a lanelet network that are shared by all detectors working on the same
+    scenario. All structures are built in a single pass over the lanelets, traffic signs and intersections of the
+    network, so that detectors can answer questions about neighbouring lanelets, traffic sign elements and
+    intersection membership in constant time instead of rescanning the whole network. The index assumes that the
+    lanelet network is not modified after the index has been built.
+    """
+
+    def __init__(self, lanelet_network: LaneletNetwork):
+        """
+        Initializes the lookup structures for the given lanelet network.
+        :param lanelet_network: Lanelet network that should be indexed.
+        """
+        self.lanelets: dict[int, Lanelet] = {}
+        self.successors: dict[int, frozenset[int]] = {}
+        self.predecessors: dict[int, frozenset[int]] = {}
+        self.adj_left: dict[int, tuple[int | None, bool | None]] = {}
+        self.adj_right: dict[int, tuple[int | None, bool | None]] = {}
+        for lanelet in lanelet_network.lanelets:
+            self.lanelets[lanelet.lanelet_id] = lanelet
+            self.successors[lanelet.lanelet_id] = frozenset(lanelet.successor or ())
+            self.predecessors[lanelet.lanelet_id] = frozenset(lanelet.predecessor or ())
+            self.adj_left[lanelet.lanelet_id] = (lanelet.adj_left, lanelet.adj_left_same_direction)
+            self.adj_right[lanelet.lanelet_id] = (lanelet.adj_right, lanelet.adj_right_same_direction)
+
+        self.traffic_sign_element_ids: dict[int, frozenset] = {
+            traffic_sign.traffic_sign_id: frozenset(
+                traffic_sign_element.traffic_sign_element_id
+                for traffic_sign_element in traffic_sign.traffic_sign_elements
+            )
+            for traffic_sign in lanelet_network.traffic_signs
+        }
+
+        self.intersection_by_lanelet_id: dict[int, Intersection] = {}
+        for intersection in lanelet_network.intersections:
+            for lanelet_id in get_intersection_lanelet_ids(intersection):
+                self.intersection_by_lanelet_id.setdefault(lanelet_id, intersection)
+        self._intersection_maneuvers_by_route: dict[tuple[int, ...], frozenset[IntersectionManeuver]] = {}
+
+    def rebind(self, lanelet_network: LaneletNetwork) -> "LaneletNetworkIndex":
+        """
+        This method creates a copy of the index for another lanelet network object with the same content, e.g. the
+        road network of another scenario cut from the same recording. Topological structures and already computed
+        cached properties are shared with this index, only references to lanelets and intersections are replaced.
+        :param lanelet_network: Lanelet network with the same fingerprint as the network of this index.
+        :returns: A `LaneletNetworkIndex` of the given lanelet network.
+        """
+        index = copy.copy(self)
+        index.lanelets = {lanelet.lanelet_id: lanelet for lanelet in lanelet_network.lanelets}
+        intersections = {intersection.intersection_id: intersection for intersection in lanelet_network.intersections}
+        index.intersection_by_lanelet_id = {
+            lanelet_id: intersections[intersection.intersection_id]
+            for lanelet_id, intersection in self.intersection_by_lanelet_id.items()
+        }
+        return index
+
+    def find_lanelet_by_id(self, lanelet_id: int | None) -> Lanelet | None:
+        """
+        This method returns the lanelet with the given ID.
+        :param lanelet_id: ID of the lanelet.
+        :returns: The lanelet if it is contained in the network, `None` otherwise.
+        """
+        return self.lanelets.get(lanelet_id)
+
+    def get_intersection_by_lanelet_id(self, lanelet_id: int) -> Intersection | None:
+        """
+        This method returns the first intersection of the network that contains the given lanelet ID either as an
+        incoming lanelet or as a successor of an incoming.
+        :param lanelet_id: ID of the lanelet.
+        :returns: An `Intersection` if a lanelet with the given ID is within it, `None` otherwise.
+        """
+        return self.intersection_by_lanelet_id.get(lanelet_id)
+
+    @cached_property
+    def intersection_lanelet_ids(self) -> frozenset[int]:
+        """
+        IDs of the lanelets that are contained in any intersection of the network, either as an incoming lanelet or as
+        a successor of an incoming.
+        :returns: A frozenset of lanelet IDs.
+        """
+        return frozenset(self.intersection_by_lanelet_id)
+
+    @cached_property
+    def intersection_maneuvers(self) -> dict[int, tuple[int, frozenset[IntersectionManeuver]]]:
+        """
+        Maneuvers performed by driving onto a successor lanelet of an incoming of an intersection. Every lanelet ID is
+        mapped to the ID of the intersection returned for it by `get_intersection_by_lanelet_id` and the maneuvers of
+        all incomings of this intersection that have the lanelet as a left, right or straight successor. Lanelets that
+        are no such successor are not contained in the mapping.
+        :returns: A dictionary mapping lanelet IDs to tuples of an intersection ID and a frozenset of maneuvers.
+        """
+        maneuvers_by_lanelet_id: dict[int, set[IntersectionManeuver]] = {}
+        for lanelet_id, intersection in self.intersection_by_lanelet_id.items():
+            for incoming in intersection.incomings:
+                for maneuver, successor_lanelet_ids in (
+                    (IntersectionManeuver.LEFT, incoming.successors_left),
+                    (IntersectionManeuver.RIGHT, incoming.successors_right),
+                    (IntersectionManeuver.STRAIGHT, incoming.successors_straight),
+                ):
+                    if successor_lanelet_ids is not None and lanelet_id in successor_lanelet_ids:
+                        maneuvers_by_lanelet_id.setdefault(lanelet_id, set()).add(maneuver)
+
+        return {
+            lanelet_id: (self.intersection_by_lanelet_id[lanelet_id].intersection_id, frozenset(maneuvers))
+            for lanelet_id, maneuvers in maneuvers_by_lanelet_id.items()
+        }
+
+    def get_route_intersection_maneuvers(self, lanelet_ids: Iterable[int]) -> frozenset[IntersectionManeuver]:
+        """
+        This method collects the intersection maneuvers of all lanelets of a route in a single pass over the route.
+        The result is kept for every sequence of lanelet IDs, so that detectors of different maneuvers evaluating the
+        same route share it.
+        :param lanelet_ids: Lanelet IDs of the route.
+        :returns: A frozenset of the maneuvers performed on any lanelet of the route.
+        """
+        lanelet_ids = tuple(lanelet_ids)
+        maneuvers = self._intersection_maneuvers_by_route.get(lanelet_ids)
+        if maneuvers is None:
+            maneuvers = frozenset(
+                maneuver
+                for lanelet_id in lanelet_ids
+                for maneuver in self.intersection_maneuvers.get(lanelet_id, (None, ()))[1]
+            )
+            self._intersection_maneuvers_by_route[lanelet_ids] = maneuvers
+        return maneuvers
+
+    @cached_property
+    def spatial_index(self) -> LaneletSpatialIndex:
+        """
+        Spatial index of the lanelet polygons, which matches positions to lanelets in batches.
+        :returns: A `LaneletSpatialIndex` of the lanelets of the network.
+        """
+        return LaneletSpatialIndex(self.lanelets.values())
+
+    @cached_property
+    def cyclic_lanelet_ids(self) -> frozenset[int]:
+        """
+        IDs of the lanelets that lie on a cycle of the successor graph, i.e. lanelets of strongly connected components
+        with more than one lanelet or lanelets that succeed themselves. Successor IDs that are not contained in the
+        network are ignored.
+        :returns: A frozenset of lanelet IDs.
+        """
+        cyclic_lanelet_ids = set()
+        for component in get_strongly_connected_components(self.successors):
+            if len(component) > 1 or any(lanelet_id in self.successors[lanelet_id] for lanelet_id in component):
+                cyclic_lanelet_ids.update(component)
+        return frozenset(cyclic_lanelet_ids)
+
+    @cached_property
+    def lanelet_ids_reaching_cycle(self) -> frozenset[int]:
+        """
+        IDs of the lanelets from which a cycle of the successor graph can be reached by following one or more
+        successors, which includes all lanelets on a cycle. It is computed with a single breadth-first search from the
+        cyclic lanelets against the direction of the successor relation.
+        :returns: A frozenset of lanelet IDs.
+        """
+        reversed_successors: dict[int, list[int]] = {lanelet_id: [] for lanelet_id in self.successors}
+        for lanelet_id, successor_lanelet_ids in self.successors.items():
+            for successor_lanelet_id in successor_lanelet_ids:
+                if successor_lanelet_id in reversed_successors:
+                    reversed_successors[successor_lanelet_id].append(lanelet_id)
+
+        reaching_lanelet_ids = set()
+        queue = list(self.cyclic_lanelet_ids)
+        while queue:
+            for predecessor_lanelet_id in reversed_successors[queue.pop()]:
+                if predecessor_lanelet_id not in reaching_lanelet_ids:
+                    reaching_lanelet_ids.add(predecessor_lanelet_id)
+                    queue.append(predecessor_lanelet_id)
+        return frozenset(reaching_lanelet_ids)
+
+    @cached_property
+    def lanelet_ids_reaching_opposite_direction(self) -> frozenset[int]:
+        """
+        IDs of the lanelets from which a lanelet with a neighbour in the opposite direction can be reached by following
+        left and right neighbours in the same direction, which includes all lanelets with such a neighbour themselves.
+        Neighbour relations are followed only in the direction in which they are stored, i.e. a lanelet that does not
+        reference a neighbour in the opposite direction itself is not affected by being referenced as one. The
+        lanelets are computed in a single pass over the strongly connected components of the lateral neighbour graph.
+        :returns: A frozenset of lanelet IDs.
+        """
+        same_direction_neighbours: dict[int, frozenset[int]] = {}
+        opposite_direction_lanelet_ids = set()
+        for lanelet_id in self.lanelets:
+            neighbour_lanelet_ids = set()
+            for adjacent_lanelet_id, same_direction in (self.adj_left[lanelet_id], self.adj_right[lanelet_id]):
+                if same_direction is False:
+                    opposite_direction_lanelet_ids.add(lanelet_id)
+                elif adjacent_lanelet_id is not None:
+                    neighbour_lanelet_ids.add(adjacent_lanelet_id)
+            same_direction_neighbours[lanelet_id] = frozenset(neighbour_lanelet_ids)
+
+        # Components are returned in reverse topological order, so that all reachable components are handled first
+        reaching_lanelet_ids = set()
+        for component in get_strongly_connected_components(same_direction_neighbours):
+            if not opposite_direction_lanelet_ids.isdisjoint(component) or any(
+                not reaching_lanelet_ids.isdisjoint(same_direction_neighbours[lanelet_id]) for lanelet_id in component
+            ):
+                reaching_lanelet_ids.update(component)
+        return frozenset(reaching_lanelet_ids)
+
+    def is_one_way(self, lanelet_id: int) -> bool:
+        """
+        This method checks whether a lanelet and all lanelets reachable by following its neighbours in the same
+        direction have no neighbour in the opposite direction.
+        :param lanelet_id: ID of the lanelet.
+        :returns: True if the lanelet is part of a one way road, False otherwise.
+        """
+        return lanelet_id not in self.lanelet_ids_reaching_opposite_direction
+
+
+def get_strongly_connected_components(graph: dict[int, frozenset[int]]) -> list[set[int]]:
+    """
+    This function computes the strongly connected components of a directed graph with an iterative version of
+    Tarjan's algorithm, so that its run time is linear in the number of nodes and edges and it is not restricted by
+    the recursion limit on long chains of nodes. Edges to nodes that are not keys of the graph are ignored. Components
+    are returned in reverse topological order, i.e. every component is preceded by all components reachable from it.
+    :param graph: Directed graph given as a mapping from every node to the set of its successors.
+    :returns: A list of strongly connected components, each given as a set of nodes.
+    """
+    index_by_node: dict[int, int] = {}
+    low_link_by_node: dict[int, int] = {}
+    stack: list[int] = []
+    on_stack: set[int] = set()
+    components: list[set[int]] = []
+    call_stack: list[tuple[int, Iterator[int]]] = []
+
+    def visit(node: int):
+        index_by_node[node] = low_link_by_node[node] = len(index_by_node)
+        stack.append(node)
+        on_stack.add(node)
+        call_stack.append((node, iter(graph[node])))
+
+    for root in graph:
+        if root in index_by_node:
+            continue
+
+        visit(root)
+        while call_stack:
+            node, successors = call_stack[-1]
+            for successor in successors:
+                if successor not in graph:
+                    continue
+                if successor not in index_by_node:
+                    visit(successor)
+                    break
+                if successor in on_stack:
+                    low_link_by_node[node] = min(low_link_by_node[node], index_by_node[successor])
+            else:
+                call_stack.pop()
+                if call_stack:
+                    parent = call_stack[-1][0]
+                    low_link_by_node[parent] = min(low_link_by_node[parent], low_link_by_node[node])
+                if low_link_by_node[node] == index_by_node[node]:
+                    component = set()
+                    while True:
+                        component_node = stack.pop()
+                        on_stack.remove(component_node)
+                        component.add(component_node)
+                        if component_node == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def get_intersection_lanelet_ids(intersection: Intersection) -> set[int]:
+    """
+    This function calculates the lanelet IDs that are consisted in a certain intersection.
+    :param intersection: Intersection used to extract lanelet IDs.
+    :returns: A set of lanelet IDs in a given intersection.
+    """
+    lanelet_ids = set()
+    for intersection_incoming in intersection.incomings:
+        lanelet_ids.update(intersection_incoming.incoming_lanelets)
+        if intersection_incoming.successors_left is not None:
+            lanelet_ids.update(intersection_incoming.successors_left)
+        if intersection_incoming.successors_right is not None:
+            lanelet_ids.update(intersection_incoming.successors_right)
+        if intersection_incoming.successors_straight is not None:
+            lanelet_ids.update(intersection_incoming.successors_straight)
+
+    return lanelet_ids
+
+
+@cache_per_object
+def get_lanelet_network_fingerprint(lanelet_network: LaneletNetwork) -> str:
+    """
+    This function computes a content fingerprint of a lanelet network. The fingerprint covers the geometry and topology
+    of all lanelets as well as traffic signs, traffic lights and intersections, but no obstacles, so that scenarios
+    cut from the same recording share the fingerprint of their road network. It is computed once per network object.
+    :param lanelet_network: Lanelet network for which the fingerprint is computed.
+    :returns: A hexadecimal SHA-256 digest.
+    """
+    fingerprint = hashlib.sha256()
+
+    def update(*values):
+        for value in values:
+            if isinstance(value, np.ndarray):
+                fingerprint.update(np.ascontiguousarray(value, dtype=np.float64).tobytes())
+            elif isinstance(value, (set, frozenset)):
+                fingerprint.update(repr(sorted(value, key=repr)).encode())
+            else:
+                fingerprint.update(repr(value).encode())
+            fingerprint.update(b";")
+
+    for lanelet in sorted(lanelet_network.lanelets, key=lambda lanelet: lanelet.lanelet_id):
+        update(
+            lanelet.lanelet_id,
+            lanelet.left_vertices,
+            lanelet.center_vertices,
+            lanelet.right_vertices,
+            lanelet.predecessor,
+            lanelet.successor,
+            lanelet.adj_left,
+            lanelet.adj_left_same_direction,
+            lanelet.adj_right,
+            lanelet.adj_right_same_direction,
+            lanelet.lanelet_type,
+            lanelet.user_one_way,
+            lanelet.user_bidirectional,
+            lanelet.traffic_signs,
+            lanelet.traffic_lights,
+        )
+        if lanelet.stop_line is not None:
+            update(
+                lanelet.stop_line.start,
+                lanelet.stop_line.end,
+                lanelet.stop_line.line_marking,
+                lanelet.stop_line.traffic_sign_ref,
+                lanelet.stop_line.traffic_light_ref,
+            )
+
+    for traffic_sign in sorted(lanelet_network.traffic_signs, key=lambda traffic_sign: traffic_sign.traffic_sign_id):
+        update(traffic_sign.traffic_sign_id, traffic_sign.position, traffic_sign.virtual)
+        for traffic_sign_element in traffic_sign.traffic_sign_elements:
+            update(traffic_sign_element.traffic_sign_element_id, traffic_sign_element.additional_values)
+
+    for traffic_light in sorted(
+        lanelet_network.traffic_lights, key=lambda traffic_light: traffic_light.traffic_light_id
+    ):
+        update(traffic_light.traffic_light_id, traffic_light.position, traffic_light.direction, traffic_light.active)
+
+    for intersection in sorted(lanelet_network.intersections, key=lambda intersection: intersection.intersection_id):
+        update(intersection.intersection_id, intersection.crossings)
+        for incoming in intersection.incomings:
+            update(
+                incoming.incoming_id,
+                incoming.incoming_lanelets,
+                incoming.successors_right,
+                incoming.successors_straight,
+                incoming.successors_left,
+                incoming.left_of,
+            )
+
+    return fingerprint.hexdigest()
+
+
+# Most recently used index per lanelet network fingerprint, used to share indexes between identical road networks
+_index_by_fingerprint: OrderedDict[str, LaneletNetworkIndex] = OrderedDict()
+MAX_SHARED_INDEXES = 16
+
+
+@cache_per_object
+def get_lanelet_network_index(lanelet_network: LaneletNetwork) -> LaneletNetworkIndex:
+    """
+    This function returns the index of a lanelet network. The index is built on the first call and shared by all
+    detectors working on the same lanelet network object. If an index of another network object with the same
+    fingerprint has been built before, it is rebound to the given network instead, so that derived structures are
+    computed only once per road network.
+    :param lanelet_network: Lanelet network for which the index is returned.
+    :returns: The `LaneletNetworkIndex` of the lanelet network.
+    """
+    fingerprint = get_lanelet_network_fingerprint(lanelet_network)
+    shared_index = _index_by_fingerprint.pop(fingerprint, None)
+    index = shared_index.rebind(lanelet_network) if shared_index is not None else LaneletNetworkIndex(lanelet_network)
+
+    _index_by_fingerprint[fingerprint] = index
+    while len(_index_by_fingerprint) > MAX_SHARED_INDEXES:
+        _index_by_fingerprint.popitem(last=False)
+    return index
+
+
+def clear_lanelet_network_indexes():
+    """
+    This function removes all indexes built by `get_lanelet_network_index`, including those shared between identical
+    road networks, so that the next call builds its index from scratch, e.g. to measure cold runtimes in benchmarks.
+    """
+    _index_by_fingerprint.clear()
+    get_lanelet_network_index.cache_clear()
@@ -0,0 +1,88 @@
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import shapely
+from commonroad.scenario.lanelet import Lanelet
+
+# Distance within which a position is matched to a lanelet, the same tolerance as `find_lanelet_by_position`
+POSITION_TOLERANCE = 1.0e-15
+# Margin around lanelets within which positions are checked with the exact distance test instead of a point-in-polygon
+# test, which is much larger than the tolerance to be robust against rounding errors
+BOUNDARY_MARGIN = 1.0e-3
+
+
+class LaneletSpatialIndex:
+    """
+    This class is a spatial index over the polygons of the lanelets of a lanelet network, which matches many positions
+    to lanelets at once. It is a replacement for `LaneletNetwork.find_lanelet_by_position`, which creates a point
+    object for every position in Python and evaluates an exact distance test for every candidate lanelet. Here, all
+    positions are queried at once against an STR-tree of the bounding boxes of the lanelet polygons, so that finding
+    candidate lanelets is logarithmic in the number of lanelets, and only the candidates are checked with vectorized
+    point-in-polygon tests on prepared polygons. Positions close to the boundary of a candidate lanelet are
+    additionally checked with the distance test and tolerance of `LaneletNetwork.find_lanelet_by_position`, so that
+    results are identical, including the order of the lanelets of each position.
+    """
+
+    def __init__(self, lanelets: Iterable[Lanelet]):
+        """
+        Initializes the index with the polygons of the given lanelets.
+        :param lanelets: Lanelets of a lanelet network in the order of the network. Like in the lanelet network,
+        lanelets whose polygon is not a simple polygon are omitted.
+        """
+        lanelet_ids = []
+        polygons = []
+        for lanelet in lanelets:
+            polygon = lanelet.polygon.shapely_object
+            if isinstance(polygon, shapely.Polygon):
+                lanelet_ids.append(lanelet.lanelet_id)
+                polygons.append(polygon)
+        self.lanelet_ids = np.array(lanelet_ids, dtype=np.int64)
+        self._polygons = np.array(polygons, dtype=object)
+        self._tree = shapely.STRtree(self._polygons)
+        # The tree is built from the same polygons in the same order as the tree of the lanelet network, so that
+        # candidates are returned in the same order
+        self._buffered_polygons = shapely.buffer(self._polygons, BOUNDARY_MARGIN)
+        shapely.prepare(self._polygons)
+        shapely.prepare(self._buffered_polygons)
+
+    def query(self, points: np.ndarray | Sequence[np.ndarray]) -> list[set[int]]:
+        """
+        This method matches positions to the lanelets they are located on.
+        :param points: Array of shape `(n, 2)` or sequence of positions.
+        :returns: A list with the set of IDs of the lanelets containing each position, which is empty if the position
+        is not located on any lanelet.
+        """
+        return [set(lanelet_ids) for lanelet_ids in self.query_lanelet_id_lists(points)]
+
+    def query_lanelet_id_lists(self, points: np.ndarray | Sequence[np.ndarray]) -> list[list[int]]:
+        """
+        This method matches positions to the lanelets they are located on, in the format of
+        `LaneletNetwork.find_lanelet_by_position`.
+        :param points: Array of shape `(n, 2)` or sequence of positions.
+        :returns: A list with the list of IDs of the lanelets containing each position, which is empty if the
+        position is not located on any lanelet.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        lanelet_id_lists = [[] for _ in range(len(points))]
+        if len(points) == 0:
+            return lanelet_id_lists
+
+        # Candidate pairs of points and lanelets whose bounding box contains the point
+        point_indices, polygon_indices = self._tree.query(shapely.points(points))
+        candidate_polygons = self._polygons[polygon_indices]
+        candidate_x, candidate_y = points[point_indices, 0], points[point_indices, 1]
+        is_contained = shapely.contains_xy(candidate_polygons, candidate_x, candidate_y)
+        # Only points close to the boundary of a lanelet need the exact, but expensive, distance test
+        is_close = ~is_contained & shapely.intersects_xy(
+            self._buffered_polygons[polygon_indices], candidate_x, candidate_y
+        )
+        if is_close.any():
+            is_contained[is_close] = shapely.dwithin(
+                candidate_polygons[is_close], shapely.points(points[point_indices[is_close]]), POSITION_TOLERANCE
+            )
+
+        for point_index, lanelet_id in zip(
+            point_indices[is_contained].tolist(), self.lanelet_ids[polygon_indices[is_contained]].tolist()
+        ):
+            lanelet_id_lists[point_index].append(lanelet_id)
+        return lanelet_id_lists
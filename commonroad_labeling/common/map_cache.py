@@ -0,0 +1,145 @@
+import json
+from collections import OrderedDict
+from pathlib import Path
+
+from commonroad.scenario.scenario import Scenario
+
+from commonroad_labeling.common.cache import write_file_atomically
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_fingerprint
+from commonroad_labeling.common.result_cache import get_detector_set_version
+from commonroad_labeling.common.tag import ScenarioTag, TagEnum
+from commonroad_labeling.road_configuration.scenario.scenario_lanelet_layout import LaneletLayoutIntersection
+from commonroad_labeling.road_configuration.scenario.scenario_lanelet_scan import (
+    LANELET_SCANNED_TAG_CLASSES,
+    LaneletTagScanner,
+)
+from commonroad_labeling.road_configuration.scenario.scenario_traffic_sign import (
+    TrafficSignNoRightOfWay,
+    TrafficSignRightOfWay,
+    TrafficSignSpeedLimit,
+    TrafficSignTrafficLight,
+)
+
+# Number of road networks whose map tags are kept in memory by default
+MAX_CACHED_MAP_TAGS = 1024
+
+# Scenario detectors that depend only on the lanelet network and are not covered by the `LaneletTagScanner`
+MAP_SCENARIO_TAG_CLASSES: list[type[ScenarioTag]] = [
+    LaneletLayoutIntersection,
+    TrafficSignSpeedLimit,
+    TrafficSignRightOfWay,
+    TrafficSignNoRightOfWay,
+    TrafficSignTrafficLight,
+]
+
+
+def find_map_tags(scenario: Scenario, tags: set[TagEnum] | None = None) -> set[TagEnum]:
+    """
+    This function performs all checks for scenario tags that depend only on the lanelet network of a scenario, i.e.
+    lanelet layout and traffic sign tags.
+    :param scenario: Scenario for which the map tags are detected.
+    :param tags: Optional set of requested tags. Only detectors of requested tags are executed if it is given.
+    :returns: A set of detected map tags.
+    """
+    scanned_tags = [scenario_tag_class(scenario) for scenario_tag_class in LANELET_SCANNED_TAG_CLASSES]
+    scenario_tags = [scenario_tag_class(scenario) for scenario_tag_class in MAP_SCENARIO_TAG_CLASSES]
+    if tags is not None:
+        scanned_tags = [scenario_tag for scenario_tag in scanned_tags if scenario_tag.tag in tags]
+        scenario_tags = [scenario_tag for scenario_tag in scenario_tags if scenario_tag.tag in tags]
+
+    detected_tags = LaneletTagScanner(scenario, scanned_tags).find_tags()
+    for scenario_tag in scenario_tags:
+        detected_tags.add(scenario_tag.get_tag_if_fulfilled())
+
+    detected_tags.discard(None)
+    return detected_tags
+
+
+class MapTagCache:
+    """
+    This class caches the map tags of scenarios by the fingerprint of their lanelet network. Many CommonRoad files,
+    e.g. the MONA and inD recordings, are short time windows cut from the same recording and therefore share an
+    identical road network, so that map tags only need to be detected once per road network. Results are kept in
+    memory and, if a cache directory is given, additionally stored as one JSON file per fingerprint, so that they can
+    be shared between processes and runs. Only the most recently used road networks are kept in memory. Like in the
+    `ResultCache`, files on disk are stored in a subdirectory per detector set version, so that map tags of outdated
+    detectors are never used.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        detector_set_version: str | None = None,
+        max_size: int = MAX_CACHED_MAP_TAGS,
+    ):
+        """
+        Initializes an empty cache.
+        :param cache_dir: Optional directory in which results are stored on disk. It is created if it does not exist.
+        :param detector_set_version: Version of the set of detectors. Defaults to `get_detector_set_version()`. It is
+        only used if a cache directory is given.
+        :param max_size: Maximum number of road networks whose map tags are kept in memory. The least recently used
+        road networks are removed first.
+        """
+        self.cache_dir = cache_dir
+        self.version_dir = None
+        self.max_size = max_size
+        self._tags_by_fingerprint: OrderedDict[str, frozenset[TagEnum]] = OrderedDict()
+        if cache_dir is not None:
+            if detector_set_version is None:
+                detector_set_version = get_detector_set_version()
+            self.version_dir = cache_dir.joinpath(detector_set_version[:32])
+            self.version_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_map_tags(self, scenario: Scenario, tags: set[TagEnum] | None = None) -> set[TagEnum]:
+        """
+        This method returns the map tags of a scenario, detecting them only if no scenario with the same road network
+        has been processed before.
+        :param scenario: Scenario for which the map tags are returned.
+        :param tags: Optional set of requested tags. If the road network has not been processed before, only the
+        detectors of the requested tags are executed and the incomplete result is not cached.
+        :returns: A set of detected map tags, restricted to the requested tags if they are given.
+        """
+        fingerprint = get_lanelet_network_fingerprint(scenario.lanelet_network)
+        cached_tags = self._tags_by_fingerprint.pop(fingerprint, None)
+        if cached_tags is None:
+            cached_tags = self._load(fingerprint)
+        if cached_tags is None and tags is not None:
+            return find_map_tags(scenario, tags)
+        if cached_tags is None:
+            cached_tags = frozenset(find_map_tags(scenario))
+            self._store(fingerprint, cached_tags)
+        self._tags_by_fingerprint[fingerprint] = cached_tags
+        while len(self._tags_by_fingerprint) > self.max_size:
+            self._tags_by_fingerprint.popitem(last=False)
+
+        return set(cached_tags if tags is None else cached_tags & tags)
+
+    def clear(self):
+        """
+        This method removes all results from memory. Files in the cache directory are kept.
+        """
+        self._tags_by_fingerprint.clear()
+
+    def _get_cache_file(self, fingerprint: str) -> Path:
+        return self.version_dir.joinpath(fingerprint + ".json")
+
+    def _load(self, fingerprint: str) -> frozenset[TagEnum] | None:
+        if self.version_dir is None:
+            return None
+        try:
+            with open(self._get_cache_file(fingerprint)) as cache_file:
+                return frozenset(TagEnum(value) for value in json.load(cache_file)["tags"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store(self, fingerprint: str, tags: frozenset[TagEnum]):
+        if self.version_dir is None:
+            return
+        write_file_atomically(
+            self._get_cache_file(fingerprint),
+            lambda cache_file: json.dump({"tags": sorted(tag.value for tag in tags)}, cache_file),
+        )
+
+
+# Cache used by `find_scenario_tags` if no other cache is provided
+default_map_tag_cache = MapTagCache()
@@ -0,0 +1,300 @@
+import csv
+import functools
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from commonroad.scenario.lanelet import LaneletNetwork
+
+from commonroad_labeling.common.lanelet_network_index import LaneletNetworkIndex
+from commonroad_labeling.common.lanelet_spatial_index import LaneletSpatialIndex
+from commonroad_labeling.common.route_evaluation import RouteTagEvaluator
+from commonroad_labeling.common.tag import Tag
+from commonroad_labeling.road_configuration.scenario.scenario_lanelet_scan import LaneletTagScanner
+
+# Columns of the CSV report written by `Profiler.save_csv`
+CSV_COLUMNS = ["path", "kind", "name", "calls", "seconds", "find_lanelet_by_id", "find_lanelet_by_position"]
+
+
+class ProfileEntry:
+    """
+    Measurements of a detector or labeling stage: the number of calls, the wall time and the number of lanelets looked
+    up by their ID or by a position during these calls.
+    """
+
+    __slots__ = ("calls", "seconds", "find_lanelet_by_id", "find_lanelet_by_position")
+
+    def __init__(
+        self, calls: int = 0, seconds: float = 0.0, find_lanelet_by_id: int = 0, find_lanelet_by_position: int = 0
+    ):
+        """
+        Initializes the entry with the given measurements.
+        :param calls: Number of calls.
+        :param seconds: Wall time in seconds spent in all calls.
+        :param find_lanelet_by_id: Number of lookups of lanelets by their ID, both in a `LaneletNetwork` and in a
+        `LaneletNetworkIndex`.
+        :param find_lanelet_by_position: Number of positions matched to lanelets, both with
+        `LaneletNetwork.find_lanelet_by_position` and with a `LaneletSpatialIndex`.
+        """
+        self.calls = calls
+        self.seconds = seconds
+        self.find_lanelet_by_id = find_lanelet_by_id
+        self.find_lanelet_by_position = find_lanelet_by_position
+
+    def add(self, other: "ProfileEntry"):
+        """
+        This method adds the measurements of another entry to this entry.
+        :param other: Entry whose measurements are added.
+        """
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.find_lanelet_by_id += other.find_lanelet_by_id
+        self.find_lanelet_by_position += other.find_lanelet_by_position
+
+    def to_dict(self) -> dict[str, int | float]:
+        """
+        This method converts the entry to a dictionary, e.g. for a JSON report.
+        :returns: A dictionary with the measurements of the entry.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ProfileEntry) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"ProfileEntry({', '.join(f'{name}={value}' for name, value in self.to_dict().items())})"
+
+
+class FileProfile:
+    """
+    Measurements of the labeling stages and detectors of a single CommonRoad file.
+    """
+
+    def __init__(self, path: Path | None):
+        """
+        Initializes an empty profile.
+        :param path: Path to the CommonRoad file, `None` for measurements taken outside of the labeling of a file.
+        """
+        self.path = path
+        self.stages: dict[str, ProfileEntry] = {}
+        self.detectors: dict[str, ProfileEntry] = {}
+
+    def to_dict(self) -> dict:
+        """
+        This method converts the profile to a dictionary, e.g. for a JSON report.
+        :returns: A dictionary with the path and the measurements of all stages and detectors.
+        """
+        return {
+            "path": None if self.path is None else str(self.path),
+            "stages": {name: entry.to_dict() for name, entry in self.stages.items()},
+            "detectors": {name: entry.to_dict() for name, entry in self.detectors.items()},
+        }
+
+
+class Profiler:
+    """
+    This class measures where time is spent while labeling CommonRoad files. While a profiler is enabled, the stages of
+    `common.general.find_scenario_tags`, e.g. loading the file and planning routes, and every evaluation of a detector
+    are recorded per file, i.e. calls of `Tag.get_tag_if_fulfilled`, of the `LaneletTagScanner` and of route
+    detectors evaluated by the `RouteTagEvaluator`. Lookups of lanelets by ID or position are attributed to the
+    innermost detector in which they occur or to the stage in which they occur outside of detectors. Detectors and
+    lookup methods are instrumented by wrapping them only while a profiler is enabled, so that profiling adds no
+    overhead if it is disabled. If files are labeled with several workers, e.g. by
+    `common.general.get_detected_tags_by_file`, every worker process profiles its files with a profiler of its own,
+    which is merged into the enabled profiler with `merge`.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty profiler, which has to be enabled with `enable` or by using it as a context manager.
+        """
+        self.files: list[FileProfile] = []
+        self._current_file: FileProfile | None = None
+        self._entry_stack: list[ProfileEntry] = []
+        self._unattributed_entry = ProfileEntry()
+        self._original_methods: list[tuple[type, str, Callable]] = []
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    def enable(self):
+        """
+        This method enables the profiler by instrumenting detectors and lookup methods.
+        :raises RuntimeError: If another profiler is enabled.
+        """
+        global _active_profiler
+        if _active_profiler is not None:
+            raise RuntimeError("Another profiler is already enabled.")
+        _active_profiler = self
+
+        # Detector names and lookup counts are determined from the arguments of the wrapped methods, hence the
+        # parameters of the functions match the parameters of the methods, which may also be passed as keywords
+        self._wrap_method(Tag, "get_tag_if_fulfilled", lambda tag: type(tag).__name__)
+        self._wrap_method(RouteTagEvaluator, "_find_route_tags", lambda evaluator, detector: type(detector).__name__)
+        self._wrap_method(LaneletTagScanner, "find_tags", lambda scanner: LaneletTagScanner.__name__)
+        self._wrap_counter(LaneletNetwork, "find_lanelet_by_id", lambda lanelet_network, lanelet_id: 1, by_id=True)
+        self._wrap_counter(LaneletNetworkIndex, "find_lanelet_by_id", lambda index, lanelet_id: 1, by_id=True)
+        self._wrap_counter(
+            LaneletNetwork, "find_lanelet_by_position", lambda lanelet_network, point_list: len(point_list)
+        )
+        self._wrap_counter(LaneletSpatialIndex, "query_lanelet_id_lists", lambda spatial_index, points: len(points))
+
+    def disable(self):
+        """
+        This method disables the profiler and restores all instrumented methods.
+        """
+        global _active_profiler
+        for cls, name, method in reversed(self._original_methods):
+            setattr(cls, name, method)
+        self._original_methods.clear()
+        if _active_profiler is self:
+            _active_profiler = None
+
+    def start_file(self, path: Path):
+        """
+        This method starts the profile of a CommonRoad file, to which all following measurements are attributed.
+        :param path: Path to the CommonRoad file.
+        """
+        self._current_file = FileProfile(path)
+        self.files.append(self._current_file)
+        self._unattributed_entry = ProfileEntry()
+
+    def record_stage(self, stage: str, seconds: float):
+        """
+        This method records the wall time of a labeling stage of the current file. Lookups of lanelets since the
+        previous stage that did not occur within a detector are attributed to the stage.
+        :param stage: Name of the stage, e.g. `load` or `route_planning`.
+        :param seconds: Wall time in seconds.
+        """
+        entry = self._get_file_profile().stages.setdefault(stage, ProfileEntry())
+        self._unattributed_entry.calls = 1
+        self._unattributed_entry.seconds = seconds
+        entry.add(self._unattributed_entry)
+        self._unattributed_entry = ProfileEntry()
+
+    def finish_file(self):
+        """
+        This method finishes the profile of the current file.
+        """
+        self._current_file = None
+        self._unattributed_entry = ProfileEntry()
+
+    def get_totals(self) -> FileProfile:
+        """
+        This method aggregates the measurements of all files.
+        :returns: A `FileProfile` without path, whose entries are the sums of the entries of all files.
+        """
+        totals = FileProfile(None)
+        for file_profile in self.files:
+            for total_entries, entries in [
+                (totals.stages, file_profile.stages),
+                (totals.detectors, file_profile.detectors),
+            ]:
+                for name, entry in entries.items():
+                    total_entries.setdefault(name, ProfileEntry()).add(entry)
+        return totals
+
+    def merge(self, other: "Profiler"):
+        """
+        This method adds the file profiles of another profiler, e.g. of another process, to this profiler.
+        :param other: Profiler whose file profiles are added.
+        """
+        self.files.extend(other.files)
+
+    def get_report(self) -> dict:
+        """
+        This method creates a report of all measurements.
+        :returns: A dictionary with the aggregated measurements as `totals` and the measurements of every file as
+        `files`.
+        """
+        return {
+            "totals": self.get_totals().to_dict(),
+            "files": [file_profile.to_dict() for file_profile in self.files],
+        }
+
+    def save_json(self, path: Path):
+        """
+        This method writes the report returned by `get_report` to a JSON file.
+        :param path: Path to the JSON file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.get_report(), file, indent=2)
+
+    def save_csv(self, path: Path):
+        """
+        This method writes all measurements to a CSV file with the columns `CSV_COLUMNS`, one row per stage or
+        detector of every file. Aggregated measurements of all files have an empty path.
+        :param path: Path to the CSV file.
+        """
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(CSV_COLUMNS)
+            for file_profile in [self.get_totals(), *self.files]:
+                for kind, entries in [("stage", file_profile.stages), ("detector", file_profile.detectors)]:
+                    for name, entry in entries.items():
+                        writer.writerow(
+                            [
+                                "" if file_profile.path is None else str(file_profile.path),
+                                kind,
+                                name,
+                                entry.calls,
+                                entry.seconds,
+                                entry.find_lanelet_by_id,
+                                entry.find_lanelet_by_position,
+                            ]
+                        )
+
+    def _get_file_profile(self) -> FileProfile:
+        if self._current_file is None:
+            self.start_file(None)
+        return self._current_file
+
+    def _wrap_method(self, cls: type, name: str, get_detector_name: Callable[..., str]):
+        method = getattr(cls, name)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            entry = ProfileEntry(calls=1)
+            self._entry_stack.append(entry)
+            start_time = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                entry.seconds = time.perf_counter() - start_time
+                self._entry_stack.pop()
+                detector_entries = self._get_file_profile().detectors
+                detector_entries.setdefault(get_detector_name(*args, **kwargs), ProfileEntry()).add(entry)
+
+        self._original_methods.append((cls, name, method))
+        setattr(cls, name, wrapper)
+
+    def _wrap_counter(self, cls: type, name: str, get_count: Callable[..., int], by_id: bool = False):
+        method = getattr(cls, name)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            entry = self._entry_stack[-1] if self._entry_stack else self._unattributed_entry
+            if by_id:
+                entry.find_lanelet_by_id += get_count(*args, **kwargs)
+            else:
+                entry.find_lanelet_by_position += get_count(*args, **kwargs)
+            return method(*args, **kwargs)
+
+        self._original_methods.append((cls, name, method))
+        setattr(cls, name, wrapper)
+
+
+_active_profiler: Profiler | None = None
+
+
+def get_active_profiler() -> Profiler | None:
+    """
+    This function returns the enabled profiler.
+    :returns: The enabled `Profiler`, `None` if profiling is disabled.
+    """
+    return _active_profiler
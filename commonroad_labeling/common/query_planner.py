@@ -0,0 +1,333 @@
+import json
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from commonroad.common.file_reader import CommonRoadFileReader
+from commonroad.scenario.scenario import Scenario
+
+from commonroad_labeling.common.detector_registry import Detector, DetectorDependency, get_detectors
+from commonroad_labeling.common.general import find_scenario_files, get_planned_routes
+from commonroad_labeling.common.profiling import Profiler
+from commonroad_labeling.common.route import RouteMode
+from commonroad_labeling.common.route_evaluation import RouteTagEvaluator
+from commonroad_labeling.common.tag import TagEnum
+from commonroad_labeling.common.tag_query import TagQuery, TagQueryNot, TagQueryTags, parse_tag_query
+from commonroad_labeling.road_configuration.scenario.scenario_obstacle import get_obstacle_lanelet_occupancy
+
+# Default time in seconds needed to provide a dependency, measured on the scenarios of the repository. `MAP` only
+# parses the lanelet network of a file, `OBSTACLES` parses the complete file, which is also required for planning
+# routes, and `ROUTES` plans the lanelet sequences of all routes.
+DEFAULT_DEPENDENCY_COSTS: dict[DetectorDependency, float] = {
+    DetectorDependency.MAP: 0.025,
+    DetectorDependency.OBSTACLES: 0.09,
+    DetectorDependency.OBSTACLE_LANELET_ASSIGNMENT: 0.005,
+    DetectorDependency.ROUTES: 0.002,
+}
+
+# Default time in seconds needed to execute a detector once all its dependencies are provided
+DEFAULT_DETECTOR_COST = 1e-5
+
+# Dependencies provided by the stages of `common.general.find_scenario_tags` recorded by a `Profiler`. The `load` stage
+# parses the complete file, parsing only the lanelet network for `MAP` is not a stage of its own.
+PROFILER_STAGE_DEPENDENCIES: dict[str, DetectorDependency] = {
+    "load": DetectorDependency.OBSTACLES,
+    "lanelet_assignment": DetectorDependency.OBSTACLE_LANELET_ASSIGNMENT,
+    "route_planning": DetectorDependency.ROUTES,
+}
+
+
+class DetectorCostModel:
+    """
+    This class estimates the time needed to execute a detector on a CommonRoad file, which consists of the time needed
+    to provide the dependencies of the detector that have not been provided for the file yet and the time of the
+    detector itself. Estimates are the mean of all observed times, e.g. recorded by a `QueryPlanner` while labeling
+    files or by a `Profiler` while labeling files completely, see `from_profiler`, and fall back to static defaults
+    for dependencies and detectors that have not been observed yet. Cost models can be stored as JSON files, so that
+    they can be reused by later runs.
+    """
+
+    def __init__(self):
+        """
+        Initializes a cost model without observations.
+        """
+        self._dependency_observations: dict[DetectorDependency, tuple[float, int]] = {}
+        self._detector_observations: dict[str, tuple[float, int]] = {}
+
+    def get_dependency_cost(self, dependency: DetectorDependency) -> float:
+        """
+        This method estimates the time needed to provide a dependency.
+        :param dependency: Dependency of detectors.
+        :returns: The estimated time in seconds.
+        """
+        if dependency in self._dependency_observations:
+            total_time, count = self._dependency_observations[dependency]
+            return total_time / count
+        return DEFAULT_DEPENDENCY_COSTS[dependency]
+
+    def get_detector_cost(self, detector: Detector, provided_dependencies: Iterable[DetectorDependency] = ()) -> float:
+        """
+        This method estimates the time needed to execute a detector.
+        :param detector: Detector of the registry.
+        :param provided_dependencies: Dependencies that have already been provided for the file.
+        :returns: The estimated time in seconds, including the time needed to provide missing dependencies.
+        """
+        name = detector.detector_class.__name__
+        if name in self._detector_observations:
+            total_time, count = self._detector_observations[name]
+            cost = total_time / count
+        else:
+            cost = DEFAULT_DETECTOR_COST
+        return cost + sum(
+            self.get_dependency_cost(dependency)
+            for dependency in get_missing_dependencies(detector.dependencies, provided_dependencies)
+        )
+
+    def observe_dependency(self, dependency: DetectorDependency, seconds: float):
+        """
+        This method records the time needed to provide a dependency for a file.
+        :param dependency: Dependency that was provided.
+        :param seconds: Measured time in seconds.
+        """
+        total_time, count = self._dependency_observations.get(dependency, (0.0, 0))
+        self._dependency_observations[dependency] = (total_time + seconds, count + 1)
+
+    def observe_detector(self, detector: Detector, seconds: float):
+        """
+        This method records the time needed to execute a detector on a file.
+        :param detector: Detector that was executed.
+        :param seconds: Measured time in seconds.
+        """
+        name = detector.detector_class.__name__
+        total_time, count = self._detector_observations.get(name, (0.0, 0))
+        self._detector_observations[name] = (total_time + seconds, count + 1)
+
+    def save(self, path: Path):
+        """
+        This method stores the observations of the cost model in a JSON file.
+        :param path: Path to the JSON file.
+        """
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "dependencies": {
+                        dependency.value: list(observation)
+                        for dependency, observation in self._dependency_observations.items()
+                    },
+                    "detectors": {name: list(observation) for name, observation in self._detector_observations.items()},
+                },
+                file,
+                indent=2,
+            )
+
+    @classmethod
+    def from_profiler(cls, profiler: Profiler) -> "DetectorCostModel":
+        """
+        This method creates a cost model from the measurements of a profiler. The times of the stages of
+        `PROFILER_STAGE_DEPENDENCIES` are observed as costs of the dependencies they provide and the times of the
+        profiled detectors as costs of the detectors.
+        :param profiler: Profiler that recorded the labeling of files.
+        :returns: A `DetectorCostModel` with the measurements of all files of the profiler.
+        """
+        totals = profiler.get_totals()
+        cost_model = cls()
+        for stage, dependency in PROFILER_STAGE_DEPENDENCIES.items():
+            entry = totals.stages.get(stage)
+            if entry is not None and entry.calls > 0:
+                cost_model._dependency_observations[dependency] = (entry.seconds, entry.calls)
+        for name, entry in totals.detectors.items():
+            if entry.calls > 0:
+                cost_model._detector_observations[name] = (entry.seconds, entry.calls)
+        return cost_model
+
+    @classmethod
+    def load(cls, path: Path) -> "DetectorCostModel":
+        """
+        This method creates a cost model from observations stored by `save`.
+        :param path: Path to the JSON file.
+        :returns: A `DetectorCostModel` with the stored observations.
+        """
+        with open(path) as file:
+            data = json.load(file)
+        cost_model = cls()
+        for dependency, (total_time, count) in data.get("dependencies", {}).items():
+            cost_model._dependency_observations[DetectorDependency(dependency)] = (float(total_time), int(count))
+        for name, (total_time, count) in data.get("detectors", {}).items():
+            cost_model._detector_observations[name] = (float(total_time), int(count))
+        return cost_model
+
+
+class QueryResult(NamedTuple):
+    """
+    Result of evaluating a query on a single CommonRoad file.
+    """
+
+    path: Path
+    """Path to the CommonRoad file."""
+    matches: bool | None
+    """Whether the tags of the file fulfill the query, `None` if an error occurred."""
+    tags: set[TagEnum]
+    """Tags detected by the executed detectors. Detectors that were not needed to decide the query are skipped."""
+    detectors: list[Detector]
+    """Executed detectors in the order of their execution."""
+    error: str | None
+    """Description of the error that occurred, `None` if the query was evaluated successfully."""
+
+
+class QueryPlanner:
+    """
+    This class labels CommonRoad files only as far as needed to decide whether their tags fulfill a query. Detectors
+    of the tags of the query are executed one after another, always choosing the relevant detector with the lowest
+    estimated cost including the dependencies it requires, e.g. parsing obstacles or planning routes. After every
+    detector, the query is evaluated with three-valued logic and evaluation stops as soon as its result no longer
+    depends on undetected tags. Only detectors of tags that can still change the result are considered relevant. Map
+    detectors only require the lanelet network of a file, so that files can be rejected without parsing their
+    obstacles. The observed costs are recorded in the cost model, so that the order adapts to the processed files.
+    """
+
+    def __init__(
+        self,
+        query: TagQuery | str,
+        cost_model: DetectorCostModel | None = None,
+        route_mode: RouteMode = RouteMode.LANELET_SEQUENCE,
+    ):
+        """
+        Initializes the planner for the given query.
+        :param query: `TagQuery` or textual query as accepted by `common.tag_query.parse_tag_query`.
+        :param cost_model: Cost model used to order the detectors. Defaults to a new cost model with static defaults.
+        :param route_mode: Representation of the planned routes, see `common.general.get_planned_routes`.
+        """
+        self.query = parse_tag_query(query) if isinstance(query, str) else query
+        self.cost_model = DetectorCostModel() if cost_model is None else cost_model
+        self.route_mode = route_mode
+        self.detectors = get_detectors(self.query.get_tags())
+
+    def evaluate_file(self, path_to_file: Path) -> QueryResult:
+        """
+        This method evaluates the query on a single CommonRoad file, catching any exception.
+        :param path_to_file: Path to the CommonRoad file.
+        :returns: A `QueryResult` of the file.
+        """
+        evaluation = _QueryEvaluation(self, path_to_file)
+        try:
+            matches = evaluation.run()
+            error = None
+        except Exception as e:
+            matches = None
+            error = str(e) or type(e).__name__
+        return QueryResult(path_to_file, matches, evaluation.tags, evaluation.executed_detectors, error)
+
+    def find_matching_files(self, path: Path) -> list[Path]:
+        """
+        This method evaluates the query on all CommonRoad files in a folder/single CommonRoad file provided by the
+        specified path.
+        :param path: Path to a folder containing CommonRoad scenarios or a single file.
+        :returns: A list of paths to the files whose tags fulfill the query, sorted by path. Files whose evaluation
+        failed are not contained.
+        """
+        return [file_path for file_path in find_scenario_files(path) if self.evaluate_file(file_path).matches]
+
+
+class _QueryEvaluation:
+    def __init__(self, planner: QueryPlanner, path_to_file: Path):
+        self.planner = planner
+        self.path_to_file = path_to_file
+        self.tags: set[TagEnum] = set()
+        self.decided_tags: set[TagEnum] = set()
+        self.executed_detectors: list[Detector] = []
+        self.provided_dependencies: set[DetectorDependency] = set()
+        self.scenario: Scenario | None = None
+        self.planning_problem_set = None
+        self.route_tag_evaluator: RouteTagEvaluator | None = None
+
+    def run(self) -> bool:
+        remaining_detectors = list(self.planner.detectors)
+        while True:
+            result = self.planner.query.evaluate_partial(self.tags, self.decided_tags)
+            if result is not None:
+                return result
+
+            relevant_tags = get_undecided_tags(self.planner.query, self.tags, self.decided_tags)
+            detector = min(
+                (detector for detector in remaining_detectors if not detector.tags.isdisjoint(relevant_tags)),
+                key=lambda detector: self.planner.cost_model.get_detector_cost(detector, self.provided_dependencies),
+            )
+            remaining_detectors.remove(detector)
+            self._execute(detector)
+
+    def _execute(self, detector: Detector):
+        for dependency in get_missing_dependencies(detector.dependencies, self.provided_dependencies):
+            start_time = time.perf_counter()
+            self._provide(dependency)
+            self.planner.cost_model.observe_dependency(dependency, time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        if DetectorDependency.ROUTES in detector.dependencies:
+            self.tags.update(self.route_tag_evaluator.find_tags([detector.detector_class]))
+        else:
+            self.tags.add(detector.detector_class(self.scenario).get_tag_if_fulfilled())
+            self.tags.discard(None)
+        self.planner.cost_model.observe_detector(detector, time.perf_counter() - start_time)
+
+        self.decided_tags.update(detector.tags)
+        self.executed_detectors.append(detector)
+
+    def _provide(self, dependency: DetectorDependency):
+        if dependency == DetectorDependency.MAP:
+            # Only the lanelet network is parsed, obstacles and planning problems are parsed if another detector
+            # requires them. The time step size is irrelevant for map detectors.
+            self.scenario = Scenario(0.1)
+            self.scenario.add_objects(CommonRoadFileReader(self.path_to_file).open_lanelet_network())
+        elif dependency == DetectorDependency.OBSTACLES:
+            self.scenario, self.planning_problem_set = CommonRoadFileReader(self.path_to_file).open(
+                lanelet_assignment=False
+            )
+        elif dependency == DetectorDependency.OBSTACLE_LANELET_ASSIGNMENT:
+            get_obstacle_lanelet_occupancy(self.scenario)
+        elif dependency == DetectorDependency.ROUTES:
+            routes = get_planned_routes(self.scenario, self.planning_problem_set, route_mode=self.planner.route_mode)
+            self.route_tag_evaluator = RouteTagEvaluator(self.scenario, routes)
+        self.provided_dependencies.add(dependency)
+
+
+def get_missing_dependencies(
+    dependencies: Iterable[DetectorDependency], provided_dependencies: Iterable[DetectorDependency]
+) -> list[DetectorDependency]:
+    """
+    This function determines the dependencies that have to be provided before a detector can be executed. Routes and
+    the assignment of obstacles to lanelets require the complete file to be parsed, i.e. the `OBSTACLES` dependency,
+    which also provides the lanelet network, so that `MAP` is not provided separately in this case.
+    :param dependencies: Dependencies of a detector.
+    :param provided_dependencies: Dependencies that have already been provided for the file.
+    :returns: A list of the missing dependencies in the order in which they have to be provided.
+    """
+    provided_dependencies = set(provided_dependencies)
+    if DetectorDependency.OBSTACLES in provided_dependencies:
+        provided_dependencies.add(DetectorDependency.MAP)
+    missing_dependencies = set(dependencies) - provided_dependencies
+    if missing_dependencies & {DetectorDependency.ROUTES, DetectorDependency.OBSTACLE_LANELET_ASSIGNMENT}:
+        missing_dependencies.add(DetectorDependency.OBSTACLES)
+    missing_dependencies -= provided_dependencies
+    if DetectorDependency.OBSTACLES in missing_dependencies:
+        missing_dependencies.discard(DetectorDependency.MAP)
+    return [dependency for dependency in DetectorDependency if dependency in missing_dependencies]
+
+
+def get_undecided_tags(query: TagQuery, tags: set[TagEnum], decided_tags: set[TagEnum]) -> set[TagEnum]:
+    """
+    This function collects the undecided tags that can still change the result of a query, i.e. tags of subqueries
+    whose result has not been decided yet. For example, the tags of `B` are not relevant for `(A AND B) OR C` once `A`
+    is known to be absent.
+    :param query: Query whose relevant tags are collected.
+    :param tags: Set of tags detected so far.
+    :param decided_tags: Set of tags whose detectors have been executed.
+    :returns: A set of undecided tags, empty if the result of the query is decided.
+    """
+    if query.evaluate_partial(tags, decided_tags) is not None:
+        return set()
+    if isinstance(query, TagQueryTags):
+        return set(query.tags - decided_tags)
+    if isinstance(query, TagQueryNot):
+        return get_undecided_tags(query.operand, tags, decided_tags)
+    return set().union(*(get_undecided_tags(operand, tags, decided_tags) for operand in query.operands))
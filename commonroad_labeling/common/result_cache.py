@@ -0,0 +1,99 @@
+import hashlib
+import json
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+from commonroad_labeling.common.cache import write_file_atomically
+from commonroad_labeling.common.tag import TagEnum
+
+# Packages whose source code determines the detected tags
+DETECTOR_PACKAGES = ["common", "road_configuration", "ego_vehicle_goal"]
+
+# Distributions whose versions determine the detected tags
+DETECTOR_DISTRIBUTIONS = ["commonroad-io", "commonroad-route-planner"]
+
+
+@lru_cache(maxsize=1)
+def get_detector_set_version() -> str:
+    """
+    This function computes a version of the set of detectors from the source code of all detector packages and the
+    versions of the CommonRoad libraries they depend on. The version changes whenever a detector is modified, added or
+    removed, so that cached results of older detectors are not used anymore.
+    :returns: A hexadecimal SHA-256 digest.
+    """
+    version = hashlib.sha256()
+    package_root = Path(__file__).parents[1]
+    for package in DETECTOR_PACKAGES:
+        for source_path in sorted(package_root.joinpath(package).rglob("*.py")):
+            version.update(source_path.relative_to(package_root).as_posix().encode())
+            version.update(source_path.read_bytes())
+
+    for distribution in DETECTOR_DISTRIBUTIONS:
+        try:
+            version.update(f"{distribution}=={metadata.version(distribution)}".encode())
+        except metadata.PackageNotFoundError:
+            version.update(f"{distribution} not installed".encode())
+
+    return version.hexdigest()
+
+
+def get_file_content_hash(path: Path) -> str:
+    """
+    This function computes a hash of the content of a file without parsing it.
+    :param path: Path to the file.
+    :returns: A hexadecimal SHA-256 digest.
+    """
+    content_hash = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+class ResultCache:
+    """
+    This class persists the detected tags of CommonRoad files by the hash of their content and the version of the set of
+    detectors, so that unchanged files do not need to be parsed and labeled again. Results of every detector set
+    version are stored in a subdirectory of their own with one JSON file per file content, hence results of outdated
+    detector set versions are never used and can be removed by deleting their subdirectory.
+    """
+
+    def __init__(self, cache_dir: Path, detector_set_version: str | None = None):
+        """
+        Initializes the cache in the given directory.
+        :param cache_dir: Directory in which results are stored. It is created if it does not exist.
+        :param detector_set_version: Version of the set of detectors. Defaults to `get_detector_set_version()`.
+        """
+        self.cache_dir = cache_dir
+        self.detector_set_version = (
+            detector_set_version if detector_set_version is not None else get_detector_set_version()
+        )
+        self.version_dir = cache_dir.joinpath(self.detector_set_version[:32])
+        self.version_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, content_hash: str) -> set[TagEnum] | None:
+        """
+        This method returns the cached tags of a file.
+        :param content_hash: Hash of the file content as returned by `get_file_content_hash`.
+        :returns: The set of detected tags if the file has been labeled successfully before, `None` otherwise.
+        """
+        try:
+            with open(self._get_cache_file(content_hash)) as cache_file:
+                return {TagEnum(value) for value in json.load(cache_file)["tags"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, content_hash: str, tags: set[TagEnum]):
+        """
+        This method stores the detected tags of a file.
+        :param content_hash: Hash of the file content as returned by `get_file_content_hash`.
+        :param tags: Set of tags detected for the file.
+        """
+        write_file_atomically(
+            self._get_cache_file(content_hash),
+            lambda cache_file: json.dump({"tags": sorted(tag.value for tag in tags)}, cache_file),
+        )
+
+    def _get_cache_file(self, content_hash: str) -> Path:
+        return self.version_dir.joinpath(content_hash + ".json")
@@ -0,0 +1,60 @@
+import enum
+from enum import Enum
+from typing import TYPE_CHECKING, NamedTuple, Union
+
+from commonroad.planning.planning_problem import PlanningProblem
+from commonroad.scenario.lanelet import LaneletNetwork
+
+if TYPE_CHECKING:
+    # The route planner is imported when routes are planned, since importing it takes longer than labeling most files
+    from commonroad_route_planner.reference_path import ReferencePath
+
+
+@enum.unique
+class RouteMode(str, Enum):
+    """
+    This is an enum class that defines how routes are planned for the detection of route and ego vehicle goal tags.
+    `REFERENCE_PATH` plans a smoothed reference path for every route with the reference path planner of the route
+    planner, while `LANELET_SEQUENCE` only plans the sequences of lanelets of the routes, which is sufficient for all
+    detectors, since none of them uses the reference polyline.
+    """
+
+    REFERENCE_PATH = "reference_path"
+    LANELET_SEQUENCE = "lanelet_sequence"
+
+
+class LaneletRoute(NamedTuple):
+    """
+    Lightweight representation of a route, which provides the attributes of a `ReferencePath` used by the detectors.
+    """
+
+    lanelet_ids: tuple[int, ...]
+    """Ordered lanelet IDs of the route from start to goal."""
+    lanelet_network: LaneletNetwork
+    """Lanelet network of the route."""
+
+
+# Routes accepted by route and ego vehicle goal detectors
+Route = Union["ReferencePath", LaneletRoute]
+
+
+def plan_lanelet_routes(lanelet_network: LaneletNetwork, planning_problem: PlanningProblem) -> list[LaneletRoute]:
+    """
+    This function plans the lanelet sequences of all routes of a planning problem without planning reference paths.
+    The routes have the same lanelet IDs as the reference paths planned for the same planning problem.
+    :param lanelet_network: Lanelet network in which the routes are planned.
+    :param planning_problem: Planning problem for which the routes are planned.
+    :returns: A list of routes.
+    :raises ValueError: If no route is found, like the reference path planner does.
+    """
+    from commonroad_route_planner.route_planner import RoutePlanner
+
+    routes = [
+        LaneletRoute(tuple(lanelet_sequence.lanelet_ids), lanelet_network)
+        for lanelet_sequence in RoutePlanner(lanelet_network, planning_problem).plan_routes()
+        if lanelet_sequence.lanelet_ids
+    ]
+    if not routes:
+        raise ValueError(f"Could not find a single route for planning problem {planning_problem.planning_problem_id}.")
+
+    return routes
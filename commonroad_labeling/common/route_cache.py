@@ -0,0 +1,157 @@
+import hashlib
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from commonroad.common.writer.file_writer_xml import PlanningProblemXMLNode
+from commonroad.planning.planning_problem import PlanningProblem
+from commonroad.scenario.lanelet import LaneletNetwork
+from lxml import etree
+
+from commonroad_labeling.common.cache import write_file_atomically
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_fingerprint
+
+# Version of the layout of the cached `.npz` files, which has to be increased whenever the layout changes
+ROUTE_CACHE_FORMAT_VERSION = 2
+
+if TYPE_CHECKING:
+    # The reference path planner imports matplotlib, so that it is only imported when reference paths are planned or
+    # loaded
+    from commonroad_route_planner.reference_path import ReferencePath
+
+
+def plan_reference_paths(lanelet_network: LaneletNetwork, planning_problem: PlanningProblem) -> list["ReferencePath"]:
+    """
+    This function plans all routes of a planning problem and their reference paths.
+    :param lanelet_network: Lanelet network in which the routes are planned.
+    :param planning_problem: Planning problem for which the routes are planned.
+    :returns: A list of reference paths, one for every route.
+    """
+    from commonroad_route_planner.reference_path_planner import ReferencePathPlanner
+    from commonroad_route_planner.route_planner import RoutePlanner
+
+    route_planner = RoutePlanner(lanelet_network, planning_problem)
+    calculated_routes = route_planner.plan_routes()
+    reference_path_planner = ReferencePathPlanner(lanelet_network, planning_problem, calculated_routes)
+
+    reference_paths, _ = reference_path_planner.plan_all_reference_paths()
+
+    return reference_paths
+
+
+def get_planning_problem_fingerprint(planning_problem: PlanningProblem) -> str:
+    """
+    This function computes a fingerprint of the definition of a planning problem, i.e. its initial state and goal
+    region, from its representation in the CommonRoad XML format.
+    :param planning_problem: Planning problem for which the fingerprint is computed.
+    :returns: A hexadecimal SHA-256 digest.
+    """
+    return hashlib.sha256(etree.tostring(PlanningProblemXMLNode.create_node(planning_problem))).hexdigest()
+
+
+class RouteCache:
+    """
+    This class stores the reference paths planned by `plan_reference_paths` on disk, so that routes do not need to be
+    planned again when a CommonRoad file is labeled again. Routes are keyed by the fingerprint of the lanelet network,
+    the definition of the planning problem, the version of the route planner and `ROUTE_CACHE_FORMAT_VERSION`. The
+    lane change method, prohibited lanelet IDs, lanelet IDs, reference polylines
+    and derived arrays, e.g. the curvature, of all routes of a planning problem are stored as numpy arrays in a single
+    compressed `.npz` file, so that loading them does not require any computation.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initializes the cache in the given directory.
+        :param cache_dir: Directory in which routes are stored. It is created if it does not exist.
+        """
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_routes(self, lanelet_network: LaneletNetwork, planning_problem: PlanningProblem) -> list["ReferencePath"]:
+        """
+        This method returns the reference paths of a planning problem, planning them only if they are not cached yet.
+        :param lanelet_network: Lanelet network in which the routes are planned.
+        :param planning_problem: Planning problem for which the routes are planned.
+        :returns: A list of reference paths, one for every route.
+        """
+        cache_file = self._get_cache_file(lanelet_network, planning_problem)
+        routes = self._load(cache_file, lanelet_network, planning_problem)
+        if routes is None:
+            routes = plan_reference_paths(lanelet_network, planning_problem)
+            self._store(cache_file, routes)
+
+        return routes
+
+    def _get_cache_file(self, lanelet_network: LaneletNetwork, planning_problem: PlanningProblem) -> Path:
+        key = hashlib.sha256()
+        key.update(get_lanelet_network_fingerprint(lanelet_network).encode())
+        key.update(get_planning_problem_fingerprint(planning_problem).encode())
+        key.update(metadata.version("commonroad-route-planner").encode())
+        key.update(str(ROUTE_CACHE_FORMAT_VERSION).encode())
+        return self.cache_dir.joinpath(key.hexdigest() + ".npz")
+
+    @staticmethod
+    def _load(
+        cache_file: Path, lanelet_network: LaneletNetwork, planning_problem: PlanningProblem
+    ) -> list["ReferencePath"] | None:
+        from commonroad_route_planner.lane_changing.lane_change_methods.method_interface import LaneChangeMethod
+        from commonroad_route_planner.reference_path import ReferencePath
+        from commonroad_route_planner.route_sections.lanelet_section import LaneletSection
+
+        try:
+            with np.load(cache_file) as arrays:
+                arrays = dict(arrays)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            return [
+                ReferencePath(
+                    lanelet_network=lanelet_network,
+                    initial_state=planning_problem.initial_state,
+                    goal_region=planning_problem.goal,
+                    lanelet_ids=arrays[f"lanelet_ids_{index}"].tolist(),
+                    sections=[
+                        LaneletSection(lanelet_network.find_lanelet_by_id(lanelet_id), lanelet_network)
+                        for lanelet_id in arrays[f"lanelet_ids_{index}"].tolist()
+                    ],
+                    prohibited_lanelet_ids=(
+                        arrays[f"prohibited_lanelet_ids_{index}"].tolist()
+                        if f"prohibited_lanelet_ids_{index}" in arrays
+                        else None
+                    ),
+                    lane_change_method=LaneChangeMethod(int(arrays["lane_change_method"][index])),
+                    num_lane_change_actions=int(arrays["num_lane_change_actions"][index]),
+                    reference_path=arrays[f"reference_path_{index}"],
+                    interpoint_distances=arrays[f"interpoint_distances_{index}"],
+                    average_interpoint_distance=float(arrays["average_interpoint_distance"][index]),
+                    path_length_per_point=arrays[f"path_length_per_point_{index}"],
+                    length_reference_path=float(arrays["length_reference_path"][index]),
+                    path_orientation=arrays[f"path_orientation_{index}"],
+                    path_curvature=arrays[f"path_curvature_{index}"],
+                )
+                for index in range(len(arrays["num_lane_change_actions"]))
+            ]
+        except (KeyError, IndexError, AttributeError, ValueError):
+            return None
+
+    def _store(self, cache_file: Path, routes: list["ReferencePath"]):
+        arrays = {
+            "num_lane_change_actions": np.array([route.num_lane_change_actions for route in routes], np.int64),
+            "average_interpoint_distance": np.array([route.average_interpoint_distance for route in routes]),
+            "length_reference_path": np.array([route.length_reference_path for route in routes]),
+            "lane_change_method": np.array([route.lane_change_method.value for route in routes], np.int64),
+        }
+        for index, route in enumerate(routes):
+            arrays[f"lanelet_ids_{index}"] = np.array(route.lanelet_ids, np.int64)
+            # Missing arrays distinguish routes without prohibited lanelets from routes with an empty list of them
+            if route.prohibited_lanelet_ids is not None:
+                arrays[f"prohibited_lanelet_ids_{index}"] = np.array(route.prohibited_lanelet_ids, np.int64)
+            arrays[f"reference_path_{index}"] = route.reference_path
+            arrays[f"interpoint_distances_{index}"] = route.interpoint_distances
+            arrays[f"path_length_per_point_{index}"] = route.path_length_per_point
+            arrays[f"path_orientation_{index}"] = route.path_orientation
+            arrays[f"path_curvature_{index}"] = route.path_curvature
+
+        write_file_atomically(cache_file, lambda file: np.savez_compressed(file, **arrays), binary=True)
@@ -0,0 +1,102 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from commonroad.scenario.scenario import Scenario
+
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_index
+from commonroad_labeling.common.route import Route
+from commonroad_labeling.common.tag import RouteTag, ScenarioTag, Tag, TagEnum
+
+
+class RouteTagEvaluator:
+    """
+    This class evaluates route and ego vehicle goal detectors for all routes of a scenario at once. Alternative routes
+    usually share long sequences of lanelets, so that evaluating every detector for every route checks the same
+    lanelets many times. Instead, the evaluator constructs a single instance of every route detector and memoizes the
+    result of the `is_fulfilled_for_lanelet` method of its `scenario_tag` in per-lanelet bitmaps, in which bit `i`
+    corresponds to the `i`-th distinct scenario detector class, so that every scenario detector is evaluated at most
+    once per lanelet. Detectors sharing a scenario detector class, e.g. the route obstacle detectors using
+    `ObstacleTraffic`, share their results. A route tag is then detected as soon as any checked lanelet of the union
+    of all route lanelets has its bit set, and evaluation of a detector stops as soon as all tags it can return have
+    been detected.
+    """
+
+    def __init__(self, scenario: Scenario, routes: list[Route]):
+        """
+        Initializes the evaluator with the given scenario and routes.
+        :param scenario: Scenario in which the routes are planned.
+        :param routes: Routes an ego vehicle can take in the given scenario.
+        """
+        self.scenario = scenario
+        self.routes = routes
+        self.lanelet_ids = list(dict.fromkeys(lanelet_id for route in routes for lanelet_id in route.lanelet_ids))
+        self._scenario_tags: list[ScenarioTag] = []
+        self._fulfilled_masks: dict[int, int] = defaultdict(int)
+        self._evaluated_masks: dict[int, int] = defaultdict(int)
+
+    def find_tags(self, detector_classes: Iterable[type[Tag]]) -> set[TagEnum]:
+        """
+        This method evaluates the given detectors for all routes.
+        :param detector_classes: Classes of route or ego vehicle goal detectors, which are constructed with a route and
+        the scenario.
+        :returns: A set of tags detected for any of the routes.
+        """
+        detected_tags = set()
+        if not self.routes:
+            return detected_tags
+
+        for detector_class in detector_classes:
+            detector = detector_class(self.routes[0], self.scenario)
+            if isinstance(detector, RouteTag):
+                detected_tags.update(self._find_route_tags(detector))
+                continue
+
+            # Other detectors are evaluated route by route until their tag is detected
+            for route in self.routes:
+                tag = detector_class(route, self.scenario).get_tag_if_fulfilled()
+                if tag is not None:
+                    detected_tags.add(tag)
+                    break
+
+        return detected_tags
+
+    def _find_route_tags(self, detector: RouteTag) -> set[TagEnum]:
+        bit = self._get_bit(detector.scenario_tag)
+        if detector.get_route_tag(False) is None:
+            # The detector returns a tag only for routes with a fulfilled lanelet, which is equivalent to any lanelet
+            # of the union of all routes being fulfilled
+            tag = detector.get_route_tag(self._is_fulfilled_for_any_lanelet(detector, bit, self.lanelet_ids))
+            return set() if tag is None else {tag}
+
+        possible_tags = {detector.get_route_tag(True), detector.get_route_tag(False)}
+        detected_tags = set()
+        for route in self.routes:
+            detected_tags.add(
+                detector.get_route_tag(self._is_fulfilled_for_any_lanelet(detector, bit, route.lanelet_ids))
+            )
+            if detected_tags == possible_tags:
+                break
+        detected_tags.discard(None)
+        return detected_tags
+
+    def _is_fulfilled_for_any_lanelet(self, detector: RouteTag, bit: int, lanelet_ids: Iterable[int]) -> bool:
+        lanelet_network_index = get_lanelet_network_index(self.scenario.lanelet_network)
+        for lanelet_id in lanelet_ids:
+            lanelet = lanelet_network_index.find_lanelet_by_id(lanelet_id)
+            for checked_lanelet_id in detector.get_checked_lanelet_ids(lanelet):
+                if not self._evaluated_masks[checked_lanelet_id] & bit:
+                    self._evaluated_masks[checked_lanelet_id] |= bit
+                    if self._scenario_tags[bit.bit_length() - 1].is_fulfilled_for_lanelet(
+                        lanelet_network_index.find_lanelet_by_id(checked_lanelet_id)
+                    ):
+                        self._fulfilled_masks[checked_lanelet_id] |= bit
+                if self._fulfilled_masks[checked_lanelet_id] & bit:
+                    return True
+        return False
+
+    def _get_bit(self, scenario_tag: ScenarioTag) -> int:
+        for position, registered_scenario_tag in enumerate(self._scenario_tags):
+            if type(registered_scenario_tag) is type(scenario_tag):
+                return 1 << position
+        self._scenario_tags.append(scenario_tag)
+        return 1 << (len(self._scenario_tags) - 1)
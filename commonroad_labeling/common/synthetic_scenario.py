@@ -0,0 +1,377 @@
+import itertools
+import math
+
+import numpy as np
+from commonroad.common.util import Interval
+from commonroad.geometry.shape import Circle, Rectangle
+from commonroad.planning.goal import GoalRegion
+from commonroad.planning.planning_problem import PlanningProblem, PlanningProblemSet
+from commonroad.prediction.prediction import TrajectoryPrediction
+from commonroad.scenario.intersection import Intersection, IntersectionIncomingElement
+from commonroad.scenario.lanelet import Lanelet, LaneletNetwork
+from commonroad.scenario.obstacle import DynamicObstacle, ObstacleType, StaticObstacle
+from commonroad.scenario.scenario import Location, Scenario, ScenarioID
+from commonroad.scenario.state import CustomState, InitialState
+from commonroad.scenario.trajectory import Trajectory
+
+# Offset of planning problem IDs to the ID of the obstacle they are based on, as in the CommonRoad datasets, see
+# `criticality.computer.crit_util.find_egos_from_problem_sets`
+PLANNING_PROBLEM_ID_OFFSET = 90000
+
+# Dimensions of the generated obstacles in meters
+VEHICLE_LENGTH = 4.5
+VEHICLE_WIDTH = 1.8
+PEDESTRIAN_RADIUS = 0.4
+
+
+class _LaneletNetworkBuilder:
+    """
+    Helper that collects lanelets and intersections with consecutive IDs.
+    """
+
+    def __init__(self, lane_width: float):
+        self.lane_width = lane_width
+        self.lanelets: dict[int, Lanelet] = {}
+        self.intersections: list[Intersection] = []
+        self._ids = itertools.count(1)
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add_lanelet(self, center_vertices: np.ndarray) -> Lanelet:
+        # Bounds are offset along the normals of the center polyline, averaged at inner vertices
+        directions = np.diff(center_vertices, axis=0)
+        directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+        vertex_directions = np.vstack([directions[:1], directions[:-1] + directions[1:], directions[-1:]])
+        vertex_directions /= np.linalg.norm(vertex_directions, axis=1)[:, np.newaxis]
+        normals = np.column_stack([-vertex_directions[:, 1], vertex_directions[:, 0]]) * (self.lane_width / 2)
+
+        lanelet = Lanelet(center_vertices + normals, center_vertices, center_vertices - normals, self.next_id(), [], [])
+        self.lanelets[lanelet.lanelet_id] = lanelet
+        return lanelet
+
+    def connect(self, predecessor: Lanelet, successor: Lanelet):
+        predecessor.successor.append(successor.lanelet_id)
+        successor.predecessor.append(predecessor.lanelet_id)
+
+    def create_lanelet_network(self) -> LaneletNetwork:
+        lanelet_network = LaneletNetwork.create_from_lanelet_list(list(self.lanelets.values()), cleanup_ids=False)
+        for intersection in self.intersections:
+            lanelet_network.add_intersection(intersection)
+        return lanelet_network
+
+
+def create_synthetic_scenario(
+    grid_rows: int = 2,
+    grid_columns: int = 2,
+    block_length: float = 50.0,
+    lanes_per_direction: int = 1,
+    intersection_count: int | None = None,
+    ring_count: int = 0,
+    ring_segments: int = 8,
+    ring_radius: float = 30.0,
+    dynamic_obstacle_count: int = 0,
+    time_steps: int = 50,
+    static_obstacle_count: int = 0,
+    pedestrian_share: float = 0.1,
+    lane_width: float = 3.5,
+    seed: int = 0,
+) -> tuple[Scenario, PlanningProblemSet]:
+    """
+    This function generates a CommonRoad scenario in memory, whose size is controlled by its parameters, e.g. to
+    measure how the runtime of detectors scales with the number of lanelets and obstacle states. The road network is a
+    grid of two-way roads, whose nodes are connected by turning and straight lanelets, optionally complemented by
+    separate one-way ring roads. Dynamic obstacles drive along random sequences of lanelets with a constant velocity.
+    The planning problem is based on the first dynamic obstacle, so that its ID follows the convention of the CommonRoad
+    datasets, or starts at the first lanelet of the grid if there are no dynamic obstacles.
+    :param grid_rows: Number of rows of blocks of the grid. The grid is omitted if it or `grid_columns` is 0.
+    :param grid_columns: Number of columns of blocks of the grid.
+    :param block_length: Distance between neighbouring nodes of the grid in meters.
+    :param lanes_per_direction: Number of parallel lanes in each direction of every road of the grid.
+    :param intersection_count: Number of grid nodes with at least three roads for which an intersection element is
+    created. Defaults to all of them.
+    :param ring_count: Number of one-way ring roads, which are placed below the grid.
+    :param ring_segments: Number of lanelets of every ring road.
+    :param ring_radius: Radius of the ring roads in meters.
+    :param dynamic_obstacle_count: Number of dynamic obstacles.
+    :param time_steps: Number of time steps of the trajectories of the dynamic obstacles.
+    :param static_obstacle_count: Number of parked vehicles, which are placed on random lanelets.
+    :param pedestrian_share: Share of the dynamic obstacles that are pedestrians instead of cars.
+    :param lane_width: Width of every lane in meters.
+    :param seed: Seed of the random number generator, so that the same parameters yield the same scenario.
+    :returns: A tuple of the generated scenario and a planning problem set with a single planning problem.
+    :raises ValueError: If neither a grid nor a ring road is generated.
+    """
+    if (grid_rows <= 0 or grid_columns <= 0) and ring_count <= 0:
+        raise ValueError("A synthetic scenario requires a grid or at least one ring road.")
+
+    rng = np.random.default_rng(seed)
+    builder = _LaneletNetworkBuilder(lane_width)
+    if grid_rows > 0 and grid_columns > 0:
+        _add_grid(builder, grid_rows, grid_columns, block_length, lanes_per_direction, intersection_count)
+    for ring_index in range(ring_count):
+        center = np.array([ring_radius + ring_index * 3 * ring_radius, -2 * ring_radius])
+        _add_ring(builder, center, ring_radius, ring_segments)
+
+    scenario = Scenario(
+        0.1,
+        ScenarioID(map_name="Synthetic", map_id=seed + 1),
+        author="commonroad-labeling",
+        affiliation="",
+        source="Synthetic scenario generator",
+        tags=set(),
+        location=Location(),
+    )
+    scenario.add_objects(builder.create_lanelet_network())
+    lanelets = list(builder.lanelets.values())
+
+    dynamic_obstacles = []
+    for _ in range(dynamic_obstacle_count):
+        obstacle_type = ObstacleType.PEDESTRIAN if rng.random() < pedestrian_share else ObstacleType.CAR
+        dynamic_obstacles.append(
+            _create_dynamic_obstacle(scenario, lanelets[rng.integers(len(lanelets))], obstacle_type, time_steps, rng)
+        )
+    scenario.add_objects(dynamic_obstacles)
+
+    for _ in range(static_obstacle_count):
+        lanelet = lanelets[rng.integers(len(lanelets))]
+        position, orientation = _interpolate_pose(lanelet.center_vertices, rng.random() * lanelet.distance[-1])
+        scenario.add_objects(
+            StaticObstacle(
+                scenario.generate_object_id(),
+                ObstacleType.PARKED_VEHICLE,
+                Rectangle(VEHICLE_LENGTH, VEHICLE_WIDTH),
+                InitialState(time_step=0, position=position, orientation=orientation, velocity=0.0),
+            )
+        )
+
+    planning_problem_set = PlanningProblemSet(
+        [_create_planning_problem(scenario, lanelets[0], dynamic_obstacles, time_steps, rng)]
+    )
+    return scenario, planning_problem_set
+
+
+def get_obstacle_state_count(scenario: Scenario) -> int:
+    """
+    This function counts the states of all obstacles of a scenario, i.e. the initial states and the states of the
+    predicted trajectories.
+    :param scenario: Scenario whose obstacle states are counted.
+    :returns: The number of obstacle states.
+    """
+    state_count = len(scenario.static_obstacles)
+    for obstacle in scenario.dynamic_obstacles:
+        state_count += 1
+        if isinstance(obstacle.prediction, TrajectoryPrediction):
+            state_count += len(obstacle.prediction.trajectory.state_list)
+    return state_count
+
+
+def _add_grid(
+    builder: _LaneletNetworkBuilder,
+    rows: int,
+    columns: int,
+    block_length: float,
+    lanes_per_direction: int,
+    intersection_count: int | None,
+):
+    # Lanelets of the roads end at a margin around every node, which is bridged by connecting lanelets
+    margin = lanes_per_direction * builder.lane_width + 2.0
+    incoming_by_node = {}
+    outgoing_by_node = {}
+    for row, column in itertools.product(range(rows + 1), range(columns + 1)):
+        node = np.array([column, row]) * block_length
+        for neighbour_row, neighbour_column in [(row, column + 1), (row + 1, column)]:
+            if neighbour_row > rows or neighbour_column > columns:
+                continue
+            neighbour = np.array([neighbour_column, neighbour_row]) * block_length
+            forward_lanes = _add_road_lanes(builder, node, neighbour, margin, lanes_per_direction)
+            backward_lanes = _add_road_lanes(builder, neighbour, node, margin, lanes_per_direction)
+
+            # The innermost lanes of both directions are neighbours in opposite direction
+            for lanes, opposite_lanes in [(forward_lanes, backward_lanes), (backward_lanes, forward_lanes)]:
+                lanes[0].adj_left = opposite_lanes[0].lanelet_id
+                lanes[0].adj_left_same_direction = False
+
+            direction = (neighbour - node) / block_length
+            for lanes, start, end in [
+                (forward_lanes, (row, column), (neighbour_row, neighbour_column)),
+                (backward_lanes, (neighbour_row, neighbour_column), (row, column)),
+            ]:
+                road_direction = direction if lanes is forward_lanes else -direction
+                outgoing_by_node.setdefault(start, []).append((road_direction, lanes))
+                incoming_by_node.setdefault(end, []).append((road_direction, lanes))
+
+    remaining_intersections = math.inf if intersection_count is None else intersection_count
+    for node_key in sorted(incoming_by_node):
+        incoming_roads = incoming_by_node[node_key]
+        is_intersection = len(incoming_roads) >= 3 and remaining_intersections > 0
+        incoming_elements = []
+        for incoming_direction, incoming_lanes in incoming_roads:
+            successors = {"left": set(), "right": set(), "straight": set()}
+            for outgoing_direction, outgoing_lanes in outgoing_by_node[node_key]:
+                if np.dot(incoming_direction, outgoing_direction) < -0.5:
+                    continue  # No U-turns
+                if np.dot(incoming_direction, outgoing_direction) > 0.5:
+                    maneuver = "straight"
+                elif incoming_direction[0] * outgoing_direction[1] - incoming_direction[1] * outgoing_direction[0] > 0:
+                    maneuver = "left"
+                else:
+                    maneuver = "right"
+                for incoming_lanelet, outgoing_lanelet in zip(incoming_lanes, outgoing_lanes):
+                    start = incoming_lanelet.center_vertices[-1]
+                    end = outgoing_lanelet.center_vertices[0]
+                    # Turns pass through the corner at which the extensions of both lanes cross
+                    corner = start + incoming_direction * np.dot(end - start, incoming_direction)
+                    center_vertices = (
+                        np.array([start, end]) if maneuver == "straight" else np.array([start, corner, end])
+                    )
+                    connecting_lanelet = builder.add_lanelet(center_vertices)
+                    builder.connect(incoming_lanelet, connecting_lanelet)
+                    builder.connect(connecting_lanelet, outgoing_lanelet)
+                    successors[maneuver].add(connecting_lanelet.lanelet_id)
+
+            if is_intersection:
+                incoming_elements.append(
+                    IntersectionIncomingElement(
+                        builder.next_id(),
+                        {lanelet.lanelet_id for lanelet in incoming_lanes},
+                        successors["right"],
+                        successors["straight"],
+                        successors["left"],
+                    )
+                )
+
+        if is_intersection:
+            builder.intersections.append(Intersection(builder.next_id(), incoming_elements))
+            remaining_intersections -= 1
+
+
+def _add_road_lanes(
+    builder: _LaneletNetworkBuilder, start: np.ndarray, end: np.ndarray, margin: float, lanes_per_direction: int
+) -> list[Lanelet]:
+    # Lanes of a direction are ordered from the middle of the road to its right edge
+    direction = (end - start) / np.linalg.norm(end - start)
+    right_normal = np.array([direction[1], -direction[0]])
+    lanes = []
+    for lane_index in range(lanes_per_direction):
+        offset = right_normal * (lane_index + 0.5) * builder.lane_width
+        lanes.append(builder.add_lanelet(np.array([start + direction * margin, end - direction * margin]) + offset))
+
+    for left_lane, right_lane in zip(lanes, lanes[1:]):
+        left_lane.adj_right = right_lane.lanelet_id
+        left_lane.adj_right_same_direction = True
+        right_lane.adj_left = left_lane.lanelet_id
+        right_lane.adj_left_same_direction = True
+    return lanes
+
+
+def _add_ring(builder: _LaneletNetworkBuilder, center: np.ndarray, radius: float, segments: int):
+    # Every lanelet of the counterclockwise ring is a polyline approximating its arc
+    vertices_per_segment = 4
+    angles = np.linspace(0.0, 2 * np.pi, segments * vertices_per_segment + 1)
+    points = center + radius * np.column_stack([np.cos(angles), np.sin(angles)])
+    ring_lanelets = []
+    for segment in range(segments):
+        vertex_indices = np.arange(vertices_per_segment + 1) + segment * vertices_per_segment
+        ring_lanelets.append(builder.add_lanelet(points[vertex_indices]))
+    for lanelet, successor in zip(ring_lanelets, ring_lanelets[1:] + ring_lanelets[:1]):
+        builder.connect(lanelet, successor)
+
+
+def _interpolate_pose(vertices: np.ndarray, distance: float) -> tuple[np.ndarray, float]:
+    distances = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(vertices, axis=0), axis=1))])
+    distance = min(max(distance, 0.0), distances[-1])
+    segment = min(int(np.searchsorted(distances, distance, side="right")) - 1, len(vertices) - 2)
+    ratio = (distance - distances[segment]) / max(distances[segment + 1] - distances[segment], 1e-9)
+    position = vertices[segment] + ratio * (vertices[segment + 1] - vertices[segment])
+    direction = vertices[segment + 1] - vertices[segment]
+    return position, float(np.arctan2(direction[1], direction[0]))
+
+
+def _get_random_lanelet_path(
+    lanelet_network: LaneletNetwork, start_lanelet: Lanelet, length: float, rng: np.random.Generator
+) -> tuple[np.ndarray, list[int]]:
+    # Follows random successors until the path is long enough or a lanelet without successors is reached
+    lanelet_ids = [start_lanelet.lanelet_id]
+    vertices = [start_lanelet.center_vertices]
+    path_length = start_lanelet.distance[-1]
+    lanelet = start_lanelet
+    while path_length < length and lanelet.successor:
+        lanelet = lanelet_network.find_lanelet_by_id(lanelet.successor[rng.integers(len(lanelet.successor))])
+        lanelet_ids.append(lanelet.lanelet_id)
+        vertices.append(lanelet.center_vertices[1:])
+        path_length += lanelet.distance[-1]
+    return np.vstack(vertices), lanelet_ids
+
+
+def _create_dynamic_obstacle(
+    scenario: Scenario, start_lanelet: Lanelet, obstacle_type: ObstacleType, time_steps: int, rng: np.random.Generator
+) -> DynamicObstacle:
+    velocity = rng.uniform(1.0, 2.0) if obstacle_type == ObstacleType.PEDESTRIAN else rng.uniform(5.0, 15.0)
+    start_distance = rng.random() * start_lanelet.distance[-1]
+    vertices, _ = _get_random_lanelet_path(
+        scenario.lanelet_network, start_lanelet, start_distance + velocity * scenario.dt * time_steps, rng
+    )
+
+    states = []
+    for time_step in range(time_steps + 1):
+        position, orientation = _interpolate_pose(vertices, start_distance + velocity * scenario.dt * time_step)
+        states.append(
+            CustomState(
+                time_step=time_step,
+                position=position,
+                orientation=orientation,
+                velocity=velocity,
+                acceleration=0.0,
+                yaw_rate=0.0,
+                slip_angle=0.0,
+            )
+        )
+
+    shape = (
+        Circle(PEDESTRIAN_RADIUS)
+        if obstacle_type == ObstacleType.PEDESTRIAN
+        else Rectangle(VEHICLE_LENGTH, VEHICLE_WIDTH)
+    )
+    initial_state = InitialState(**{attribute: getattr(states[0], attribute) for attribute in states[0].attributes})
+    prediction = TrajectoryPrediction(Trajectory(1, states[1:]), shape) if time_steps > 0 else None
+    return DynamicObstacle(scenario.generate_object_id(), obstacle_type, shape, initial_state, prediction)
+
+
+def _create_planning_problem(
+    scenario: Scenario,
+    start_lanelet: Lanelet,
+    dynamic_obstacles: list[DynamicObstacle],
+    time_steps: int,
+    rng: np.random.Generator,
+) -> PlanningProblem:
+    ego_obstacle = next(
+        (obstacle for obstacle in dynamic_obstacles if obstacle.obstacle_type != ObstacleType.PEDESTRIAN), None
+    )
+    if ego_obstacle is not None:
+        planning_problem_id = ego_obstacle.obstacle_id + PLANNING_PROBLEM_ID_OFFSET
+        initial_state = ego_obstacle.initial_state
+        start_lanelet_ids = scenario.lanelet_network.find_lanelet_by_position([initial_state.position])[0]
+        start_lanelet = scenario.lanelet_network.find_lanelet_by_id(start_lanelet_ids[0])
+    else:
+        planning_problem_id = scenario.generate_object_id() + PLANNING_PROBLEM_ID_OFFSET
+        position, orientation = _interpolate_pose(start_lanelet.center_vertices, 0.0)
+        initial_state = InitialState(
+            time_step=0,
+            position=position,
+            orientation=orientation,
+            velocity=10.0,
+            acceleration=0.0,
+            yaw_rate=0.0,
+            slip_angle=0.0,
+        )
+
+    # The goal is a lanelet reached by following successors, so that a route exists
+    _, path_lanelet_ids = _get_random_lanelet_path(scenario.lanelet_network, start_lanelet, 150.0, rng)
+    goal_lanelet = scenario.lanelet_network.find_lanelet_by_id(path_lanelet_ids[-1])
+    goal_position, goal_orientation = _interpolate_pose(goal_lanelet.center_vertices, goal_lanelet.distance[-1] / 2)
+    goal_state = CustomState(
+        time_step=Interval(0, max(time_steps, 1)),
+        position=Rectangle(VEHICLE_LENGTH * 2, VEHICLE_WIDTH * 2, goal_position, goal_orientation),
+    )
+    return PlanningProblem(planning_problem_id, initial_state, GoalRegion([goal_state], {0: [goal_lanelet.lanelet_id]}))
@@ -4,7 +4,9 @@ from enum import Enum
 
 from commonroad.scenario.lanelet import Lanelet
 from commonroad.scenario.scenario import Scenario
-from commonroad_route_planner.reference_path import ReferencePath
+
+from commonroad_labeling.common.lanelet_network_index import LaneletNetworkIndex, get_lanelet_network_index
+from commonroad_labeling.common.route import Route
 
 enum_delimiter = "|"
 
@@ -136,6 +138,15 @@ class ScenarioTag(Tag, ABC):
         super().__init__()
         self.scenario = scenario
 
+    @property
+    def lanelet_network_index(self) -> LaneletNetworkIndex:
+        """
+        Lookup structures of the lanelet network of the scenario, which are built once and shared by all detectors
+        working on the same scenario.
+        :returns: The `LaneletNetworkIndex` of the scenario's lanelet network.
+        """
+        return get_lanelet_network_index(self.scenario.lanelet_network)
+
     @abstractmethod
     def is_fulfilled_for_lanelet(self, lanelet: Lanelet) -> bool:
         """
@@ -155,7 +166,7 @@ class RouteTag(Tag, ABC):
     that have similar detection patterns.
     """
 
-    def __init__(self, route: ReferencePath, scenario_tag: ScenarioTag):
+    def __init__(self, route: Route, scenario_tag: ScenarioTag):
         """
         Initializes the superclass, the `route` attribute with the corresponding ego vehicle route in the scenario and
         the subclass of `ScenarioTag` for `scenario_tag` used to detect whether any lanelets in a route
@@ -178,17 +189,41 @@ class RouteTag(Tag, ABC):
             for lanelet_id in self.route.lanelet_ids
         ]
 
+    def get_checked_lanelet_ids(self, lanelet: Lanelet) -> list[int]:
+        """
+        This method returns the IDs of the lanelets that are checked with the `scenario_tag` attribute for a lanelet of
+        the route. Subclasses override it to check e.g. neighbouring lanelets instead of the route lanelets themselves.
+        :param lanelet: Lanelet of the route.
+        :returns: List of IDs of the lanelets to check, by default only the ID of the given lanelet.
+        """
+        return [lanelet.lanelet_id]
+
+    def get_route_tag(self, fulfilled: bool) -> TagEnum | None:
+        """
+        This method returns the tag of a route depending on whether any of its checked lanelets satisfies the
+        conditions of the `scenario_tag` attribute.
+        :param fulfilled: Boolean value indicating whether any checked lanelet of the route satisfies the conditions.
+        :returns: `TagEnum` returned for the route, `None` if the route is not labeled.
+        """
+        return self.get_tag() if fulfilled else None
+
     def is_fulfilled(self) -> bool:
         """
-        This method iterates through the lanelets and checks whether any of them satisfy the conditions of a certain tag
-        given by the `scenario_tag` attribute.
+        This method iterates through the lanelets and checks whether any of their checked lanelets, see
+        `get_checked_lanelet_ids`, satisfy the conditions of a certain tag given by the `scenario_tag` attribute.
         :returns: Boolean value if the route satisfies the conditions for the given scenario.
         """
 
         lanelets = self.get_route_lanelets()
         for lanelet in lanelets:
-            if self.scenario_tag.is_fulfilled_for_lanelet(lanelet):
-                return True
+            for checked_lanelet_id in self.get_checked_lanelet_ids(lanelet):
+                checked_lanelet = (
+                    lanelet
+                    if checked_lanelet_id == lanelet.lanelet_id
+                    else self.route.lanelet_network.find_lanelet_by_id(checked_lanelet_id)
+                )
+                if self.scenario_tag.is_fulfilled_for_lanelet(checked_lanelet):
+                    return True
         return False
 
 
@@ -200,7 +235,7 @@ class EgoVehicleGoalTag(Tag, ABC):
     similar detection patterns.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route.
         :param route: specifies a route that an ego vehicle could take for a given scenario and
@@ -0,0 +1,208 @@
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from commonroad_labeling.common.tag import TagEnum
+from commonroad_labeling.common.tag_query import (
+    TagQuery,
+    TagQueryAnd,
+    TagQueryNot,
+    TagQueryOr,
+    TagQueryTags,
+    parse_tag_query,
+)
+
+
+class TagIndex:
+    """
+    This class stores detected tags of CommonRoad files in an SQLite database and answers boolean queries over them.
+    Tags are stored as an inverted index, i.e. a table of (tag, scenario) pairs clustered by tag, so that a query only
+    reads the scenarios of the tags it contains instead of loading the tags of all scenarios. Queries are evaluated
+    with bitwise operations on in-memory bitmaps of these scenarios.
+    """
+
+    def __init__(self, database_path: Path | str = ":memory:"):
+        """
+        Opens the index stored in the given database file and creates its tables if necessary.
+        :param database_path: Path to the SQLite database file, `:memory:` for an index that is not persisted.
+        """
+        self.connection = sqlite3.connect(str(database_path))
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS scenarios (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                labeled INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS scenario_tags (
+                tag TEXT NOT NULL,
+                scenario_id INTEGER NOT NULL REFERENCES scenarios(id),
+                PRIMARY KEY (tag, scenario_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS scenario_tags_by_scenario ON scenario_tags (scenario_id);
+            """
+        )
+        self._bitmap_by_tag: dict[TagEnum, int] = {}
+        self._labeled_bitmap: int | None = None
+        self._sorted_scenarios: tuple[np.ndarray, list[Path]] | None = None
+
+    def __enter__(self) -> "TagIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        This method closes the database connection.
+        """
+        self.connection.close()
+
+    def add(self, path: Path, tags: set[TagEnum] | None):
+        """
+        This method adds the tags of a CommonRoad file to the index, replacing its previous tags.
+        :param path: Path to the CommonRoad file.
+        :param tags: Set of detected tags, `None` if an error occurred during labeling.
+        """
+        self.add_tags_by_file({path: tags})
+
+    def add_tags_by_file(self, tags_by_file: dict[Path, set[TagEnum] | None] | Iterable[tuple]):
+        """
+        This method adds the tags of several CommonRoad files to the index in a single transaction, replacing their
+        previous tags.
+        :param tags_by_file: Dictionary as returned by `common.general.get_detected_tags_by_file` or iterable of
+        tuples starting with a path and tags, e.g. results of `common.general.iter_detected_tags`.
+        """
+        items = tags_by_file.items() if isinstance(tags_by_file, dict) else tags_by_file
+        self._clear_bitmaps()
+        with self.connection:
+            for path, tags, *_ in items:
+                self.connection.execute(
+                    "INSERT INTO scenarios (path, labeled) VALUES (?, ?) "
+                    "ON CONFLICT (path) DO UPDATE SET labeled = excluded.labeled",
+                    (str(path), tags is not None),
+                )
+                (scenario_id,) = self.connection.execute(
+                    "SELECT id FROM scenarios WHERE path = ?", (str(path),)
+                ).fetchone()
+                self.connection.execute("DELETE FROM scenario_tags WHERE scenario_id = ?", (scenario_id,))
+                self.connection.executemany(
+                    "INSERT INTO scenario_tags (tag, scenario_id) VALUES (?, ?)",
+                    [(tag.value, scenario_id) for tag in tags or ()],
+                )
+
+    def remove(self, path: Path):
+        """
+        This method removes a CommonRoad file from the index.
+        :param path: Path to the CommonRoad file.
+        """
+        self._clear_bitmaps()
+        with self.connection:
+            scenario = self.connection.execute("SELECT id FROM scenarios WHERE path = ?", (str(path),)).fetchone()
+            if scenario is not None:
+                self.connection.execute("DELETE FROM scenario_tags WHERE scenario_id = ?", scenario)
+                self.connection.execute("DELETE FROM scenarios WHERE id = ?", scenario)
+
+    def get_tags(self, path: Path) -> set[TagEnum] | None:
+        """
+        This method returns the tags of a CommonRoad file stored in the index.
+        :param path: Path to the CommonRoad file.
+        :returns: The set of tags of the file, `None` if the file is not in the index or could not be labeled.
+        """
+        scenario = self.connection.execute("SELECT id, labeled FROM scenarios WHERE path = ?", (str(path),)).fetchone()
+        if scenario is None or not scenario[1]:
+            return None
+        return {
+            TagEnum(tag)
+            for (tag,) in self.connection.execute("SELECT tag FROM scenario_tags WHERE scenario_id = ?", scenario[:1])
+        }
+
+    def query(self, query: TagQuery | str) -> list[Path]:
+        """
+        This method returns all successfully labeled CommonRoad files whose tags fulfill a query.
+        :param query: `TagQuery` or textual query as accepted by `common.tag_query.parse_tag_query`, e.g.
+        `intersection AND turn_left AND NOT traffic_light`.
+        :returns: A list of paths to the matching CommonRoad files, sorted by path.
+        """
+        bitmap = self.get_query_bitmap(query)
+        if not bitmap:
+            return []
+
+        if self._sorted_scenarios is None:
+            scenarios = self.connection.execute("SELECT id, path FROM scenarios ORDER BY path").fetchall()
+            self._sorted_scenarios = (
+                np.array([scenario_id for scenario_id, _ in scenarios], dtype=np.int64),
+                [Path(path) for _, path in scenarios],
+            )
+        scenario_ids, paths = self._sorted_scenarios
+        bits = np.unpackbits(
+            np.frombuffer(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little"), np.uint8), bitorder="little"
+        )
+        bits = np.pad(bits, (0, max(0, int(scenario_ids.max(initial=0)) + 1 - len(bits))))
+        return [paths[index] for index in np.flatnonzero(bits[scenario_ids]).tolist()]
+
+    def count(self, query: TagQuery | str) -> int:
+        """
+        This method counts all successfully labeled CommonRoad files whose tags fulfill a query.
+        :param query: `TagQuery` or textual query, see `query`.
+        :returns: The number of matching CommonRoad files.
+        """
+        return self.get_query_bitmap(query).bit_count()
+
+    def get_query_bitmap(self, query: TagQuery | str) -> int:
+        """
+        This method evaluates a query on bitmaps of the scenarios of every tag, in which bit `i` is set if the scenario
+        with ID `i` has the tag. The bitmap of a tag is read from the inverted index when it is first needed and kept
+        in memory until the index is modified, so that subsequent queries only consist of bitwise operations.
+        :param query: `TagQuery` or textual query, see `query`.
+        :returns: A bitmap of the IDs of all successfully labeled scenarios fulfilling the query.
+        """
+        query = parse_tag_query(query) if isinstance(query, str) else query
+
+        if isinstance(query, TagQueryTags):
+            bitmap = 0
+            for tag in query.tags:
+                if tag not in self._bitmap_by_tag:
+                    self._bitmap_by_tag[tag] = self._read_bitmap(
+                        "SELECT scenario_id FROM scenario_tags WHERE tag = ?", (tag.value,)
+                    )
+                bitmap |= self._bitmap_by_tag[tag]
+            return bitmap
+
+        if isinstance(query, TagQueryNot):
+            if self._labeled_bitmap is None:
+                self._labeled_bitmap = self._read_bitmap("SELECT id FROM scenarios WHERE labeled")
+            return self._labeled_bitmap & ~self.get_query_bitmap(query.operand)
+
+        if isinstance(query, TagQueryAnd):
+            bitmap = self.get_query_bitmap(query.operands[0])
+            for operand in query.operands[1:]:
+                if not bitmap:
+                    break
+                bitmap &= self.get_query_bitmap(operand)
+            return bitmap
+
+        if isinstance(query, TagQueryOr):
+            bitmap = 0
+            for operand in query.operands:
+                bitmap |= self.get_query_bitmap(operand)
+            return bitmap
+
+        raise ValueError(f"Query {query!r} cannot be evaluated.")
+
+    def _read_bitmap(self, sql: str, parameters: tuple = ()) -> int:
+        scenario_ids = np.fromiter(
+            (scenario_id for (scenario_id,) in self.connection.execute(sql, parameters)), np.int64
+        )
+        if len(scenario_ids) == 0:
+            return 0
+        bits = np.zeros(scenario_ids.max() + 1, dtype=bool)
+        bits[scenario_ids] = True
+        return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+
+    def _clear_bitmaps(self):
+        self._bitmap_by_tag.clear()
+        self._labeled_bitmap = None
+        self._sorted_scenarios = None
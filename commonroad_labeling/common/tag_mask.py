@@ -0,0 +1,139 @@
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from commonroad_labeling.common.tag import TagEnum
+
+# Bit of every tag in a `TagMask`. Bits are assigned in the order in which tags are defined in `TagEnum`, so that new
+# tags must be appended to `TagEnum` to keep the masks of stored results valid.
+TAG_BITS: dict[TagEnum, int] = {tag: 1 << position for position, tag in enumerate(TagEnum)}
+
+# Tags by bit position, the inverse of `TAG_BITS`
+TAGS_BY_POSITION: tuple[TagEnum, ...] = tuple(TagEnum)
+
+if len(TAGS_BY_POSITION) > 64:
+    raise ValueError("Tag masks are limited to 64 tags, so that they can be stored as unsigned 64-bit integers.")
+
+
+class TagMask(int):
+    """
+    This class represents a set of tags as an integer, in which the bit given by `TAG_BITS` is set for every contained
+    tag. Tag masks are immutable, hashable and considerably smaller than a `set[TagEnum]`, and set operations on them
+    are single integer operations. Since all tags fit into 64 bits, many masks can be stored in a NumPy array of
+    unsigned 64-bit integers, see `get_tag_mask_array`, so that filtering and statistics over large datasets are
+    vectorized.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_tags(cls, tags: Iterable[TagEnum | None]) -> "TagMask":
+        """
+        This method creates the mask of a set of tags.
+        :param tags: Tags contained in the mask. `None` values, as returned by detectors that are not fulfilled, are
+        ignored.
+        :returns: A `TagMask` of the given tags.
+        """
+        mask = 0
+        for tag in tags:
+            if tag is not None:
+                mask |= TAG_BITS[tag]
+        return cls(mask)
+
+    @classmethod
+    def all(cls) -> "TagMask":
+        """
+        This method creates the mask of all tags.
+        :returns: A `TagMask` containing every tag of `TagEnum`.
+        """
+        return cls((1 << len(TAGS_BY_POSITION)) - 1)
+
+    def to_tags(self) -> set[TagEnum]:
+        """
+        This method converts the mask to a set of tags.
+        :returns: A set of the tags contained in the mask.
+        """
+        return set(self)
+
+    def __contains__(self, tag: TagEnum) -> bool:
+        return bool(self & TAG_BITS[tag])
+
+    def __iter__(self) -> Iterator[TagEnum]:
+        mask = int(self)
+        while mask:
+            bit = mask & -mask
+            yield TAGS_BY_POSITION[bit.bit_length() - 1]
+            mask ^= bit
+
+    def __len__(self) -> int:
+        return self.bit_count()
+
+    def __or__(self, other: int) -> "TagMask":
+        return TagMask(int(self) | other)
+
+    __ror__ = __or__
+
+    def __and__(self, other: int) -> "TagMask":
+        return TagMask(int(self) & other)
+
+    __rand__ = __and__
+
+    def __xor__(self, other: int) -> "TagMask":
+        return TagMask(int(self) ^ other)
+
+    __rxor__ = __xor__
+
+    def __sub__(self, other: int) -> "TagMask":
+        return TagMask(int(self) & ~other)
+
+    def __invert__(self) -> "TagMask":
+        return TagMask(TagMask.all() & ~int(self))
+
+    def issubset(self, other: int) -> bool:
+        """
+        This method checks whether all tags of the mask are contained in another mask.
+        :param other: Mask that is compared.
+        :returns: True if the mask is a subset of the other mask, False otherwise.
+        """
+        return int(self) & ~other == 0
+
+    def isdisjoint(self, other: int) -> bool:
+        """
+        This method checks whether the mask and another mask have no tag in common.
+        :param other: Mask that is compared.
+        :returns: True if the masks are disjoint, False otherwise.
+        """
+        return int(self) & other == 0
+
+    def __repr__(self) -> str:
+        return f"TagMask({{{', '.join(sorted(tag.name for tag in self))}}})"
+
+
+def get_tag_mask_array(tag_sets: Iterable[Iterable[TagEnum] | None]) -> np.ndarray:
+    """
+    This function converts sets of tags, e.g. the values of the dictionary returned by
+    `common.general.get_detected_tags_by_file`, to an array of tag masks.
+    :param tag_sets: Sets of tags, `None` for files whose labeling failed.
+    :returns: A NumPy array of unsigned 64-bit integers with the mask of every set of tags. Failed files have the mask
+    0, i.e. they cannot be distinguished from files without tags by their mask.
+    """
+    return np.fromiter((TagMask.from_tags(tags or ()) for tags in tag_sets), dtype=np.uint64)
+
+
+def get_tag_sets(masks: np.ndarray | Iterable[int]) -> list[set[TagEnum]]:
+    """
+    This function converts an array of tag masks back to sets of tags.
+    :param masks: Array or iterable of tag masks.
+    :returns: A list with the set of tags of every mask.
+    """
+    return [TagMask(int(mask)).to_tags() for mask in masks]
+
+
+def get_tag_counts(masks: np.ndarray) -> dict[TagEnum, int]:
+    """
+    This function counts how many masks of an array contain every tag.
+    :param masks: Array of tag masks as returned by `get_tag_mask_array`.
+    :returns: A dictionary mapping every tag to the number of masks containing it.
+    """
+    masks = np.asarray(masks, dtype=np.uint64)
+    return {tag: int(np.count_nonzero(masks & np.uint64(TAG_BITS[tag]))) for tag in TAGS_BY_POSITION}
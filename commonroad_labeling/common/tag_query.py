@@ -0,0 +1,294 @@
+import re
+from abc import ABC, abstractmethod
+
+from commonroad_labeling.common.tag import TagEnum, TagGroupEnum, enum_delimiter
+
+
+class TagQuery(ABC):
+    """
+    This is an abstract class for boolean queries over the tags of a scenario. Queries can be combined with the
+    operators `&` (AND), `|` (OR) and `~` (NOT) or parsed from text with `parse_tag_query`.
+    """
+
+    def __and__(self, other: "TagQuery") -> "TagQuery":
+        return TagQueryAnd([self, other])
+
+    def __or__(self, other: "TagQuery") -> "TagQuery":
+        return TagQueryOr([self, other])
+
+    def __invert__(self) -> "TagQuery":
+        return TagQueryNot(self)
+
+    @abstractmethod
+    def evaluate(self, tags: set[TagEnum]) -> bool:
+        """
+        This method checks whether the given tags fulfill the query.
+        :param tags: Set of tags of a scenario.
+        :returns: True if the tags fulfill the query, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def evaluate_partial(self, tags: set[TagEnum], decided_tags: set[TagEnum]) -> bool | None:
+        """
+        This method evaluates the query with three-valued logic on partially detected tags of a scenario, e.g. while
+        detectors are still being executed.
+        :param tags: Set of tags detected so far.
+        :param decided_tags: Set of tags whose detectors have been executed, i.e. tags that are known to be absent if
+        they are not contained in `tags`.
+        :returns: True or False if the query is fulfilled or not fulfilled regardless of the undecided tags, `None` if
+        the result depends on undecided tags.
+        """
+        pass
+
+    @abstractmethod
+    def get_tags(self) -> set[TagEnum]:
+        """
+        This method returns all tags the query depends on.
+        :returns: A set of tags.
+        """
+        pass
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and vars(self) == vars(other)
+
+    def __hash__(self) -> int:
+        return hash(repr(self))
+
+
+class TagQueryTags(TagQuery):
+    """
+    Query that is fulfilled if a scenario has any of the given tags, e.g. a single tag or all tags of a group.
+    """
+
+    def __init__(self, tags: set[TagEnum], name: str):
+        """
+        Initializes the query with the given tags.
+        :param tags: Tags of which at least one has to be detected.
+        :param name: Name of the query used for its string representation.
+        """
+        self.tags = frozenset(tags)
+        self.name = name
+
+    def evaluate(self, tags: set[TagEnum]) -> bool:
+        return not self.tags.isdisjoint(tags)
+
+    def evaluate_partial(self, tags: set[TagEnum], decided_tags: set[TagEnum]) -> bool | None:
+        if not self.tags.isdisjoint(tags):
+            return True
+        if self.tags.issubset(decided_tags):
+            return False
+        return None
+
+    def get_tags(self) -> set[TagEnum]:
+        return set(self.tags)
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class TagQueryAnd(TagQuery):
+    """
+    Query that is fulfilled if all of its operands are fulfilled.
+    """
+
+    def __init__(self, operands: list[TagQuery]):
+        """
+        Initializes the query with the given operands.
+        :param operands: Queries that have to be fulfilled.
+        """
+        self.operands = [
+            nested_operand
+            for operand in operands
+            for nested_operand in (operand.operands if isinstance(operand, TagQueryAnd) else [operand])
+        ]
+
+    def evaluate(self, tags: set[TagEnum]) -> bool:
+        return all(operand.evaluate(tags) for operand in self.operands)
+
+    def evaluate_partial(self, tags: set[TagEnum], decided_tags: set[TagEnum]) -> bool | None:
+        result = True
+        for operand in self.operands:
+            operand_result = operand.evaluate_partial(tags, decided_tags)
+            if operand_result is False:
+                return False
+            if operand_result is None:
+                result = None
+        return result
+
+    def get_tags(self) -> set[TagEnum]:
+        return set().union(*(operand.get_tags() for operand in self.operands))
+
+    def __repr__(self) -> str:
+        return "(" + " AND ".join(repr(operand) for operand in self.operands) + ")"
+
+
+class TagQueryOr(TagQuery):
+    """
+    Query that is fulfilled if any of its operands is fulfilled.
+    """
+
+    def __init__(self, operands: list[TagQuery]):
+        """
+        Initializes the query with the given operands.
+        :param operands: Queries of which at least one has to be fulfilled.
+        """
+        self.operands = [
+            nested_operand
+            for operand in operands
+            for nested_operand in (operand.operands if isinstance(operand, TagQueryOr) else [operand])
+        ]
+
+    def evaluate(self, tags: set[TagEnum]) -> bool:
+        return any(operand.evaluate(tags) for operand in self.operands)
+
+    def evaluate_partial(self, tags: set[TagEnum], decided_tags: set[TagEnum]) -> bool | None:
+        result = False
+        for operand in self.operands:
+            operand_result = operand.evaluate_partial(tags, decided_tags)
+            if operand_result is True:
+                return True
+            if operand_result is None:
+                result = None
+        return result
+
+    def get_tags(self) -> set[TagEnum]:
+        return set().union(*(operand.get_tags() for operand in self.operands))
+
+    def __repr__(self) -> str:
+        return "(" + " OR ".join(repr(operand) for operand in self.operands) + ")"
+
+
+class TagQueryNot(TagQuery):
+    """
+    Query that is fulfilled if its operand is not fulfilled.
+    """
+
+    def __init__(self, operand: TagQuery):
+        """
+        Initializes the query with the given operand.
+        :param operand: Query that must not be fulfilled.
+        """
+        self.operand = operand
+
+    def evaluate(self, tags: set[TagEnum]) -> bool:
+        return not self.operand.evaluate(tags)
+
+    def evaluate_partial(self, tags: set[TagEnum], decided_tags: set[TagEnum]) -> bool | None:
+        result = self.operand.evaluate_partial(tags, decided_tags)
+        return None if result is None else not result
+
+    def get_tags(self) -> set[TagEnum]:
+        return self.operand.get_tags()
+
+    def __repr__(self) -> str:
+        return "NOT " + repr(self.operand)
+
+
+def has_tag(tag_enum: TagEnum) -> TagQuery:
+    """
+    This function creates a query that is fulfilled if a scenario has the given tag.
+    :param tag_enum: Tag that has to be detected.
+    :returns: A `TagQuery`.
+    """
+    return TagQueryTags({tag_enum}, tag_enum.name)
+
+
+def has_group(tag_group: TagGroupEnum) -> TagQuery:
+    """
+    This function creates a query that is fulfilled if a scenario has any tag of the given group.
+    :param tag_group: Group of which at least one tag has to be detected.
+    :returns: A `TagQuery`.
+    """
+    return TagQueryTags(get_tags_of_group(tag_group), tag_group.name)
+
+
+def get_tags_of_group(tag_group: TagGroupEnum) -> set[TagEnum]:
+    """
+    This function returns all tags of a tag group.
+    :param tag_group: Group of tags.
+    :returns: A set of tags whose value starts with the value of the group.
+    """
+    return {tag_enum for tag_enum in TagEnum if tag_enum.value.startswith(tag_group.value)}
+
+
+def resolve_tag_query_name(name: str) -> TagQuery:
+    """
+    This function resolves a name used in a textual query. Names can be given case-insensitively as names or values of
+    `TagEnum` or `TagGroupEnum` members, e.g. `SCENARIO_LANELET_LAYOUT_INTERSECTION`,
+    `scenario_lanelet_layout|intersection` or `ROUTE_OBSTACLE`, or as the part of a tag value after the group, e.g.
+    `intersection`, which matches the tag of every group with that name.
+    :param name: Name of a tag or tag group.
+    :returns: A `TagQuery` for the tag or group.
+    :raises ValueError: If no tag or group has the given name.
+    """
+    for tag_enum in TagEnum:
+        if name.upper() == tag_enum.name or name.lower() == tag_enum.value:
+            return has_tag(tag_enum)
+
+    for tag_group in TagGroupEnum:
+        if name.upper() == tag_group.name or name.lower() in (tag_group.value, tag_group.value[: -len(enum_delimiter)]):
+            return has_group(tag_group)
+
+    matching_tags = {tag_enum for tag_enum in TagEnum if tag_enum.value.split(enum_delimiter)[-1] == name.lower()}
+    if not matching_tags:
+        raise ValueError(f"Unknown tag or tag group '{name}'.")
+    return TagQueryTags(matching_tags, name.lower())
+
+
+_token_pattern = re.compile(r"\s*(\(|\)|[^\s()]+)")
+
+
+def parse_tag_query(text: str) -> TagQuery:
+    """
+    This function parses a textual query with the operators `AND`, `OR` and `NOT` and parentheses, e.g.
+    `intersection AND turn_left AND NOT traffic_light`. `NOT` binds stronger than `AND`, which binds stronger than
+    `OR`. Operators are case-insensitive, names of tags and groups are resolved by `resolve_tag_query_name`.
+    :param text: Textual query.
+    :returns: The parsed `TagQuery`.
+    :raises ValueError: If the query is malformed or contains unknown names.
+    """
+    tokens = _token_pattern.findall(text)
+    position = 0
+
+    def peek() -> str | None:
+        return tokens[position].upper() if position < len(tokens) else None
+
+    def parse_or() -> TagQuery:
+        nonlocal position
+        operands = [parse_and()]
+        while peek() == "OR":
+            position += 1
+            operands.append(parse_and())
+        return operands[0] if len(operands) == 1 else TagQueryOr(operands)
+
+    def parse_and() -> TagQuery:
+        nonlocal position
+        operands = [parse_not()]
+        while peek() == "AND":
+            position += 1
+            operands.append(parse_not())
+        return operands[0] if len(operands) == 1 else TagQueryAnd(operands)
+
+    def parse_not() -> TagQuery:
+        nonlocal position
+        token = peek()
+        if token == "NOT":
+            position += 1
+            return TagQueryNot(parse_not())
+        if token == "(":
+            position += 1
+            query = parse_or()
+            if peek() != ")":
+                raise ValueError(f"Missing closing parenthesis in query '{text}'.")
+            position += 1
+            return query
+        if token is None or token in ("AND", "OR", ")"):
+            raise ValueError(f"Unexpected {'end' if token is None else repr(token)} in query '{text}'.")
+        position += 1
+        return resolve_tag_query_name(tokens[position - 1])
+
+    query = parse_or()
+    if position < len(tokens):
+        raise ValueError(f"Unexpected '{tokens[position]}' in query '{text}'.")
+    return query
@@ -17,7 +17,7 @@ def print_scenario_tags(path: Path, tags: set[TagEnum] | None):
     )
 
 
-def print_parsing_error(path: Path, exception: Exception):
+def print_parsing_error(path: Path, exception: Exception | str):
     print(
         ("{0:-<50}".format(path.name + ":  ") + "------ "),
         "Error occurred while parsing CommonRoad XML file:",
@@ -2,34 +2,26 @@ import copy
 
 import numpy as np
 import pandas as pd
-from commonroad_crime.measure import DCE, ET, HW, PET, THW, TTC, TTCE, TTK, TTR, TTZ, WTTC, WTTR, ALongReq, TTCStar
-from sklearn.feature_selection import VarianceThreshold
-from sklearn.preprocessing import MinMaxScaler
 
 from commonroad_labeling.criticality.input_output.crime_output import ScenarioCriticalityData
 
-# TODO Could be automatically checked like this, but not all CriMe metrics have individual monotonicity specified
-#  (for example TTK, TTZ, WTTR) so manual review is safer until it is double checked that all metrics in CriMe have
-#  correct monotonicity assigned
-# for name, obj in inspect.getmembers(commonroad_crime.measure):
-#     if inspect.isclass(obj) and issubclass(obj, CriMeBase) and obj.monotone == TypeMonotone.NEG:
-#         print(name)
-NEGATIVE_MONOTONE_METRICS = [
-    ALongReq,
-    DCE,
-    HW,
-    ET,
-    PET,
-    THW,
-    TTC,
-    TTCStar,
-    TTCE,
-    TTK,
-    TTR,
-    TTZ,
-    WTTC,
-    WTTR,
-]
+
+def get_negative_monotone_metrics() -> list[type]:
+    """
+    Returns the CMs that have a negative monotonic relationship with criticality. CommonRoad-CriMe imports matplotlib,
+    so that it is only imported when the metrics are used and not when CriMe output files are analyzed.
+    :return: A list of the CriMe metric classes.
+    """
+    from commonroad_crime.measure import DCE, ET, HW, PET, THW, TTC, TTCE, TTK, TTR, TTZ, WTTC, WTTR, ALongReq, TTCStar
+
+    # TODO Could be automatically checked like this, but not all CriMe metrics have individual monotonicity specified
+    #  (for example TTK, TTZ, WTTR) so manual review is safer until it is double checked that all metrics in CriMe have
+    #  correct monotonicity assigned
+    # for name, obj in inspect.getmembers(commonroad_crime.measure):
+    #     if inspect.isclass(obj) and issubclass(obj, CriMeBase) and obj.monotone == TypeMonotone.NEG:
+    #         print(name)
+    return [ALongReq, DCE, HW, ET, PET, THW, TTC, TTCStar, TTCE, TTK, TTR, TTZ, WTTC, WTTR]
+
 
 METADATA_COLUMN_NAMES = ["scenario_id", "ego_id", "timestep"]
 
@@ -106,6 +98,8 @@ def variance_chooser(df, variance_threshold: float, verbose=True):
     :param verbose: A boolean flag to indicate whether to print the names of the removed features.
     :return: A tuple containing the dataframe with selected features and a list of removed feature names.
     """
+    from sklearn.feature_selection import VarianceThreshold
+
     sel = VarianceThreshold(threshold=variance_threshold)
     sel.fit(df)
     selected_features_mask = sel.get_support()
@@ -134,7 +128,7 @@ def monotonicity_adjustment(df):
     """
     inverted_df = df.copy()
     contained_neg_scale_metric_names = [
-        metric.measure_name for metric in NEGATIVE_MONOTONE_METRICS if metric.measure_name in inverted_df.columns
+        metric.measure_name for metric in get_negative_monotone_metrics() if metric.measure_name in inverted_df.columns
     ]
     inverted_df.loc[:, [metric for metric in contained_neg_scale_metric_names]] = (
         1 - inverted_df.loc[:, [metric for metric in contained_neg_scale_metric_names]]
@@ -355,6 +349,8 @@ def min_max_scale_df(df) -> pd.DataFrame:
     :param df: The DataFrame to be min-max scaled. Can contain infinite values which will be replaced before scaling.
     :return: A new DataFrame with values scaled to the range [0, 1] using min-max scaling.
     """
+    from sklearn.preprocessing import MinMaxScaler
+
     scaler = MinMaxScaler()
     normalized_df = df.copy()
     # Need to replace infinite values as they will become NaN after scaling otherwise
@@ -4,15 +4,17 @@ import traceback
 from datetime import datetime
 from multiprocessing import Pool
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from commonroad.common.file_reader import CommonRoadFileReader
 from commonroad.scenario.scenario import Scenario
-from commonroad_crime.data_structure.base import CriMeBase
-from commonroad_crime.data_structure.configuration import CriMeConfiguration
-from commonroad_crime.data_structure.crime_interface import CriMeInterface
 
 from commonroad_labeling.criticality.computer.crit_util import compute_center_lanelet, find_egos_from_problem_sets
-from commonroad_labeling.criticality.trajectory_inserter.trajectory_inserter import TrajectoryInserter
+
+if TYPE_CHECKING:
+    # CommonRoad-CriMe and Reactive Planner import matplotlib, so that they are only imported when metrics are computed
+    from commonroad_crime.data_structure.base import CriMeBase
+    from commonroad_crime.data_structure.configuration import CriMeConfiguration
 
 
 class CMComputer:
@@ -22,7 +24,7 @@ class CMComputer:
 
     def __init__(
         self,
-        metrics: list[type[CriMeBase]],
+        metrics: list[type["CriMeBase"]],
         verbose=True,
         crime_verbose=False,
         overwrite=True,
@@ -70,6 +72,8 @@ class CMComputer:
         scenario, planning_problem_set = CommonRoadFileReader(scenario_path).open()
 
         if ego_id is None:
+            from commonroad_labeling.criticality.trajectory_inserter.trajectory_inserter import TrajectoryInserter
+
             inserter = TrajectoryInserter(
                 save_plots=save_plots,
                 show_plots=show_plots,
@@ -95,6 +99,8 @@ class CMComputer:
         :param output_dir: The directory path where output files will be saved, defaults to an
             "output" directory in the current working directory.
         """
+        from commonroad_crime.data_structure.crime_interface import CriMeInterface
+
         config = self.create_crime_config(scenario_with_ego, ego_id, scenario_path)
 
         ego_obstacle = scenario_with_ego.obstacle_by_id(ego_id)
@@ -263,7 +269,7 @@ class CMComputer:
                 f"{scenario_path}, for ego_id {ego_id}.\n {traceback.format_exc()}"
             )
 
-    def create_crime_config(self, scenario_with_ego: Scenario, ego_id: int, scenario_path: str) -> CriMeConfiguration:
+    def create_crime_config(self, scenario_with_ego: Scenario, ego_id: int, scenario_path: str) -> "CriMeConfiguration":
         """
         Creates a CriMeConfiguration object necessary for CriMe to function.
         :param scenario_with_ego: The scenario object containing the trajectory of the ego vehicle.
@@ -271,6 +277,8 @@ class CMComputer:
         :param scenario_path: The path to the scenario file.
         :return: An instance of CriMeConfiguration configured based on the provided parameters.
         """
+        from commonroad_crime.data_structure.configuration import CriMeConfiguration
+
         config = CriMeConfiguration()
         config.general.name_scenario = str(scenario_with_ego.scenario_id)
         path_split = scenario_path.rsplit("/", 1)
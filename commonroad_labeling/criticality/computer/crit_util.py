@@ -1,5 +1,7 @@
 from commonroad.common.file_reader import CommonRoadFileReader
 
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_index
+
 """
     Provides utility functions necessary to compute the CMs of scenarios.
 """
@@ -27,7 +29,9 @@ def compute_center_lanelet(ego_trajectory, scenario_with_ego):
     ego_center_lanelet_dict = dict(
         zip(
             [state.time_step for state in ego_trajectory],
-            scenario_with_ego.lanelet_network.find_lanelet_by_position([state.position for state in ego_trajectory]),
+            get_lanelet_network_index(scenario_with_ego.lanelet_network).spatial_index.query_lanelet_id_lists(
+                [state.position for state in ego_trajectory]
+            ),
         )
     )
     return ego_center_lanelet_dict
@@ -14,7 +14,8 @@ from commonroad_rp.reactive_planner import ReactivePlanner
 from commonroad_rp.state import ReactivePlannerState
 from commonroad_rp.utility.config import ReactivePlannerConfiguration
 from commonroad_rp.utility.logger import initialize_logger
-from commonroad_rp.utility.visualization import make_gif, visualize_planner_at_timestep
+
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_index
 
 
 class TrajectoryInserter:
@@ -60,7 +61,7 @@ class TrajectoryInserter:
         ego_center_lanelet_dict = dict(
             zip(
                 [state.time_step for state in ego_rp_trajectory],
-                scenario_with_ego.lanelet_network.find_lanelet_by_position(
+                get_lanelet_network_index(scenario_with_ego.lanelet_network).spatial_index.query_lanelet_id_lists(
                     [state.position for state in ego_rp_trajectory]
                 ),
             )
@@ -179,6 +180,8 @@ class TrajectoryInserter:
 
             # visualize the current time step of the simulation
             if config.debug.show_plots or config.debug.save_plots:
+                from commonroad_rp.utility.visualization import visualize_planner_at_timestep
+
                 visualize_planner_at_timestep(
                     scenario=config.scenario,
                     planning_problem=config.planning_problem,
@@ -191,6 +194,8 @@ class TrajectoryInserter:
 
         # make gif
         if self.make_gif:
+            from commonroad_rp.utility.visualization import make_gif
+
             make_gif(config, range(0, planner.record_state_list[-1].time_step))
 
         return planner.record_state_list, planner.vehicle_params
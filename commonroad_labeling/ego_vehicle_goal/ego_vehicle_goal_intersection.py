@@ -1,8 +1,8 @@
 from commonroad.scenario.scenario import Scenario
-from commonroad_route_planner.reference_path import ReferencePath
 
+from commonroad_labeling.common.lanelet_network_index import IntersectionManeuver, get_lanelet_network_index
+from commonroad_labeling.common.route import Route
 from commonroad_labeling.common.tag import EgoVehicleGoalTag, TagEnum
-from commonroad_labeling.road_configuration.scenario.scenario_lanelet_layout import LaneletLayoutIntersection
 
 
 class EgoVehicleGoalIntersectionTurnLeft(EgoVehicleGoalTag):
@@ -10,7 +10,7 @@ class EgoVehicleGoalIntersectionTurnLeft(EgoVehicleGoalTag):
     This class is used to detect whether the ego vehicle turns left in any of the intersections of a given scenario.
     """
 
-    def __init__(self, reference_path: ReferencePath, scenario: Scenario):
+    def __init__(self, reference_path: Route, scenario: Scenario):
         """
         Initializes the class with the given route.
         :param route: Specifies a route that an ego vehicle could take for a given scenario and is passed to the
@@ -21,22 +21,14 @@ class EgoVehicleGoalIntersectionTurnLeft(EgoVehicleGoalTag):
 
     def is_fulfilled(self) -> bool:
         """
-        This method iterates through lanelets obtained by calling the following method
-        `common.tag.RouteTag.get_route_lanelets` and checks whether any lanelet is contained in any
-        of the left turns of any intersection of the given scenario.
+        This method collects the intersection maneuvers of all route lanelets in a single pass, which is shared by all
+        intersection detectors evaluating the same route, and checks whether any lanelet is contained in any of the
+        left turns of any intersection of the given scenario.
         :returns: Boolean value indicating if the ego vehicle performs this turn in a given scenario intersection.
         """
-
-        lanelets = self.get_route_lanelets()
-        for lanelet in lanelets:
-            intersection = LaneletLayoutIntersection(self.scenario).get_intersection_by_lanelet_id(lanelet.lanelet_id)
-
-            if intersection is not None:
-                for incoming in intersection.incomings:
-                    if lanelet.lanelet_id in incoming.successors_left:
-                        return True
-
-        return False
+        return IntersectionManeuver.LEFT in get_lanelet_network_index(
+            self.scenario.lanelet_network
+        ).get_route_intersection_maneuvers(self.route.lanelet_ids)
 
     def get_tag(self) -> TagEnum:
         """
@@ -51,7 +43,7 @@ class EgoVehicleGoalIntersectionTurnRight(EgoVehicleGoalTag):
     This class is used to detect whether the ego vehicle turns right in any of the intersections of a given scenario.
     """
 
-    def __init__(self, reference_path: ReferencePath, scenario: Scenario):
+    def __init__(self, reference_path: Route, scenario: Scenario):
         """
         Initializes the class with the given route.
         :param route: Specifies a route that an ego vehicle could take for a given scenario and is passed to the
@@ -61,22 +53,14 @@ class EgoVehicleGoalIntersectionTurnRight(EgoVehicleGoalTag):
 
     def is_fulfilled(self) -> bool:
         """
-        This method iterates through lanelets obtained by calling the following method
-        `common.tag.RouteTag.get_route_lanelets` and checks whether any lanelet is contained in any
-        of the right turns of any intersection of the given scenario.
+        This method collects the intersection maneuvers of all route lanelets in a single pass, which is shared by all
+        intersection detectors evaluating the same route, and checks whether any lanelet is contained in any of the
+        right turns of any intersection of the given scenario.
         :returns: Boolean value indicating if the ego vehicle performs this turn in a given scenario intersection.
         """
-
-        lanelets = self.get_route_lanelets()
-        for lanelet in lanelets:
-            intersection = LaneletLayoutIntersection(self.scenario).get_intersection_by_lanelet_id(lanelet.lanelet_id)
-
-            if intersection is not None:
-                for incoming in intersection.incomings:
-                    if lanelet.lanelet_id in incoming.successors_right:
-                        return True
-
-        return False
+        return IntersectionManeuver.RIGHT in get_lanelet_network_index(
+            self.scenario.lanelet_network
+        ).get_route_intersection_maneuvers(self.route.lanelet_ids)
 
     def get_tag(self) -> TagEnum:
         """
@@ -92,7 +76,7 @@ class EgoVehicleGoalIntersectionProceedStraight(EgoVehicleGoalTag):
     a given scenario.
     """
 
-    def __init__(self, reference_path: ReferencePath, scenario: Scenario):
+    def __init__(self, reference_path: Route, scenario: Scenario):
         """
         Initializes the class with the given route.
         :param route: specifies a route that an ego vehicle could take for a given scenario and is passed to the
@@ -102,21 +86,14 @@ class EgoVehicleGoalIntersectionProceedStraight(EgoVehicleGoalTag):
 
     def is_fulfilled(self) -> bool:
         """
-        This method iterates through lanelets obtained by calling the following method
-        `common.tag.RouteTag.get_route_lanelets` and checks whether any lanelet is contained in any
-        of the straight proceedings of any intersection of the given scenario.
+        This method collects the intersection maneuvers of all route lanelets in a single pass, which is shared by all
+        intersection detectors evaluating the same route, and checks whether any lanelet is contained in any of the
+        straight proceedings of any intersection of the given scenario.
         :returns: Boolean value indicating if the ego vehicle performs this maneuver in a given scenario intersection.
         """
-        lanelets = self.get_route_lanelets()
-        for lanelet in lanelets:
-            intersection = LaneletLayoutIntersection(self.scenario).get_intersection_by_lanelet_id(lanelet.lanelet_id)
-
-            if intersection is not None:
-                for incoming in intersection.incomings:
-                    if lanelet.lanelet_id in incoming.successors_straight:
-                        return True
-
-        return False
+        return IntersectionManeuver.STRAIGHT in get_lanelet_network_index(
+            self.scenario.lanelet_network
+        ).get_route_intersection_maneuvers(self.route.lanelet_ids)
 
     def get_tag(self) -> TagEnum:
         """
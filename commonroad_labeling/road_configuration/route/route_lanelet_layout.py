@@ -1,6 +1,6 @@
 from commonroad.scenario.scenario import Scenario
-from commonroad_route_planner.reference_path import ReferencePath
 
+from commonroad_labeling.common.route import Route
 from commonroad_labeling.common.tag import RouteTag, TagEnum
 from commonroad_labeling.road_configuration.scenario.scenario_lanelet_layout import (
     LaneletLayoutBidirectional,
@@ -19,7 +19,7 @@ class RouteLaneletLayoutSingleLane(RouteTag):
     This class is used to detect whether the ego vehicle should encounter a single lane road.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `LaneletLayoutSingleLane` class in order to check every lanelet of the route for
@@ -42,7 +42,7 @@ class RouteLaneletLayoutMultiLane(RouteTag):
     This class is used to detect whether the ego vehicle should encounter a multi lane road.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `LaneletLayoutMultiLane` class in order to check every lanelet of the route for
@@ -65,7 +65,7 @@ class RouteLaneletLayoutBidirectional(RouteTag):
     This class is used to detect whether the ego vehicle should encounter a bidirectional road.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `LaneletLayoutBidirectional` class in order to check every lanelet of the route for
@@ -88,7 +88,7 @@ class RouteLaneletLayoutOneWay(RouteTag):
     This class is used to detect whether the ego vehicle should encounter a one way road.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `LaneletLayoutOneWay` class in order to check every lanelet of the route for
@@ -111,7 +111,7 @@ class RouteLaneletLayoutIntersection(RouteTag):
     This class is used to detect whether the ego vehicle should encounter an intersection.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `LaneletLayoutIntersection` class in order to check every lanelet of the route for
@@ -134,7 +134,7 @@ class RouteLaneletLayoutDivergingLane(RouteTag):
     This class is used to detect whether the ego vehicle should encounter a diverging lane.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `LaneletLayoutDivergingLane` class in order to check every lanelet of the route for
@@ -157,7 +157,7 @@ class RouteLaneletLayoutMergingLane(RouteTag):
     This class is used to detect whether the ego vehicle should encounter a merging lane.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `LaneletLayoutMergingLane` class in order to check every lanelet of the route for
@@ -180,7 +180,7 @@ class RouteLaneletLayoutRoundabout(RouteTag):
     This class is used to detect whether the ego vehicle should encounter a roundabout.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `LaneletLayoutRoundabout` class in order to check every lanelet of the route for
@@ -1,6 +1,7 @@
+from commonroad.scenario.lanelet import Lanelet
 from commonroad.scenario.scenario import Scenario
-from commonroad_route_planner.reference_path import ReferencePath
 
+from commonroad_labeling.common.route import Route
 from commonroad_labeling.common.tag import RouteTag, TagEnum
 from commonroad_labeling.road_configuration.scenario.scenario_obstacle import (
     ObstacleOtherDynamic,
@@ -14,7 +15,7 @@ class RouteObstacleStatic(RouteTag):
     This class is used to detect whether the ego vehicle should encounter static obstacles.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `ObstacleStatic` class in order to check every lanelet of the route for
@@ -38,7 +39,7 @@ class RouteObstacleOtherDynamic(RouteTag):
     that cannot be classified as traffic).
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `ObstacleOtherDynamic` class in order to check every lanelet of the route for
@@ -61,7 +62,7 @@ class RouteTrafficAhead(RouteTag):
     This class is used to detect whether the ego vehicle should encounter traffic ahead in it's route.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `ObstacleTraffic` class in order to check every lanelet of the route for
@@ -84,7 +85,7 @@ class RouteTrafficBehind(RouteTag):
     This class is used to detect whether the ego vehicle should encounter traffic behind it in it's route.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `ObstacleTraffic` class in order to check every lanelet of the route for
@@ -94,22 +95,14 @@ class RouteTrafficBehind(RouteTag):
         """
         super().__init__(route, ObstacleTraffic(scenario))
 
-    def is_fulfilled(self) -> bool:
+    def get_checked_lanelet_ids(self, lanelet: Lanelet) -> list[int]:
         """
-        This method overrides the method `is_fulfilled` from the `common.tag.RouteTag` class. It iterates through
-        all the lanelets of a route and checks whether any predecessors of the lanelets contain traffic.
-        :returns: Boolean value indicating that the ego vehicle encounters traffic behind it.
+        This method overrides the method `get_checked_lanelet_ids` from the `common.tag.RouteTag` class, so that
+        `is_fulfilled` checks whether any predecessors of the lanelets of a route contain traffic.
+        :param lanelet: Lanelet of the route.
+        :returns: List of IDs of the predecessors of the lanelet.
         """
-        lanelets = self.get_route_lanelets()
-
-        for lanelet in lanelets:
-            for predecessor_lanelet_id in lanelet.predecessor if lanelet.predecessor is not None else []:
-                if self.scenario_tag.is_fulfilled_for_lanelet(
-                    self.route.lanelet_network.find_lanelet_by_id(predecessor_lanelet_id)
-                ):
-                    return True
-
-        return False
+        return lanelet.predecessor if lanelet.predecessor is not None else []
 
     def get_tag(self) -> TagEnum:
         """
@@ -124,7 +117,7 @@ class RouteOncomingTraffic(RouteTag):
     This class is used to detect whether the ego vehicle should encounter (no) oncoming traffic in it's route.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `ObstacleTraffic` class in order to check every lanelet of the route for
@@ -134,6 +127,31 @@ class RouteOncomingTraffic(RouteTag):
         """
         super().__init__(route, ObstacleTraffic(scenario))
 
+    def get_checked_lanelet_ids(self, lanelet: Lanelet) -> list[int]:
+        """
+        This method overrides the method `get_checked_lanelet_ids` from the `common.tag.RouteTag` class, so that
+        opposite direction adjacent lanelets of the lanelets of a route are checked for traffic.
+        :param lanelet: Lanelet of the route.
+        :returns: List of IDs of the adjacent lanelets of the lanelet with opposite driving direction.
+        """
+        return [
+            adjacent_lanelet_id
+            for adjacent_lanelet_id, same_direction in (
+                (lanelet.adj_left, lanelet.adj_left_same_direction),
+                (lanelet.adj_right, lanelet.adj_right_same_direction),
+            )
+            if adjacent_lanelet_id is not None and not same_direction
+        ]
+
+    def get_route_tag(self, fulfilled: bool) -> TagEnum | None:
+        """
+        This method overrides the method `get_route_tag` from the `common.tag.RouteTag` class, since a route without
+        oncoming traffic is labeled with `ROUTE_OBSTACLE_NO_ONCOMING_TRAFFIC` as the two are mutually exclusive.
+        :param fulfilled: Boolean value indicating whether any opposite direction adjacent lanelet contains traffic.
+        :returns: `TagEnum` value `ROUTE_OBSTACLE_ONCOMING_TRAFFIC` or `ROUTE_OBSTACLE_NO_ONCOMING_TRAFFIC`.
+        """
+        return TagEnum.ROUTE_OBSTACLE_ONCOMING_TRAFFIC if fulfilled else TagEnum.ROUTE_OBSTACLE_NO_ONCOMING_TRAFFIC
+
     def is_fulfilled(self) -> bool:
         """
         This method overrides the method `is_fulfilled` from the `common.tag.RouteTag` class. It iterates through
@@ -142,24 +160,7 @@ class RouteOncomingTraffic(RouteTag):
         the two are mutually exclusive.
         :returns: Always returns True (changes `tag` attribute value as a side effect).
         """
-        lanelets = self.get_route_lanelets()
-        for lanelet in lanelets:
-            if (
-                lanelet.adj_left is not None
-                and not lanelet.adj_left_same_direction
-                and self.scenario_tag.is_fulfilled_for_lanelet(
-                    self.route.lanelet_network.find_lanelet_by_id(lanelet.adj_left)
-                )
-            ) or (
-                lanelet.adj_right is not None
-                and not lanelet.adj_right_same_direction
-                and self.scenario_tag.is_fulfilled_for_lanelet(
-                    self.route.lanelet_network.find_lanelet_by_id(lanelet.adj_right)
-                )
-            ):
-                return True
-
-        self.tag = TagEnum.ROUTE_OBSTACLE_NO_ONCOMING_TRAFFIC
+        self.tag = self.get_route_tag(super().is_fulfilled())
         return True
 
     def get_tag(self) -> TagEnum:
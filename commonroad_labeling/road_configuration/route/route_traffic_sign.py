@@ -1,6 +1,6 @@
 from commonroad.scenario.scenario import Scenario
-from commonroad_route_planner.reference_path import ReferencePath
 
+from commonroad_labeling.common.route import Route
 from commonroad_labeling.common.tag import RouteTag, TagEnum
 from commonroad_labeling.road_configuration.scenario.scenario_traffic_sign import (
     TrafficSignNoRightOfWay,
@@ -16,7 +16,7 @@ class RouteTrafficSignSpeedLimit(RouteTag):
     This class is used to detect whether the ego vehicle should encounter speed limit traffic signs.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `TrafficSignSpeedLimit` class in order to check every lanelet of the route for
@@ -39,7 +39,7 @@ class RouteTrafficSignRightOfWay(RouteTag):
     This class is used to detect whether the ego vehicle should encounter right of way traffic signs.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `TrafficSignRightOfWay` class in order to check every lanelet of the route for
@@ -62,7 +62,7 @@ class RouteTrafficSignNoRightOfWay(RouteTag):
     This class is used to detect whether the ego vehicle should encounter no right of way traffic signs.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `TrafficSignNoRightOfWay` class in order to check every lanelet of the route for
@@ -85,7 +85,7 @@ class RouteTrafficSignStopLine(RouteTag):
     This class is used to detect whether the ego vehicle should encounter stop lines.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `TrafficSignStopLine` class in order to check every lanelet of the route for
@@ -108,7 +108,7 @@ class RouteTrafficSignTrafficLight(RouteTag):
     This class is used to detect whether the ego vehicle should encounter traffic lights.
     """
 
-    def __init__(self, route: ReferencePath, scenario: Scenario):
+    def __init__(self, route: Route, scenario: Scenario):
         """
         Initializes the class with the given route and initializes the `scenario_tag` attribute with
         an instance of `TrafficSignTrafficLight` class in order to check every lanelet of the route for
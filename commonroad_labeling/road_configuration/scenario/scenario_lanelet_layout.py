@@ -2,6 +2,7 @@ from commonroad.scenario.intersection import Intersection
 from commonroad.scenario.lanelet import Lanelet
 from commonroad.scenario.scenario import Scenario
 
+from commonroad_labeling.common.lanelet_network_index import get_intersection_lanelet_ids
 from commonroad_labeling.common.tag import ScenarioTag, TagEnum
 
 
@@ -176,67 +177,13 @@ class LaneletLayoutOneWay(ScenarioTag):
     def is_fulfilled_for_lanelet(self, lanelet: Lanelet) -> bool:
         """
         This method overrides the abstract method `is_fulfilled_for_lanelet` from the `common.tag.ScenarioTag` class.
-        It checks whether the provided lanelet has only adjacent lanelets in the same direction.
+        It checks whether the provided lanelet and all lanelets that are (transitively) adjacent to it lead in the
+        same direction. The road cross-sections formed by adjacent lanelets are computed once for the whole lanelet
+        network, so that the check is a lookup of the cross-section of the lanelet.
         :param lanelet: Lanelet that is to be checked whether it satisfies conditions to be a one way road.
         :returns: True if the lanelet is part of a one way road, False otherwise.
         """
-
-        is_one_way = True
-        if lanelet.adj_left_same_direction is None or lanelet.adj_left_same_direction:
-            is_one_way = is_one_way and self.adj_lanelet_has_same_dir_neighbors_or_none(
-                lanelet.adj_left, [lanelet.lanelet_id]
-            )
-        else:
-            is_one_way = False
-
-        if lanelet.adj_right_same_direction is None or lanelet.adj_right_same_direction:
-            is_one_way = is_one_way and self.adj_lanelet_has_same_dir_neighbors_or_none(
-                lanelet.adj_right, [lanelet.lanelet_id]
-            )
-        else:
-            is_one_way = False
-
-        if is_one_way:
-            return True
-
-        return False
-
-    def adj_lanelet_has_same_dir_neighbors_or_none(self, lanelet_id: int, previous_lanelet_ids: list[int]) -> bool:
-        """
-        This method is a recursive helper method to determine whether the current lanelet has either no adjacent
-        lanelets or lanelets that only have the same direction.
-        :param lanelet_id: ID of the current lanelet that is checked.
-        :param previous_lanelet_ids: IDs of the lanelets that have already been checked (in order to avoid infinite
-        calls)
-        :returns: True if the lanelet has only same direction adjacent lanelets or none at all, False otherwise.
-        """
-
-        if lanelet_id is None:
-            return True
-        for lanelet in self.scenario.lanelet_network.lanelets:
-            if lanelet.lanelet_id == lanelet_id:
-                is_one_way = True
-                if lanelet.adj_left_same_direction is None or (
-                    lanelet.adj_left not in previous_lanelet_ids and lanelet.adj_left_same_direction
-                ):
-                    is_one_way = is_one_way and self.adj_lanelet_has_same_dir_neighbors_or_none(
-                        lanelet.adj_left, [*previous_lanelet_ids, lanelet.lanelet_id]
-                    )
-                elif lanelet.adj_left not in previous_lanelet_ids:
-                    is_one_way = False
-
-                if lanelet.adj_right_same_direction is None or (
-                    lanelet.adj_right not in previous_lanelet_ids and lanelet.adj_right_same_direction
-                ):
-                    is_one_way = is_one_way and self.adj_lanelet_has_same_dir_neighbors_or_none(
-                        lanelet.adj_right, [*previous_lanelet_ids, lanelet.lanelet_id]
-                    )
-                elif lanelet.adj_right not in previous_lanelet_ids:
-                    is_one_way = False
-
-                return is_one_way
-
-        return True
+        return self.lanelet_network_index.is_one_way(lanelet.lanelet_id)
 
     def get_tag(self) -> TagEnum:
         """
@@ -274,11 +221,7 @@ class LaneletLayoutIntersection(ScenarioTag):
         :param lanelet: Lanelet that is to be checked whether it satisfies conditions to be part of an intersection.
         :returns: True if the lanelet is part of an intersection, False otherwise.
         """
-
-        for intersection in self.scenario.lanelet_network.intersections:
-            if lanelet.lanelet_id in self.get_intersection_lanelet_ids(intersection):
-                return True
-        return False
+        return lanelet.lanelet_id in self.lanelet_network_index.intersection_lanelet_ids
 
     def get_intersection_lanelet_ids(self, intersection: Intersection) -> set[int]:
         """
@@ -286,18 +229,7 @@ class LaneletLayoutIntersection(ScenarioTag):
         :param intersection: Intersection used to extract lanelet IDs.
         :returns: A set of lanelet IDs in a given intersection.
         """
-
-        lanelets = set()
-        for intersection_incoming in intersection.incomings:
-            lanelets = lanelets.union(intersection_incoming.incoming_lanelets)
-            if intersection_incoming.successors_left is not None:
-                lanelets = lanelets.union(intersection_incoming.successors_left)
-            if intersection_incoming.successors_right is not None:
-                lanelets = lanelets.union(intersection_incoming.successors_right)
-            if intersection_incoming.successors_straight is not None:
-                lanelets = lanelets.union(intersection_incoming.successors_straight)
-
-        return lanelets
+        return get_intersection_lanelet_ids(intersection)
 
     def get_intersection_by_lanelet_id(self, lanelet_id: int) -> Intersection | None:
         """
@@ -305,11 +237,7 @@ class LaneletLayoutIntersection(ScenarioTag):
         :param lanelet_id: Lanelet ID that should be with in a scenario intersection.
         :returns: An `Intersection` if a lanelet with the given ID is within it, `None` otherwise.
         """
-
-        for intersection in self.scenario.lanelet_network.intersections:
-            if lanelet_id in self.get_intersection_lanelet_ids(intersection):
-                return intersection
-        return None
+        return self.lanelet_network_index.get_intersection_by_lanelet_id(lanelet_id)
 
     def get_tag(self) -> TagEnum:
         """
@@ -356,7 +284,7 @@ class LaneletLayoutDivergingLane(ScenarioTag):
         if (
             lanelet.successor is not None
             and len(lanelet.successor) > 1
-            and not LaneletLayoutIntersection(self.scenario).is_fulfilled_for_lanelet(lanelet)
+            and lanelet.lanelet_id not in self.lanelet_network_index.intersection_lanelet_ids
         ):
             return True
         return False
@@ -406,7 +334,7 @@ class LaneletLayoutMergingLane(ScenarioTag):
         if (
             lanelet.predecessor is not None
             and len(lanelet.predecessor) > 1
-            and not LaneletLayoutIntersection(self.scenario).is_fulfilled_for_lanelet(lanelet)
+            and lanelet.lanelet_id not in self.lanelet_network_index.intersection_lanelet_ids
         ):
             return True
         return False
@@ -434,57 +362,23 @@ class LaneletLayoutRoundabout(ScenarioTag):
 
     def is_fulfilled(self) -> bool:
         """
-        This method overrides the abstract method `is_fulfilled` from the `common.tag.Tag` class. It iterates through
-        all the lanelets of a scenario and checks whether the conditions are fulfilled for any lanelet to be a
-        part of a roundabout.
+        This method overrides the abstract method `is_fulfilled` from the `common.tag.Tag` class. It checks whether
+        the successor graph of the lanelet network contains a cycle, as every lanelet on a cycle is part of a
+        roundabout.
         :returns: Boolean value indicating that a scenario contains a roundabout.
         """
-        for lanelet in self.scenario.lanelet_network.lanelets:
-            is_fulfilled = self.is_fulfilled_for_lanelet(lanelet)
-            if is_fulfilled:
-                return True
-        return False
+        return len(self.lanelet_network_index.cyclic_lanelet_ids) > 0
 
     def is_fulfilled_for_lanelet(self, lanelet: Lanelet) -> bool:
         """
         This method overrides the abstract method `is_fulfilled_for_lanelet` from the `common.tag.ScenarioTag` class.
-        It checks whether the provided lanelet is in a roundabout.
+        It checks whether the provided lanelet is in a roundabout, i.e. whether a loop of lanelets can be reached by
+        following its successors. The lanelets leading into loops are computed once for the whole lanelet network from
+        its strongly connected components.
         :param lanelet: Lanelet that is to be checked whether it satisfies conditions to be part of a roundabout.
         :returns: True if the lanelet is part of a roundabout lane, False otherwise.
         """
-
-        if lanelet.successor is not None and lanelet.predecessor is not None:
-            for successor_lanelet_id in lanelet.successor:
-                if self.lanelet_in_roundabout(successor_lanelet_id, [lanelet.lanelet_id]):
-                    return True
-        return False
-
-    def lanelet_in_roundabout(self, lanelet_id: int, encountered_lanelet_ids: list[int]):
-        """
-        This method is a recursive helper method to determine whether the current lanelet can be reached in a loop.
-        :param lanelet_id: ID of the current lanelet that is checked.
-        :param encountered_lanelet_ids: IDs of the lanelets that have already been checked (in order to avoid infinite
-        calls)
-        :returns: True if the lanelet is in a roundabout, False otherwise.
-        """
-
-        for lanelet in self.scenario.lanelet_network.lanelets:
-            if lanelet.lanelet_id == lanelet_id:
-                if (
-                    lanelet.successor is not None
-                    and len(set(encountered_lanelet_ids).intersection(lanelet.successor)) > 0
-                ):
-                    return True
-                elif (
-                    lanelet.successor is not None
-                    and len(set(encountered_lanelet_ids).intersection(lanelet.successor)) == 0
-                ):
-                    for successor_lanelet_id in lanelet.successor:
-                        if self.lanelet_in_roundabout(
-                            successor_lanelet_id, [*encountered_lanelet_ids, successor_lanelet_id]
-                        ):
-                            return True
-        return False
+        return lanelet.lanelet_id in self.lanelet_network_index.lanelet_ids_reaching_cycle
 
     def get_tag(self) -> TagEnum:
         """
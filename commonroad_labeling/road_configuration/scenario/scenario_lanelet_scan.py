@@ -0,0 +1,115 @@
+from commonroad.scenario.lanelet import Lanelet
+from commonroad.scenario.scenario import Scenario
+
+from commonroad_labeling.common.tag import ScenarioTag, TagEnum
+from commonroad_labeling.road_configuration.scenario.scenario_lanelet_layout import (
+    LaneletLayoutBidirectional,
+    LaneletLayoutDivergingLane,
+    LaneletLayoutMergingLane,
+    LaneletLayoutMultiLane,
+    LaneletLayoutOneWay,
+    LaneletLayoutRoundabout,
+    LaneletLayoutSingleLane,
+)
+from commonroad_labeling.road_configuration.scenario.scenario_traffic_sign import TrafficSignStopLine
+
+# Detectors whose `is_fulfilled` method is equivalent to checking `is_fulfilled_for_lanelet` for any lanelet.
+LANELET_SCANNED_TAG_CLASSES: list[type[ScenarioTag]] = [
+    LaneletLayoutSingleLane,
+    LaneletLayoutMultiLane,
+    LaneletLayoutBidirectional,
+    LaneletLayoutOneWay,
+    LaneletLayoutDivergingLane,
+    LaneletLayoutMergingLane,
+    LaneletLayoutRoundabout,
+    TrafficSignStopLine,
+]
+
+
+class LaneletTagScanner:
+    """
+    This class evaluates several lanelet-based scenario detectors in a single pass over the lanelets of a scenario.
+    Instead of letting every detector iterate through the lanelet network on its own, each lanelet is visited once and
+    checked against all detectors that are still undecided, and the scan stops as soon as every detector is fulfilled.
+    Additionally, the scanner provides per-lanelet bitmaps of the fulfilled detectors, in which bit `i` corresponds to
+    the `i`-th detector in `scenario_tags`, so that route detectors can reuse the results for their lanelets.
+    """
+
+    def __init__(self, scenario: Scenario, scenario_tags: list[ScenarioTag] | None = None):
+        """
+        Initializes the scanner with the given scenario and detectors.
+        :param scenario: Scenario whose lanelets are scanned.
+        :param scenario_tags: Detectors of the given scenario whose `is_fulfilled` method is equivalent to checking
+        `is_fulfilled_for_lanelet` for any lanelet of the scenario. Defaults to instances of all classes in
+        `LANELET_SCANNED_TAG_CLASSES`.
+        """
+        self.scenario = scenario
+        self.scenario_tags = (
+            scenario_tags
+            if scenario_tags is not None
+            else [scenario_tag_class(scenario) for scenario_tag_class in LANELET_SCANNED_TAG_CLASSES]
+        )
+        self._lanelet_masks: dict[int, int] = {}
+
+    def find_tags(self) -> set[TagEnum]:
+        """
+        This method visits the lanelets of the scenario once and evaluates every detector that has not been fulfilled
+        yet. It stops early once all detectors are fulfilled.
+        :returns: A set of tags of all fulfilled detectors.
+        """
+        detected_tags = set()
+        undecided_tags = list(self.scenario_tags)
+        for lanelet in self.scenario.lanelet_network.lanelets:
+            if not undecided_tags:
+                break
+
+            lanelet_mask = self._lanelet_masks.get(lanelet.lanelet_id)
+            remaining_tags = []
+            for scenario_tag in undecided_tags:
+                if (
+                    scenario_tag.is_fulfilled_for_lanelet(lanelet)
+                    if lanelet_mask is None
+                    else lanelet_mask & self.get_bit(scenario_tag.tag)
+                ):
+                    detected_tags.add(scenario_tag.tag)
+                else:
+                    remaining_tags.append(scenario_tag)
+            undecided_tags = remaining_tags
+
+        return detected_tags
+
+    def get_bit(self, tag: TagEnum) -> int:
+        """
+        This method returns the bit that corresponds to a detector in the per-lanelet bitmaps.
+        :param tag: Tag of a detector of the scanner.
+        :returns: An integer with a single bit set.
+        """
+        for position, scenario_tag in enumerate(self.scenario_tags):
+            if scenario_tag.tag == tag:
+                return 1 << position
+        raise ValueError(f"No detector for tag {tag} is registered in the scanner.")
+
+    def get_lanelet_mask(self, lanelet: Lanelet) -> int:
+        """
+        This method evaluates all detectors for a single lanelet. Results are memoized, so that every lanelet is
+        evaluated at most once.
+        :param lanelet: Lanelet of the scenario that is to be checked.
+        :returns: A bitmap of the detectors that are fulfilled for the lanelet.
+        """
+        lanelet_mask = self._lanelet_masks.get(lanelet.lanelet_id)
+        if lanelet_mask is None:
+            lanelet_mask = 0
+            for position, scenario_tag in enumerate(self.scenario_tags):
+                if scenario_tag.is_fulfilled_for_lanelet(lanelet):
+                    lanelet_mask |= 1 << position
+            self._lanelet_masks[lanelet.lanelet_id] = lanelet_mask
+        return lanelet_mask
+
+    def get_lanelet_masks(self) -> dict[int, int]:
+        """
+        This method evaluates all detectors for every lanelet of the scenario.
+        :returns: A dictionary mapping lanelet IDs to bitmaps of the detectors that are fulfilled for the lanelet.
+        """
+        return {
+            lanelet.lanelet_id: self.get_lanelet_mask(lanelet) for lanelet in self.scenario.lanelet_network.lanelets
+        }
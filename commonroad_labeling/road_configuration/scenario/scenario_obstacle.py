@@ -1,9 +1,14 @@
 import enum
+from collections import defaultdict
 
+import numpy as np
+from commonroad.prediction.prediction import TrajectoryPrediction
 from commonroad.scenario.lanelet import Lanelet
 from commonroad.scenario.obstacle import DynamicObstacle, ObstacleRole, ObstacleType
 from commonroad.scenario.scenario import Scenario
 
+from commonroad_labeling.common.cache import cache_per_object
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_index
 from commonroad_labeling.common.tag import ScenarioTag, TagEnum
 
 
@@ -31,11 +36,12 @@ class ObstacleStatic(ScenarioTag):
     def is_fulfilled_for_lanelet(self, lanelet: Lanelet) -> bool:
         """
         This method overrides the abstract method `is_fulfilled_for_lanelet` from the `common.tag.ScenarioTag` class.
-        It simply checks whether there are any, already parsed, static obstacles on a lanelet.
+        It looks up the provided lanelet in the obstacle occupancy index of the scenario and checks whether it is
+        occupied by the shape of any static obstacle.
         :param lanelet: Lanelet that is to be checked whether it satisfies conditions to contain static obstacles.
         :returns: True if the lanelet contains static obstacles, False otherwise.
         """
-        return len(lanelet.static_obstacles_on_lanelet) > 0
+        return get_obstacle_lanelet_occupancy(self.scenario).is_occupied_by_static_obstacle(lanelet.lanelet_id)
 
     def get_tag(self) -> TagEnum:
         """
@@ -71,15 +77,12 @@ class ObstacleTraffic(ScenarioTag):
     def is_fulfilled_for_lanelet(self, lanelet: Lanelet) -> bool:
         """
         This method overrides the abstract method `is_fulfilled_for_lanelet` from the `common.tag.ScenarioTag` class.
-        It iterates through all the lanelets in a given scenario that contain traffic and checks whether the
-        provided lanelet is contained in that list.
+        It looks up the provided lanelet in the obstacle occupancy index of the scenario and checks whether it is
+        occupied by traffic at any time step.
         :param lanelet: Lanelet that is to be checked whether it satisfies conditions to contain traffic.
         :returns: True if the lanelet contains traffic, False otherwise.
         """
-        for obstacle_lanelet in get_dynamic_obstacles_lanelets_in_scenario(self.scenario, is_traffic=True):
-            if obstacle_lanelet.lanelet_id == lanelet.lanelet_id:
-                return True
-        return False
+        return get_obstacle_lanelet_occupancy(self.scenario).is_occupied(lanelet.lanelet_id, is_traffic=True)
 
     def get_tag(self) -> TagEnum:
         """
@@ -116,16 +119,13 @@ class ObstacleOtherDynamic(ScenarioTag):
     def is_fulfilled_for_lanelet(self, lanelet: Lanelet) -> bool:
         """
         This method overrides the abstract method `is_fulfilled_for_lanelet` from the `common.tag.ScenarioTag` class.
-        It iterates through all the lanelets in a given scenario that contains other dynamic obstacles and checks
-        whether the provided lanelet is contained in that list.
+        It looks up the provided lanelet in the obstacle occupancy index of the scenario and checks whether it is
+        occupied by other dynamic obstacles at any time step.
         :param lanelet: Lanelet that is to be checked whether it satisfies conditions to contain other dynamic
         obstacles.
         :returns: True if the lanelet contains other dynamic obstacles, False otherwise.
         """
-        for obstacle_lanelet in get_dynamic_obstacles_lanelets_in_scenario(self.scenario, is_traffic=False):
-            if obstacle_lanelet.lanelet_id == lanelet.lanelet_id:
-                return True
-        return False
+        return get_obstacle_lanelet_occupancy(self.scenario).is_occupied(lanelet.lanelet_id, is_traffic=False)
 
     def get_tag(self) -> TagEnum:
         """
@@ -135,6 +135,110 @@ class ObstacleOtherDynamic(ScenarioTag):
         return TagEnum.SCENARIO_OBSTACLE_OTHER_DYNAMIC
 
 
+class ObstacleLaneletOccupancy:
+    """
+    This class is an index of the lanelets that are occupied by the obstacles of a scenario. It maps every lanelet ID
+    to the IDs of the traffic and the other dynamic obstacles whose center is located on the lanelet at any time step,
+    and to the IDs of the static obstacles whose shape overlaps the lanelet. If the scenario was opened with the
+    lanelet assignment of the `CommonRoadFileReader`, the lanelets assigned to the obstacles at load time are reused.
+    Otherwise, the positions of all dynamic obstacles are matched to lanelets in a single batched query of the
+    `LaneletSpatialIndex` of the lanelet network, so that the geometric work is done at most once per scenario and
+    checking whether a lanelet is occupied only requires a dictionary lookup afterwards.
+    """
+
+    def __init__(self, scenario: Scenario):
+        """
+        Initializes the index with the obstacles of the given scenario.
+        :param scenario: Scenario whose obstacles are assigned to lanelets.
+        """
+        self.traffic_obstacle_ids: dict[int, set[int]] = defaultdict(set)
+        self.other_dynamic_obstacle_ids: dict[int, set[int]] = defaultdict(set)
+        self.static_obstacle_ids: dict[int, set[int]] = defaultdict(set)
+
+        traffic_obstacle_types = set(get_traffic_obstacle_types())
+        positions = []
+        position_owners = []
+        for obstacle in scenario.dynamic_obstacles:
+            occupied_lanelets = (
+                self.traffic_obstacle_ids
+                if obstacle.obstacle_type in traffic_obstacle_types
+                else self.other_dynamic_obstacle_ids
+            )
+            center_lanelet_assignment = get_center_lanelet_assignment(obstacle)
+            if center_lanelet_assignment is not None:
+                for lanelet_ids in center_lanelet_assignment.values():
+                    for lanelet_id in lanelet_ids:
+                        occupied_lanelets[lanelet_id].add(obstacle.obstacle_id)
+                continue
+
+            for position in get_obstacle_positions(obstacle):
+                positions.append(position)
+                position_owners.append((obstacle.obstacle_id, occupied_lanelets))
+
+        if len(positions) > 0:
+            lanelet_ids_by_position = get_lanelet_network_index(scenario.lanelet_network).spatial_index.query(positions)
+            for (obstacle_id, occupied_lanelets), lanelet_ids in zip(position_owners, lanelet_ids_by_position):
+                for lanelet_id in lanelet_ids:
+                    occupied_lanelets[lanelet_id].add(obstacle_id)
+
+        for obstacle in scenario.static_obstacles:
+            lanelet_ids = obstacle.initial_shape_lanelet_ids
+            if lanelet_ids is None:
+                lanelet_ids = scenario.lanelet_network.find_lanelet_by_shape(
+                    obstacle.obstacle_shape.rotate_translate_local(
+                        obstacle.initial_state.position, obstacle.initial_state.orientation
+                    )
+                )
+            for lanelet_id in lanelet_ids:
+                self.static_obstacle_ids[lanelet_id].add(obstacle.obstacle_id)
+
+    def get_obstacle_ids(self, lanelet_id: int, is_traffic: bool) -> set[int]:
+        """
+        This method returns the IDs of the dynamic obstacles that occupy a lanelet at any time step.
+        :param lanelet_id: ID of the lanelet.
+        :param is_traffic: Boolean value indicating whether the dynamic obstacles should be traffic participants or not.
+        :returns: A set of obstacle IDs, which is empty if the lanelet is never occupied.
+        """
+        occupied_lanelets = self.traffic_obstacle_ids if is_traffic else self.other_dynamic_obstacle_ids
+        return occupied_lanelets.get(lanelet_id, set())
+
+    def get_occupied_lanelet_ids(self, is_traffic: bool) -> set[int]:
+        """
+        This method returns the IDs of all lanelets that are occupied by dynamic obstacles at any time step.
+        :param is_traffic: Boolean value indicating whether the dynamic obstacles should be traffic participants or not.
+        :returns: A set of lanelet IDs.
+        """
+        return set(self.traffic_obstacle_ids if is_traffic else self.other_dynamic_obstacle_ids)
+
+    def is_occupied(self, lanelet_id: int, is_traffic: bool) -> bool:
+        """
+        This method checks whether a lanelet is occupied by dynamic obstacles at any time step.
+        :param lanelet_id: ID of the lanelet.
+        :param is_traffic: Boolean value indicating whether the dynamic obstacles should be traffic participants or not.
+        :returns: True if the lanelet is occupied, False otherwise.
+        """
+        return lanelet_id in (self.traffic_obstacle_ids if is_traffic else self.other_dynamic_obstacle_ids)
+
+    def is_occupied_by_static_obstacle(self, lanelet_id: int) -> bool:
+        """
+        This method checks whether a lanelet is occupied by the shape of any static obstacle.
+        :param lanelet_id: ID of the lanelet.
+        :returns: True if the lanelet is occupied, False otherwise.
+        """
+        return lanelet_id in self.static_obstacle_ids
+
+
+@cache_per_object
+def get_obstacle_lanelet_occupancy(scenario: Scenario) -> ObstacleLaneletOccupancy:
+    """
+    This function returns the obstacle occupancy index of a scenario. The index is built on the first call and shared
+    by all detectors working on the same scenario object.
+    :param scenario: Scenario for which the index is returned.
+    :returns: The `ObstacleLaneletOccupancy` of the scenario.
+    """
+    return ObstacleLaneletOccupancy(scenario)
+
+
 def get_dynamic_obstacles_lanelets_in_scenario(scenario: Scenario, is_traffic: bool) -> set[Lanelet]:
     """
     This functions extracts lanelets from a given scenario that contain dynamic obstacles.
@@ -143,14 +247,8 @@ def get_dynamic_obstacles_lanelets_in_scenario(scenario: Scenario, is_traffic: b
     :returns: A set of lanelets containing dynamic obstacles.
     """
     return set(
-        [
-            scenario.lanelet_network.find_lanelet_by_id(lanelet_id)
-            for single_obstacle_lanelet_ids in [
-                extract_lanelet_ids_for_single_obstacle(scenario, obstacle)
-                for obstacle in extract_dynamic_obstacles_from_scenario(scenario, is_traffic)
-            ]
-            for lanelet_id in single_obstacle_lanelet_ids
-        ]
+        scenario.lanelet_network.find_lanelet_by_id(lanelet_id)
+        for lanelet_id in get_obstacle_lanelet_occupancy(scenario).get_occupied_lanelet_ids(is_traffic)
     )
 
 
@@ -172,29 +270,50 @@ def extract_dynamic_obstacles_from_scenario(scenario: Scenario, is_traffic: bool
 
 def extract_lanelet_ids_for_single_obstacle(scenario: Scenario, obstacle: DynamicObstacle) -> set[int]:
     """
-    This functions extracts lanelet IDs for a single dynamic obstacle in a scenario.
+    This functions extracts lanelet IDs for a single dynamic obstacle in a scenario. The lanelet assignment of the
+    `CommonRoadFileReader` is reused if the scenario was opened with it.
     :param scenario: A scenario from which the lanelets will be extracted.
     :param obstacle: A dynamic obstacle for which the lanelets will be extracted.
     :returns: A set of lanelet IDs which an obstacle occupies during a scenario.
     """
-    return set(
-        [
-            lanelet_id
-            for lanelet_ids in scenario.lanelet_network.find_lanelet_by_position(
-                [
-                    obstacle.initial_state.position,
-                    *(
-                        [obstacle_state.position for obstacle_state in obstacle.prediction.trajectory.state_list]
-                        if obstacle.prediction is not None
-                        else []
-                    ),
-                ]
-            )
-            for lanelet_id in lanelet_ids
-        ]
+    center_lanelet_assignment = get_center_lanelet_assignment(obstacle)
+    if center_lanelet_assignment is not None:
+        return set().union(*center_lanelet_assignment.values())
+
+    return set().union(
+        *get_lanelet_network_index(scenario.lanelet_network).spatial_index.query(get_obstacle_positions(obstacle))
     )
 
 
+def get_center_lanelet_assignment(obstacle: DynamicObstacle) -> dict[int, set[int]] | None:
+    """
+    This functions returns the lanelets the center of a dynamic obstacle is located on, as assigned by the
+    `CommonRoadFileReader` when a file is opened with `lanelet_assignment=True`.
+    :param obstacle: A dynamic obstacle for which the assignment is returned.
+    :returns: A dictionary mapping the time steps of the initial state and the predicted trajectory to sets of lanelet
+    IDs, `None` if the obstacle has no trajectory or no lanelets were assigned at load time.
+    """
+    if not isinstance(obstacle.prediction, TrajectoryPrediction):
+        return None
+    return obstacle.prediction.center_lanelet_assignment
+
+
+def get_obstacle_positions(obstacle: DynamicObstacle) -> list[np.ndarray]:
+    """
+    This functions extracts the positions of a single dynamic obstacle at all time steps.
+    :param obstacle: A dynamic obstacle for which the positions will be extracted.
+    :returns: A list containing the initial position followed by the positions of the predicted trajectory.
+    """
+    return [
+        obstacle.initial_state.position,
+        *(
+            [obstacle_state.position for obstacle_state in obstacle.prediction.trajectory.state_list]
+            if obstacle.prediction is not None
+            else []
+        ),
+    ]
+
+
 def get_traffic_obstacle_types() -> list[enum]:
     """
     This functions returns dynamic obstacle types which are classified as traffic.
@@ -1,7 +1,7 @@
-import enum
-from abc import ABC, abstractmethod
+from abc import ABC
+from enum import Enum
 
-from commonroad.scenario.lanelet import Lanelet
+from commonroad.scenario.lanelet import Lanelet, LaneletNetwork
 from commonroad.scenario.scenario import Scenario
 from commonroad.scenario.traffic_sign import (
     TrafficSignIDArgentina,
@@ -19,6 +19,8 @@ from commonroad.scenario.traffic_sign import (
     TrafficSignIDZamunda,
 )
 
+from commonroad_labeling.common.cache import cache_per_object
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_index
 from commonroad_labeling.common.tag import ScenarioTag, TagEnum
 
 
@@ -29,28 +31,39 @@ class TrafficSignTag(ScenarioTag, ABC):
     behaviour/road element (i.e. speed limit, right of way, stop line etc.) imposed by them. The abstract methods
     from the `Tag` and `ScenarioTag` classes are implemented in the subclasses of this particular class.
     `TrafficSignTag` class is used to override `is_fulfilled` and `is_fulfilled_for_lanelet` as same implementation is
-    needed to find certain traffic sign groups in both cases. Additionally, this class introduces abstract
-    `get_traffic_signs` method that will determine traffic signs in a certain group.
+    needed to find certain traffic sign groups in both cases. Subclasses determine the traffic signs of their group
+    with the class attribute `traffic_signs`, which every concrete subclass has to define. Every group is assigned a
+    bit of the group bitmasks of the `TrafficSignGroupTable` when its class is defined, so that the detectors only look
+    up bitmasks.
     """
 
+    traffic_signs: frozenset[Enum] = frozenset()
+    """Traffic sign element IDs that belong to the group of the detector."""
+    group_bit: int = 0
+    """Bit of the group of the detector in the bitmasks of the `TrafficSignGroupTable`."""
+    group_mask_by_traffic_sign: dict[Enum, int] = {}
+    """Bitmask of the groups of every traffic sign element ID contained in any group."""
+    _group_count: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "traffic_signs" in cls.__dict__:
+            cls.group_bit = 1 << TrafficSignTag._group_count
+            TrafficSignTag._group_count += 1
+            for traffic_sign in cls.traffic_signs:
+                TrafficSignTag.group_mask_by_traffic_sign[traffic_sign] = (
+                    TrafficSignTag.group_mask_by_traffic_sign.get(traffic_sign, 0) | cls.group_bit
+                )
+        elif ABC not in cls.__bases__:
+            raise TypeError(f"{cls.__name__} has to define the traffic signs of its group in `traffic_signs`")
+
     def is_fulfilled(self) -> bool:
         """
-        This method overrides the abstract method `is_fulfilled` from the `common.tag.Tag` class. It iterates  through
-        all the parsed traffic signs of a scenario and checks whether the any of them are contained within a certain
-        list of traffic signs.
+        This method overrides the abstract method `is_fulfilled` from the `common.tag.Tag` class. It checks whether
+        the bit of the group is set in the combined group bitmask of all traffic signs of the scenario.
         :returns: Boolean value indicating that a scenario contains certain traffic signs.
         """
-        traffic_sign_ids = self.get_traffic_signs()
-        for traffic_sign in self.scenario.lanelet_network.traffic_signs:
-            for traffic_sign_id in traffic_sign_ids:
-                if traffic_sign_id in list(
-                    map(
-                        lambda traffic_sign_element: traffic_sign_element.traffic_sign_element_id,
-                        traffic_sign.traffic_sign_elements,
-                    )
-                ):
-                    return True
-        return False
+        return bool(get_traffic_sign_group_table(self.scenario.lanelet_network).network_mask & self.group_bit)
 
     def is_fulfilled_for_lanelet(self, lanelet: Lanelet) -> bool:
         """
@@ -59,44 +72,77 @@ class TrafficSignTag(ScenarioTag, ABC):
         :param lanelet: Lanelet that is to be checked whether it contains any of the traffic signs from a certain group.
         :returns: `True` if the lanelet contains a traffic sign from a certain group, `False` otherwise.
         """
-        traffic_sign_ids = self.get_traffic_signs()
+        mask_by_traffic_sign_id = get_traffic_sign_group_table(self.scenario.lanelet_network).mask_by_traffic_sign_id
         for lanelet_traffic_sign_id in lanelet.traffic_signs:
-            for traffic_sign in self.scenario.lanelet_network.traffic_signs:
-                if lanelet_traffic_sign_id == traffic_sign.traffic_sign_id:
-                    for traffic_sign_element in traffic_sign.traffic_sign_elements:
-                        if traffic_sign_element.traffic_sign_element_id in traffic_sign_ids:
-                            return True
+            if mask_by_traffic_sign_id.get(lanelet_traffic_sign_id, 0) & self.group_bit:
+                return True
         return False
 
-    @abstractmethod
-    def get_traffic_signs(self) -> list[enum]:
-        """
-        This abstract method returns list of traffic signs that indicate certain restriction/expected behaviour
-        /road element in a given scenario.
-        :returns: A list of enums indicating traffic signs in a certain group.
-        """
-        pass
 
-
-class TrafficSignSpeedLimit(TrafficSignTag):
+class TrafficSignGroupTable:
     """
-    This class is used to detect whether the scenario contains any traffic signs indicating a speed limit.
+    This class maps the traffic signs of a lanelet network to bitmasks of the traffic sign groups of the
+    `TrafficSignTag` detectors. The table is built in a single pass over the traffic signs of the network, so that all
+    traffic sign detectors of a scenario, including the route detectors using them, only test a bit of a precomputed
+    bitmask instead of comparing traffic sign elements with the traffic signs of their group.
     """
 
-    def __init__(self, scenario: Scenario):
+    def __init__(self, lanelet_network: LaneletNetwork):
         """
-        Initializes the class with the given scenario.
-        :param scenario: specifies a scenario for which the class should detect a speed limit and it is passed
-        to the constructor of the superclass `common.tag.ScenarioTag`.
+        Initializes the table for the given lanelet network.
+        :param lanelet_network: Lanelet network whose traffic signs are classified.
         """
-        super().__init__(scenario)
+        self.mask_by_traffic_sign_id: dict[int, int] = {}
+        self.network_mask = 0
+        self.group_count = 0
+        self.build(lanelet_network)
 
-    def get_traffic_signs(self) -> list[enum]:
+    def build(self, lanelet_network: LaneletNetwork):
         """
-        This method returns list of traffic signs that indicate a speed limit.
-        :returns: A list of enums indicating traffic signs that indicate a speed limit.
+        Classifies the traffic signs of the lanelet network with the groups of all currently defined `TrafficSignTag`
+        subclasses.
+        :param lanelet_network: Lanelet network whose traffic signs are classified.
         """
-        return [
+        group_mask_by_traffic_sign = TrafficSignTag.group_mask_by_traffic_sign
+        self.mask_by_traffic_sign_id = {}
+        self.network_mask = 0
+        self.group_count = TrafficSignTag._group_count
+        for traffic_sign_id, traffic_sign_element_ids in get_lanelet_network_index(
+            lanelet_network
+        ).traffic_sign_element_ids.items():
+            mask = 0
+            for traffic_sign_element_id in traffic_sign_element_ids:
+                mask |= group_mask_by_traffic_sign.get(traffic_sign_element_id, 0)
+            self.mask_by_traffic_sign_id[traffic_sign_id] = mask
+            self.network_mask |= mask
+
+
+@cache_per_object
+def _get_cached_traffic_sign_group_table(lanelet_network: LaneletNetwork) -> TrafficSignGroupTable:
+    return TrafficSignGroupTable(lanelet_network)
+
+
+def get_traffic_sign_group_table(lanelet_network: LaneletNetwork) -> TrafficSignGroupTable:
+    """
+    This function returns the traffic sign group table of a lanelet network, which is built once per network object
+    and shared by all traffic sign detectors. The table is rebuilt if `TrafficSignTag` subclasses were defined since
+    it was built, so that their groups are classified as well.
+    :param lanelet_network: Lanelet network whose traffic signs are classified.
+    :returns: A `TrafficSignGroupTable` of the network.
+    """
+    table = _get_cached_traffic_sign_group_table(lanelet_network)
+    if table.group_count != TrafficSignTag._group_count:
+        table.build(lanelet_network)
+    return table
+
+
+class TrafficSignSpeedLimit(TrafficSignTag):
+    """
+    This class is used to detect whether the scenario contains any traffic signs indicating a speed limit.
+    """
+
+    traffic_signs = frozenset(
+        {
             TrafficSignIDZamunda.MAX_SPEED,
             TrafficSignIDGermany.MAX_SPEED,
             TrafficSignIDUsa.MAX_SPEED,
@@ -111,7 +157,6 @@ class TrafficSignSpeedLimit(TrafficSignTag):
             TrafficSignIDItaly.MAX_SPEED,
             TrafficSignIDPuertoRico.MAX_SPEED,
             TrafficSignIDZamunda.MAX_SPEED_ZONE_START,
-            TrafficSignIDZamunda.MAX_SPEED_ZONE_START,
             TrafficSignIDZamunda.MAX_SPEED_ZONE_END,
             TrafficSignIDGermany.MAX_SPEED_ZONE_END,
             TrafficSignIDZamunda.MAX_SPEED_END,
@@ -123,7 +168,17 @@ class TrafficSignSpeedLimit(TrafficSignTag):
             TrafficSignIDZamunda.TOWN_SIGN,
             TrafficSignIDGermany.TOWN_SIGN,
             # TODO: verify interstates, highways and expressways
-        ]
+        }
+    )
+    """Traffic sign element IDs that indicate a speed limit."""
+
+    def __init__(self, scenario: Scenario):
+        """
+        Initializes the class with the given scenario.
+        :param scenario: specifies a scenario for which the class should detect a speed limit and it is passed
+        to the constructor of the superclass `common.tag.ScenarioTag`.
+        """
+        super().__init__(scenario)
 
     def get_tag(self) -> TagEnum:
         """
@@ -138,6 +193,18 @@ class TrafficSignRightOfWay(TrafficSignTag):
     This class is used to detect whether the scenario contains any traffic signs indicating a right of way.
     """
 
+    traffic_signs = frozenset(
+        {
+            TrafficSignIDZamunda.RIGHT_OF_WAY,
+            TrafficSignIDGermany.RIGHT_OF_WAY,
+            TrafficSignIDZamunda.PRIORITY,
+            TrafficSignIDGermany.PRIORITY,
+            TrafficSignIDZamunda.PRIORITY_OVER_ONCOMING,
+            TrafficSignIDGermany.PRIORITY_OVER_ONCOMING,
+        }
+    )
+    """Traffic sign element IDs that indicate a right of way."""
+
     def __init__(self, scenario: Scenario):
         """
         Initializes the class with the given scenario.
@@ -146,20 +213,6 @@ class TrafficSignRightOfWay(TrafficSignTag):
         """
         super().__init__(scenario)
 
-    def get_traffic_signs(self) -> list[enum]:
-        """
-        This method returns list of traffic signs that indicate a right of way.
-        :returns: A list of enums indicating traffic signs that indicate a right of way.
-        """
-        return [
-            TrafficSignIDZamunda.RIGHT_OF_WAY,
-            TrafficSignIDGermany.RIGHT_OF_WAY,
-            TrafficSignIDZamunda.PRIORITY,
-            TrafficSignIDGermany.PRIORITY,
-            TrafficSignIDZamunda.PRIORITY_OVER_ONCOMING,
-            TrafficSignIDGermany.PRIORITY_OVER_ONCOMING,
-        ]
-
     def get_tag(self) -> TagEnum:
         """
         Sets the `tag` attribute value to be returned if detected. Check `Tag` class for more info.
@@ -173,20 +226,8 @@ class TrafficSignNoRightOfWay(TrafficSignTag):
     This class is used to detect whether the scenario contains any traffic signs indicating no right of way.
     """
 
-    def __init__(self, scenario: Scenario):
-        """
-        Initializes the class with the given scenario.
-        :param scenario: specifies a scenario for which the class should detect no right of way traffic signs and it is
-        passed to the constructor of the superclass `common.tag.ScenarioTag`.
-        """
-        super().__init__(scenario)
-
-    def get_traffic_signs(self) -> list[enum]:
-        """
-        This method returns list of traffic signs that indicate no right of way.
-        :returns: A list of enums indicating traffic signs that indicate no right of way.
-        """
-        return [
+    traffic_signs = frozenset(
+        {
             TrafficSignIDZamunda.YIELD,
             TrafficSignIDGermany.YIELD,
             TrafficSignIDSpain.YIELD,
@@ -208,7 +249,17 @@ class TrafficSignNoRightOfWay(TrafficSignTag):
             # TrafficSignIDGermany.BICYCLE_ROAD_END,
             TrafficSignIDZamunda.RAILWAY,
             TrafficSignIDGermany.RAILWAY,
-        ]
+        }
+    )
+    """Traffic sign element IDs that indicate no right of way."""
+
+    def __init__(self, scenario: Scenario):
+        """
+        Initializes the class with the given scenario.
+        :param scenario: specifies a scenario for which the class should detect no right of way traffic signs and it is
+        passed to the constructor of the superclass `common.tag.ScenarioTag`.
+        """
+        super().__init__(scenario)
 
     def get_tag(self) -> TagEnum:
         """
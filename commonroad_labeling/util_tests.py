@@ -1,11 +1,15 @@
 import pathlib
+import tempfile
 from typing import Tuple
 
+import numpy as np
 from commonroad.common.file_reader import CommonRoadFileReader
+from commonroad.scenario.lanelet import Lanelet
 from commonroad.scenario.scenario import Scenario
 from commonroad_route_planner.reference_path import ReferencePath
 
 from commonroad_labeling.common.general import get_planned_routes
+from commonroad_labeling.common.route_cache import RouteCache
 from commonroad_labeling.common.tag import TagEnum
 
 expected_scenario_tags = {
@@ -172,13 +176,36 @@ def get_scenarios() -> list[Scenario]:
     return scenarios
 
 
+# Routes are cached for the duration of a test run only, so that results do not depend on earlier runs
+_route_cache_directory = tempfile.TemporaryDirectory()
+
+
 def get_scenarios_with_routes() -> list[Tuple[Scenario, list[ReferencePath]]]:
     path = pathlib.Path.cwd().joinpath("..", "scenarios")
+    route_cache = RouteCache(pathlib.Path(_route_cache_directory.name))
     scenarios_and_routes = []
     for filename in path.glob("*.cr.xml"):
         scenario, planning_problem = CommonRoadFileReader(str(filename)).open(lanelet_assignment=True)
-        routes = get_planned_routes(scenario, planning_problem)
+        routes = get_planned_routes(scenario, planning_problem, route_cache)
 
         scenarios_and_routes.append((scenario, routes))
 
     return scenarios_and_routes
+
+
+def create_straight_lanelet(lanelet_id: int, **kwargs) -> Lanelet:
+    """
+    Creates a straight lanelet of 10 m length and 4 m width for synthetic lanelet networks in tests. Lanelets are placed
+    next to each other by their ID, so that lanelets with different IDs do not overlap.
+    :param lanelet_id: ID of the lanelet.
+    :param kwargs: Further arguments of the `Lanelet`, e.g. `successor` or `adjacent_left`.
+    :returns: The created lanelet.
+    """
+    offset = 4.0 * lanelet_id
+    return Lanelet(
+        np.array([[0.0, offset + 2.0], [10.0, offset + 2.0]]),
+        np.array([[0.0, offset], [10.0, offset]]),
+        np.array([[0.0, offset - 2.0], [10.0, offset - 2.0]]),
+        lanelet_id,
+        **kwargs,
+    )
@@ -0,0 +1,44 @@
+import argparse
+import sys
+from pathlib import Path
+
+from commonroad_labeling.common.benchmark import (
+    BENCHMARK_STAGES,
+    compare_benchmarks,
+    get_benchmark_files,
+    load_benchmark,
+    run_benchmark,
+    save_benchmark,
+)
+
+# Benchmark the labeling of the bundled scenarios, e.g.
+#   python scripts/benchmark.py --save baseline.json
+#   python scripts/benchmark.py --compare baseline.json --threshold 0.1
+# The benchmark should be run in a fresh process, since the peak memory usage is measured over the whole process.
+parser = argparse.ArgumentParser(description="Benchmark the automatic labeling of CommonRoad files.")
+parser.add_argument("path", nargs="?", type=Path, default=Path(__file__).parent.joinpath("..", "scenarios"))
+parser.add_argument("--smoke", action="store_true", help="label only a small subset of the bundled scenarios")
+parser.add_argument("--repeat", type=int, default=1, help="number of times all files are labeled")
+parser.add_argument("--save", type=Path, help="write the result to a baseline JSON file")
+parser.add_argument("--compare", type=Path, help="compare the result with a baseline JSON file")
+parser.add_argument("--threshold", type=float, default=0.1, help="allowed relative deterioration")
+arguments = parser.parse_args()
+
+result = run_benchmark(get_benchmark_files(arguments.path, arguments.smoke), arguments.repeat)
+
+print(f"{result.files} files ({result.failed_files} failed) in {result.total_seconds:.3f}s")
+print(f"{result.files_per_second:.2f} files/s, peak RSS {result.peak_rss_bytes} bytes")
+for stage in BENCHMARK_STAGES:
+    print(f"  {stage:<20} {result.stage_seconds[stage]:.3f}s")
+
+if arguments.save is not None:
+    save_benchmark(result, arguments.save)
+
+if arguments.compare is not None:
+    try:
+        regressions = compare_benchmarks(load_benchmark(arguments.compare), result, arguments.threshold)
+    except ValueError as error:
+        sys.exit(str(error))
+    for regression in regressions:
+        print(regression)
+    sys.exit(1 if regressions else 0)
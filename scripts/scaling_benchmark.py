@@ -0,0 +1,54 @@
+import argparse
+from pathlib import Path
+
+from commonroad_labeling.common.benchmark import run_scaling_benchmark, save_scaling_csv
+
+# Measure how the runtime of the detectors scales with the size of synthetic scenarios, e.g.
+#   python scripts/scaling_benchmark.py --output scaling --criticality
+# writes the runtime as a function of the number of lanelets to `scaling/lanelets.csv` and as a function of the number
+# of obstacle states to `scaling/obstacle_states.csv`.
+parser = argparse.ArgumentParser(description="Measure the scaling of the detectors with synthetic scenarios.")
+parser.add_argument("--output", type=Path, default=Path.cwd(), help="folder to which the CSV files are written")
+parser.add_argument("--max-grid-size", type=int, default=16, help="largest number of blocks per side of the grid")
+parser.add_argument("--max-obstacles", type=int, default=400, help="largest number of dynamic obstacles")
+parser.add_argument("--time-steps", type=int, default=100, help="number of time steps of the trajectories")
+parser.add_argument("--criticality", action="store_true", help="measure the CMComputer as well")
+arguments = parser.parse_args()
+
+cm_computer = None
+if arguments.criticality:
+    from commonroad_crime.measure import DCE, TTCE
+
+    from commonroad_labeling.criticality.computer.cm_computer import CMComputer
+
+    # Metrics that do not require a curvilinear coordinate system covering all obstacles of the large networks
+    cm_computer = CMComputer([DCE, TTCE], verbose=False)
+
+grid_sizes = [2**exponent for exponent in range(arguments.max_grid_size.bit_length())]
+obstacle_counts = [25 * 2**exponent for exponent in range(max(arguments.max_obstacles // 25, 1).bit_length())]
+
+arguments.output.mkdir(parents=True, exist_ok=True)
+lanelet_measurements = run_scaling_benchmark(
+    [
+        {"grid_rows": size, "grid_columns": size, "ring_count": size, "dynamic_obstacle_count": 10}
+        for size in grid_sizes
+    ],
+    cm_computer,
+)
+save_scaling_csv(lanelet_measurements, arguments.output.joinpath("lanelets.csv"))
+
+obstacle_measurements = run_scaling_benchmark(
+    [
+        {"grid_rows": 4, "grid_columns": 4, "dynamic_obstacle_count": count, "time_steps": arguments.time_steps}
+        for count in obstacle_counts
+    ],
+    cm_computer,
+)
+save_scaling_csv(obstacle_measurements, arguments.output.joinpath("obstacle_states.csv"))
+
+for measurement in lanelet_measurements + obstacle_measurements:
+    slowest_step = max(measurement.seconds, key=measurement.seconds.get)
+    print(
+        f"{measurement.lanelets} lanelets, {measurement.obstacle_states} obstacle states: "
+        f"{sum(measurement.seconds.values()):.3f}s, slowest {slowest_step} {measurement.seconds[slowest_step]:.3f}s"
+    )
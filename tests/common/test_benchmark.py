@@ -0,0 +1,108 @@
+import csv
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from commonroad_labeling.common import benchmark
+from commonroad_labeling.common.benchmark import (
+    BENCHMARK_STAGES,
+    SMOKE_SCENARIO_NAMES,
+    BenchmarkResult,
+    compare_benchmarks,
+    get_benchmark_files,
+    load_benchmark,
+    run_benchmark,
+    run_scaling_benchmark,
+    save_benchmark,
+    save_scaling_csv,
+)
+from commonroad_labeling.common.detector_registry import DETECTORS
+
+
+class BenchmarkTest(unittest.TestCase):
+    def setUp(self):
+        self.path = pathlib.Path.cwd().joinpath("..", "scenarios")
+
+    def test_smoke_benchmark(self):
+        paths = get_benchmark_files(self.path, smoke=True)
+        self.assertEqual(sorted(SMOKE_SCENARIO_NAMES), sorted(path.name for path in paths))
+        self.assertLess(len(paths), len(get_benchmark_files(self.path)))
+
+        result = run_benchmark(paths, repeat=2)
+        self.assertEqual(len(SMOKE_SCENARIO_NAMES), result.files)
+        self.assertEqual(0, result.failed_files)
+        self.assertEqual(BENCHMARK_STAGES, list(result.stage_seconds))
+        self.assertGreater(result.stage_seconds["load"], 0.0)
+        self.assertLessEqual(sum(result.stage_seconds.values()), result.total_seconds * 2)
+        self.assertGreater(result.files_per_second, 0.0)
+        self.assertGreater(result.peak_rss_bytes, 0)
+        self.assertEqual([], compare_benchmarks(result, result))
+
+        with tempfile.TemporaryDirectory() as directory:
+            baseline_path = pathlib.Path(directory).joinpath("baseline.json")
+            save_benchmark(result, baseline_path)
+            self.assertEqual(result.to_dict(), load_benchmark(baseline_path).to_dict())
+
+    def test_benchmark_repetitions_are_cold(self):
+        paths = get_benchmark_files(self.path, smoke=True)[:1]
+        with mock.patch.object(
+            benchmark, "clear_lanelet_network_indexes", wraps=benchmark.clear_lanelet_network_indexes
+        ) as clear_indexes:
+            run_benchmark(paths, repeat=2)
+        self.assertEqual(2, clear_indexes.call_count)
+
+    def test_compare_benchmarks(self):
+        stage_seconds = dict.fromkeys(BENCHMARK_STAGES, 0.1)
+        baseline = BenchmarkResult(10, 0, stage_seconds, 1.0, 1000)
+
+        slower_stage_seconds = {**stage_seconds, "route_planning": 0.2, "map_tags": 0.105}
+        slower = BenchmarkResult(10, 0, slower_stage_seconds, 1.2, 1050)
+        regressions = compare_benchmarks(baseline, slower, threshold=0.1)
+        self.assertEqual(
+            ["route_planning", "total_seconds", "files_per_second"],
+            [regression.measurement for regression in regressions],
+        )
+        self.assertAlmostEqual(1.0, regressions[0].relative_change)
+        self.assertEqual([], compare_benchmarks(baseline, slower, threshold=1.5))
+
+        larger = BenchmarkResult(10, 0, stage_seconds, 1.0, 2000)
+        self.assertEqual(
+            ["peak_rss_bytes"], [regression.measurement for regression in compare_benchmarks(baseline, larger)]
+        )
+
+        noisy_stage_seconds = {**stage_seconds, "lanelet_assignment": 1e-4}
+        noisy = BenchmarkResult(10, 0, {**stage_seconds, "lanelet_assignment": 5e-4}, 1.0, 1000)
+        self.assertEqual([], compare_benchmarks(BenchmarkResult(10, 0, noisy_stage_seconds, 1.0, 1000), noisy))
+
+        # Failing files skip stages, hence the run is faster but still a regression
+        failing = BenchmarkResult(10, 3, dict.fromkeys(BENCHMARK_STAGES, 0.05), 0.5, 1000)
+        self.assertEqual(
+            ["failed_files"], [regression.measurement for regression in compare_benchmarks(baseline, failing)]
+        )
+        self.assertEqual(3, compare_benchmarks(baseline, failing)[0].current)
+
+        with self.assertRaises(ValueError):
+            compare_benchmarks(baseline, BenchmarkResult(5, 0, stage_seconds, 0.5, 1000))
+
+    def test_scaling_benchmark(self):
+        parameter_sets = [
+            {"grid_rows": size, "grid_columns": size, "ring_count": 1, "dynamic_obstacle_count": 5} for size in [1, 2]
+        ]
+        measurements = run_scaling_benchmark(parameter_sets)
+        self.assertEqual(parameter_sets, [measurement.parameters for measurement in measurements])
+        self.assertLess(measurements[0].lanelets, measurements[1].lanelets)
+        for measurement in measurements:
+            self.assertEqual(
+                ["lanelet_network_index", "lanelet_assignment", "route_planning"]
+                + [detector.detector_class.__name__ for detector in DETECTORS],
+                list(measurement.seconds),
+            )
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = pathlib.Path(directory).joinpath("scaling.csv")
+            save_scaling_csv(measurements, csv_path)
+            with open(csv_path, newline="") as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual([str(measurement.lanelets) for measurement in measurements], [row["lanelets"] for row in rows])
+        self.assertIn("LaneletLayoutRoundabout", rows[0])
@@ -0,0 +1,89 @@
+import pathlib
+import unittest
+from unittest import mock
+
+from commonroad_labeling.common import general
+from commonroad_labeling.common.detector_registry import (
+    DETECTORS,
+    DetectorDependency,
+    get_dependencies,
+    get_detectors,
+    get_requested_tags,
+)
+from commonroad_labeling.common.general import find_scenario_tags
+from commonroad_labeling.common.map_cache import MapTagCache
+from commonroad_labeling.common.tag import TagEnum, TagGroupEnum
+from commonroad_labeling.common.tag_query import get_tags_of_group
+
+SCENARIO_NAMES = ["DEU_BadEssen-2_5_I-1-1.cr.xml", "USA_Lanker-1_12_I-1-1.cr.xml", "ZAM_Tjunction-1_97_T-1.xml"]
+
+
+class DetectorRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.paths = [pathlib.Path.cwd().joinpath("..", "scenarios", scenario_name) for scenario_name in SCENARIO_NAMES]
+
+    def test_registry(self):
+        registered_tags = [tag for detector in DETECTORS for tag in detector.tags]
+        self.assertCountEqual(list(TagEnum), registered_tags)
+
+        self.assertEqual(set(TagEnum), get_requested_tags())
+        requested_tags = get_requested_tags([TagEnum.ROUTE_OBSTACLE_STATIC], [TagGroupEnum.SCENARIO_LANELET_LAYOUT])
+        self.assertEqual(
+            {TagEnum.ROUTE_OBSTACLE_STATIC} | get_tags_of_group(TagGroupEnum.SCENARIO_LANELET_LAYOUT), requested_tags
+        )
+        self.assertEqual(set(DetectorDependency), get_dependencies(get_detectors(requested_tags)))
+        self.assertEqual(
+            {DetectorDependency.MAP},
+            get_dependencies(get_detectors(get_tags_of_group(TagGroupEnum.SCENARIO_LANELET_LAYOUT))),
+        )
+        self.assertEqual(
+            {DetectorDependency.OBSTACLES, DetectorDependency.OBSTACLE_LANELET_ASSIGNMENT},
+            get_dependencies(
+                get_detectors({TagEnum.SCENARIO_OBSTACLE_TRAFFIC, TagEnum.SCENARIO_OBSTACLE_OTHER_DYNAMIC})
+            ),
+        )
+
+    def test_find_scenario_tags_reader_lanelet_assignment(self):
+        for path in self.paths:
+            with mock.patch.object(
+                general.CommonRoadFileReader, "open", autospec=True, side_effect=general.CommonRoadFileReader.open
+            ) as open_file:
+                find_scenario_tags(
+                    path, MapTagCache(), tags=[TagEnum.SCENARIO_OBSTACLE_TRAFFIC], reader_lanelet_assignment=True
+                )
+            self.assertTrue(open_file.call_args.kwargs["lanelet_assignment"], msg=path.name)
+
+    def test_find_scenario_tags_selective(self):
+        for path in self.paths:
+            all_tags = find_scenario_tags(path, MapTagCache())
+
+            # Map tags must be detected without route planning or obstacle assignment, with and without cached results
+            for is_cached in [False, True]:
+                map_tag_cache = MapTagCache()
+                if is_cached:
+                    map_tag_cache.get_map_tags(general.CommonRoadFileReader(path).open()[0])
+                with (
+                    mock.patch.object(general, "get_planned_routes", side_effect=AssertionError) as get_planned_routes,
+                    mock.patch.object(
+                        general.CommonRoadFileReader,
+                        "open",
+                        autospec=True,
+                        side_effect=general.CommonRoadFileReader.open,
+                    ) as open_file,
+                ):
+                    self.assertEqual(
+                        all_tags & get_tags_of_group(TagGroupEnum.SCENARIO_LANELET_LAYOUT),
+                        find_scenario_tags(path, map_tag_cache, groups=[TagGroupEnum.SCENARIO_LANELET_LAYOUT]),
+                        msg=path.name,
+                    )
+                    get_planned_routes.assert_not_called()
+                    self.assertFalse(open_file.call_args.kwargs["lanelet_assignment"])
+
+            requested_tags = {
+                TagEnum.SCENARIO_OBSTACLE_TRAFFIC,
+                TagEnum.ROUTE_OBSTACLE_NO_ONCOMING_TRAFFIC,
+                TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_TURN_LEFT,
+            }
+            self.assertEqual(
+                all_tags & requested_tags, find_scenario_tags(path, MapTagCache(), tags=requested_tags), msg=path.name
+            )
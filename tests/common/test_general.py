@@ -0,0 +1,160 @@
+import os
+import pathlib
+import shutil
+import signal
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from commonroad_labeling.common import general
+from commonroad_labeling.common.general import (
+    get_detected_tag_masks,
+    get_detected_tags_by_file,
+    iter_detected_tags,
+    label_files,
+    label_files_profiled,
+)
+from commonroad_labeling.common.profiling import Profiler
+from commonroad_labeling.common.tag_mask import get_tag_sets
+
+SCENARIO_NAMES = ["DEU_BadEssen-2_5_I-1-1.cr.xml", "DEU_Hoerstein-1_1_I-1.cr.xml", "USA_Lanker-1_12_I-1-1.cr.xml"]
+
+
+def label_files_crashing(paths: list[pathlib.Path], timeout: float | None = None):
+    if any(path.name == SCENARIO_NAMES[1] for path in paths):
+        os._exit(1)
+    return label_files(paths, timeout)
+
+
+def label_files_hanging(paths: list[pathlib.Path], timeout: float | None = None):
+    if any(path.name == SCENARIO_NAMES[1] for path in paths):
+        # Native code that does not return to the interpreter cannot be interrupted by the handler of `SIGALRM`
+        with general.time_limit(timeout):
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+            time.sleep(3600)
+    return label_files(paths, timeout)
+
+
+def label_files_profiled_crashing(paths: list[pathlib.Path], timeout: float | None = None):
+    if any(path.name == SCENARIO_NAMES[1] for path in paths):
+        os._exit(1)
+    return label_files_profiled(paths, timeout)
+
+
+def label_files_profiled_hanging(paths: list[pathlib.Path], timeout: float | None = None):
+    if any(path.name == SCENARIO_NAMES[1] for path in paths):
+        with general.time_limit(timeout):
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+            time.sleep(3600)
+    return label_files_profiled(paths, timeout)
+
+
+class GeneralTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+        for index, scenario_name in enumerate(SCENARIO_NAMES):
+            # Nested folders to check that files are collected recursively in a deterministic order
+            destination = self.path.joinpath(*[str(level) for level in range(index)], scenario_name)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(pathlib.Path.cwd().joinpath("..", "scenarios", scenario_name), destination)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_detected_tags_by_file_parallel(self):
+        tags_by_file = get_detected_tags_by_file(self.path)
+        self.assertEqual(len(SCENARIO_NAMES), len(tags_by_file))
+        self.assertEqual(sorted(tags_by_file), list(tags_by_file))
+        self.assertTrue(all(tags is not None for tags in tags_by_file.values()))
+
+        parallel_tags_by_file = get_detected_tags_by_file(self.path, workers=2, chunk_size=1)
+        self.assertEqual(list(tags_by_file.items()), list(parallel_tags_by_file.items()))
+
+    def test_get_detected_tag_masks(self):
+        tags_by_file = get_detected_tags_by_file(self.path)
+        paths, masks, labeled = get_detected_tag_masks(self.path)
+        self.assertEqual(list(tags_by_file), paths)
+        self.assertEqual(np.uint64, masks.dtype)
+        self.assertTrue(labeled.all())
+        self.assertEqual(list(tags_by_file.values()), get_tag_sets(masks))
+
+        paths, masks, labeled = get_detected_tag_masks(self.path, timeout=1e-6)
+        self.assertEqual(list(tags_by_file), paths)
+        self.assertFalse(labeled.any())
+        self.assertFalse(masks.any())
+
+    def test_iter_detected_tags(self):
+        tags_by_file = get_detected_tags_by_file(self.path)
+        results = iter_detected_tags(self.path)
+        first_result = next(results)
+        self.assertEqual(next(iter(tags_by_file)), first_result.path)
+
+        for path, tags, error, timings in [first_result, *results]:
+            self.assertEqual(tags_by_file[path], tags)
+            self.assertIsNone(error)
+            self.assertEqual(
+                {"load", "lanelet_assignment", "map_tags", "obstacle_tags", "route_planning", "route_tags", "total"},
+                set(timings),
+            )
+            self.assertLessEqual(timings["load"], timings["total"])
+
+        tags_by_file = get_detected_tags_by_file(self.path, timeout=1e-6)
+        self.assertEqual(len(SCENARIO_NAMES), len(tags_by_file))
+        self.assertTrue(all(tags is None for tags in tags_by_file.values()))
+
+    def test_get_detected_tags_by_file_crash(self):
+        with mock.patch.object(general, "label_files", label_files_crashing):
+            tags_by_file = get_detected_tags_by_file(self.path, workers=2)
+
+        self.assertEqual(len(SCENARIO_NAMES), len(tags_by_file))
+        for path, tags in tags_by_file.items():
+            if path.name == SCENARIO_NAMES[1]:
+                self.assertIsNone(tags)
+            else:
+                self.assertIsNotNone(tags)
+
+    def test_get_detected_tags_by_file_crash_profiled(self):
+        with Profiler() as profiler, mock.patch.object(general, "label_files_profiled", label_files_profiled_crashing):
+            tags_by_file = get_detected_tags_by_file(self.path, workers=2)
+
+        self.assertEqual(len(SCENARIO_NAMES), len(tags_by_file))
+        labeled_paths = sorted(path for path, tags in tags_by_file.items() if tags is not None)
+        self.assertEqual([path for path in tags_by_file if path.name != SCENARIO_NAMES[1]], labeled_paths)
+        # Profiles of chunks whose process terminated abruptly are lost, only the retried files are profiled
+        self.assertEqual(labeled_paths, sorted(file_profile.path for file_profile in profiler.files))
+
+    @unittest.skipUnless(hasattr(signal, "pthread_sigmask"), "requires pthread_sigmask")
+    def test_get_detected_tags_by_file_hang(self):
+        with (
+            mock.patch.object(general, "label_files", label_files_hanging),
+            mock.patch.object(general, "POOL_TIMEOUT_MARGIN", 5.0),
+        ):
+            results = {result.path.name: result for result in general.iter_detected_tags(self.path, 2, timeout=1.0)}
+
+        self.assertEqual(set(SCENARIO_NAMES), set(results))
+        for name, result in results.items():
+            if name == SCENARIO_NAMES[1]:
+                self.assertIsNone(result.tags)
+                self.assertIn("did not finish", result.error)
+            else:
+                self.assertIsNotNone(result.tags)
+
+    @unittest.skipUnless(hasattr(signal, "pthread_sigmask"), "requires pthread_sigmask")
+    def test_get_detected_tags_by_file_hang_profiled(self):
+        with (
+            Profiler() as profiler,
+            mock.patch.object(general, "label_files_profiled", label_files_profiled_hanging),
+            mock.patch.object(general, "POOL_TIMEOUT_MARGIN", 5.0),
+        ):
+            results = {result.path.name: result for result in general.iter_detected_tags(self.path, 2, timeout=1.0)}
+
+        self.assertEqual(set(SCENARIO_NAMES), set(results))
+        self.assertIn("did not finish", results[SCENARIO_NAMES[1]].error)
+        self.assertEqual(
+            sorted(name for name in SCENARIO_NAMES if name != SCENARIO_NAMES[1]),
+            sorted(file_profile.path.name for file_profile in profiler.files),
+        )
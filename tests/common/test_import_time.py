@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Imports that are only needed to compute criticality metrics, plan reference paths or plot
+HEAVY_MODULES = ["matplotlib", "sklearn", "commonroad_rp", "commonroad_route_planner", "commonroad_crime"]
+
+# The import time of a module is compared with the import time of the CommonRoad file reader, which is required by all
+# modules anyway, so that the budget does not depend on the speed of the machine
+REFERENCE_MODULE = "commonroad.common.file_reader"
+IMPORT_TIME_RATIO_BUDGET = 3.0
+
+IMPORT_SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+{statement}
+print(",".join(sorted({{name.split(".")[0] for name in sys.modules}})))
+"""
+
+
+def import_in_subprocess(module: str, statement: str = "") -> tuple[float, set[str]]:
+    """
+    Imports a module in a fresh interpreter.
+    :param module: The name of the module to import.
+    :param statement: Python statement executed after the import, e.g. to access attributes of the module.
+    :returns: The import time in seconds and the names of the top-level packages that were loaded.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module, statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+    return float(output[0]), set(output[1].split(","))
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_no_heavy_imports(self):
+        for module in [
+            "commonroad_labeling.common.general",
+            "commonroad_labeling.criticality.computer.cm_computer",
+            "commonroad_labeling.criticality.analyzer.cm_analyzer",
+        ]:
+            with self.subTest(module=module):
+                _, loaded_modules = import_in_subprocess(module)
+                self.assertEqual(set(), loaded_modules.intersection(HEAVY_MODULES))
+
+    @unittest.skipIf("SKIP_IMPORT_TIME_BUDGET" in os.environ, "import time budget disabled")
+    def test_import_time_budget(self):
+        reference_seconds = min(import_in_subprocess(REFERENCE_MODULE)[0] for _ in range(3))
+        seconds = min(import_in_subprocess("commonroad_labeling.common.general")[0] for _ in range(3))
+        self.assertLess(seconds, IMPORT_TIME_RATIO_BUDGET * reference_seconds)
+
+    def test_lazy_imports_on_use(self):
+        _, loaded_modules = import_in_subprocess(
+            "commonroad_labeling.criticality.analyzer.cm_analyzer",
+            "commonroad_labeling.criticality.analyzer.cm_analyzer.get_negative_monotone_metrics()",
+        )
+        self.assertIn("commonroad_crime", loaded_modules)
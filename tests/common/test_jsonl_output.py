@@ -0,0 +1,38 @@
+import pathlib
+import tempfile
+import unittest
+
+from commonroad_labeling.common.general import LabelingResult
+from commonroad_labeling.common.jsonl_output import JsonlResultWriter, read_results_jsonl, write_results_jsonl
+from commonroad_labeling.common.tag import TagEnum
+
+
+class JsonlOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.results = [
+            LabelingResult(
+                pathlib.Path("first.xml"),
+                {TagEnum.SCENARIO_LANELET_LAYOUT_ONE_WAY, TagEnum.SCENARIO_OBSTACLE_STATIC},
+                None,
+                {"load": 0.5, "total": 1.0},
+            ),
+            LabelingResult(
+                pathlib.Path("second.xml"), None, "Labeling did not finish within 1 seconds.", {"total": 1.0}
+            ),
+        ]
+
+    def test_write_and_read_results(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory).joinpath("results.jsonl")
+            self.assertEqual(2, write_results_jsonl(self.results, path))
+            self.assertEqual(1, write_results_jsonl(self.results[:1], path))
+            self.assertEqual(self.results + self.results[:1], list(read_results_jsonl(path)))
+
+    def test_results_are_flushed_periodically(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory).joinpath("results.jsonl")
+            with JsonlResultWriter(path, flush_every=2, flush_interval=float("inf")) as writer:
+                writer.write(self.results[0])
+                self.assertEqual([], list(read_results_jsonl(path)))
+                writer.write(self.results[1])
+                self.assertEqual(self.results, list(read_results_jsonl(path)))
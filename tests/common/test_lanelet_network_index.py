@@ -0,0 +1,158 @@
+import unittest
+
+from commonroad.scenario.lanelet import LaneletNetwork
+
+from commonroad_labeling.common.lanelet_network_index import (
+    IntersectionManeuver,
+    clear_lanelet_network_indexes,
+    get_intersection_lanelet_ids,
+    get_lanelet_network_index,
+    get_strongly_connected_components,
+)
+from commonroad_labeling.util_tests import create_straight_lanelet, get_scenario_for_error, get_scenarios
+
+
+class LaneletNetworkIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.scenarios = get_scenarios()
+
+    def test_lanelet_network_index_is_shared(self):
+        for scenario in self.scenarios:
+            self.assertIs(
+                get_lanelet_network_index(scenario.lanelet_network),
+                get_lanelet_network_index(scenario.lanelet_network),
+                msg=get_scenario_for_error(str(scenario.scenario_id)),
+            )
+
+    def test_clear_lanelet_network_indexes(self):
+        scenario = self.scenarios[0]
+        index = get_lanelet_network_index(scenario.lanelet_network)
+        spatial_index = index.spatial_index
+
+        clear_lanelet_network_indexes()
+        cleared_index = get_lanelet_network_index(scenario.lanelet_network)
+        self.assertIsNot(index, cleared_index)
+        self.assertIsNot(spatial_index, cleared_index.spatial_index)
+        self.assertEqual(index.cyclic_lanelet_ids, cleared_index.cyclic_lanelet_ids)
+
+    def test_lanelet_network_index_lanelets(self):
+        for scenario in self.scenarios:
+            index = get_lanelet_network_index(scenario.lanelet_network)
+            for lanelet in scenario.lanelet_network.lanelets:
+                self.assertIs(lanelet, index.find_lanelet_by_id(lanelet.lanelet_id))
+                self.assertEqual(set(lanelet.successor), index.successors[lanelet.lanelet_id])
+                self.assertEqual(set(lanelet.predecessor), index.predecessors[lanelet.lanelet_id])
+                self.assertEqual(
+                    (lanelet.adj_left, lanelet.adj_left_same_direction), index.adj_left[lanelet.lanelet_id]
+                )
+                self.assertEqual(
+                    (lanelet.adj_right, lanelet.adj_right_same_direction), index.adj_right[lanelet.lanelet_id]
+                )
+            self.assertIsNone(index.find_lanelet_by_id(None), msg=get_scenario_for_error(str(scenario.scenario_id)))
+
+    def test_lanelet_network_index_traffic_signs(self):
+        for scenario in self.scenarios:
+            index = get_lanelet_network_index(scenario.lanelet_network)
+            for traffic_sign in scenario.lanelet_network.traffic_signs:
+                self.assertEqual(
+                    {element.traffic_sign_element_id for element in traffic_sign.traffic_sign_elements},
+                    index.traffic_sign_element_ids[traffic_sign.traffic_sign_id],
+                    msg=get_scenario_for_error(str(scenario.scenario_id)),
+                )
+
+    def test_lanelet_network_index_intersections(self):
+        for scenario in self.scenarios:
+            index = get_lanelet_network_index(scenario.lanelet_network)
+            for lanelet in scenario.lanelet_network.lanelets:
+                expected_intersection = None
+                for intersection in scenario.lanelet_network.intersections:
+                    if lanelet.lanelet_id in get_intersection_lanelet_ids(intersection):
+                        expected_intersection = intersection
+                        break
+                self.assertIs(
+                    expected_intersection,
+                    index.get_intersection_by_lanelet_id(lanelet.lanelet_id),
+                    msg=get_scenario_for_error(str(scenario.scenario_id)),
+                )
+            self.assertEqual(
+                set().union(*map(get_intersection_lanelet_ids, scenario.lanelet_network.intersections)),
+                index.intersection_lanelet_ids,
+                msg=get_scenario_for_error(str(scenario.scenario_id)),
+            )
+
+    def test_lanelet_network_index_intersection_maneuvers(self):
+        for scenario in self.scenarios:
+            index = get_lanelet_network_index(scenario.lanelet_network)
+            for lanelet in scenario.lanelet_network.lanelets:
+                intersection = index.get_intersection_by_lanelet_id(lanelet.lanelet_id)
+                expected_maneuvers = set()
+                for incoming in intersection.incomings if intersection is not None else []:
+                    if lanelet.lanelet_id in incoming.successors_left:
+                        expected_maneuvers.add(IntersectionManeuver.LEFT)
+                    if lanelet.lanelet_id in incoming.successors_right:
+                        expected_maneuvers.add(IntersectionManeuver.RIGHT)
+                    if lanelet.lanelet_id in incoming.successors_straight:
+                        expected_maneuvers.add(IntersectionManeuver.STRAIGHT)
+
+                if expected_maneuvers:
+                    self.assertEqual(
+                        (intersection.intersection_id, expected_maneuvers),
+                        index.intersection_maneuvers[lanelet.lanelet_id],
+                        msg=get_scenario_for_error(str(scenario.scenario_id)),
+                    )
+                else:
+                    self.assertNotIn(
+                        lanelet.lanelet_id,
+                        index.intersection_maneuvers,
+                        msg=get_scenario_for_error(str(scenario.scenario_id)),
+                    )
+                self.assertEqual(expected_maneuvers, index.get_route_intersection_maneuvers([lanelet.lanelet_id]))
+
+    def test_lanelet_network_index_one_way(self):
+        for scenario in self.scenarios:
+            index = get_lanelet_network_index(scenario.lanelet_network)
+            for lanelet in scenario.lanelet_network.lanelets:
+                if lanelet.adj_left_same_direction is False or lanelet.adj_right_same_direction is False:
+                    self.assertFalse(
+                        index.is_one_way(lanelet.lanelet_id), msg=get_scenario_for_error(str(scenario.scenario_id))
+                    )
+                elif index.is_one_way(lanelet.lanelet_id):
+                    for adjacent_lanelet_id in [lanelet.adj_left, lanelet.adj_right]:
+                        if adjacent_lanelet_id in index.lanelets:
+                            self.assertTrue(
+                                index.is_one_way(adjacent_lanelet_id),
+                                msg=get_scenario_for_error(str(scenario.scenario_id)),
+                            )
+
+    def test_lanelet_network_index_one_way_referenced_neighbour(self):
+        lanelet_network = LaneletNetwork.create_from_lanelet_list(
+            [
+                create_straight_lanelet(1, adjacent_left=2, adjacent_left_same_direction=False),
+                create_straight_lanelet(2),
+                create_straight_lanelet(3, adjacent_right=1, adjacent_right_same_direction=True),
+            ]
+        )
+        index = get_lanelet_network_index(lanelet_network)
+        self.assertFalse(index.is_one_way(1))
+        self.assertTrue(index.is_one_way(2))
+        self.assertFalse(index.is_one_way(3))
+
+    def test_strongly_connected_components(self):
+        graph = {
+            1: frozenset({2}),
+            2: frozenset({3, 5}),
+            3: frozenset({1}),
+            4: frozenset({4}),
+            5: frozenset({6, 42}),
+            6: frozenset(),
+        }
+        components = get_strongly_connected_components(graph)
+        self.assertCountEqual([{1, 2, 3}, {4}, {5}, {6}], components)
+
+    def test_strongly_connected_components_long_chain(self):
+        chain_length = 100000
+        graph = {node: frozenset({node + 1}) for node in range(chain_length)}
+        graph[chain_length] = frozenset({chain_length - 1})
+        components = get_strongly_connected_components(graph)
+        self.assertEqual(chain_length, len(components))
+        self.assertIn({chain_length - 1, chain_length}, components)
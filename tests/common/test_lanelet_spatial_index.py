@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_index
+from commonroad_labeling.road_configuration.scenario.scenario_obstacle import get_obstacle_positions
+from commonroad_labeling.util_tests import get_scenario_for_error, get_scenarios
+
+
+class LaneletSpatialIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.scenarios = get_scenarios()
+
+    def test_query(self):
+        random_generator = np.random.default_rng(0)
+        for scenario in self.scenarios:
+            spatial_index = get_lanelet_network_index(scenario.lanelet_network).spatial_index
+            self.assertIs(spatial_index, get_lanelet_network_index(scenario.lanelet_network).spatial_index)
+
+            # Positions of obstacles, vertices on lanelet boundaries and random positions around the lanelets
+            points = [
+                position for obstacle in scenario.dynamic_obstacles for position in get_obstacle_positions(obstacle)
+            ]
+            for lanelet in scenario.lanelet_network.lanelets:
+                points.extend([lanelet.left_vertices[0], lanelet.center_vertices[-1]])
+            lanelet_vertices = np.concatenate(
+                [lanelet.center_vertices for lanelet in scenario.lanelet_network.lanelets]
+            )
+            points.extend(
+                lanelet_vertices[random_generator.integers(0, len(lanelet_vertices), 500)]
+                + random_generator.normal(0, 5, (500, 2))
+            )
+
+            expected_lanelet_ids = scenario.lanelet_network.find_lanelet_by_position(points)
+            self.assertEqual(
+                expected_lanelet_ids,
+                spatial_index.query_lanelet_id_lists(np.array(points)),
+                msg=get_scenario_for_error(str(scenario.scenario_id)),
+            )
+            self.assertEqual(
+                [set(lanelet_ids) for lanelet_ids in expected_lanelet_ids],
+                spatial_index.query(points),
+                msg=get_scenario_for_error(str(scenario.scenario_id)),
+            )
+
+    def test_query_empty(self):
+        spatial_index = get_lanelet_network_index(self.scenarios[0].lanelet_network).spatial_index
+        self.assertEqual([], spatial_index.query([]))
+        self.assertEqual([], spatial_index.query(np.empty((0, 2))))
+        self.assertEqual([set()], spatial_index.query(np.array([[1.0e9, 1.0e9]])))
@@ -0,0 +1,82 @@
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from commonroad.common.file_reader import CommonRoadFileReader
+
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_fingerprint, get_lanelet_network_index
+from commonroad_labeling.common.map_cache import MapTagCache, find_map_tags
+from commonroad_labeling.util_tests import get_scenario_for_error, get_scenarios
+
+
+class MapCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.scenarios = get_scenarios()
+        path = pathlib.Path.cwd().joinpath("..", "scenarios", "MONA", "MONA-East")
+        self.mona_scenarios = [
+            CommonRoadFileReader(str(filename)).open(lanelet_assignment=True)[0]
+            for filename in sorted(path.glob("*.xml"))[:2]
+        ]
+
+    def test_lanelet_network_fingerprint(self):
+        fingerprints = {get_lanelet_network_fingerprint(scenario.lanelet_network) for scenario in self.scenarios}
+        self.assertEqual(len(self.scenarios), len(fingerprints))
+
+        first_scenario, second_scenario = self.mona_scenarios
+        self.assertIsNot(first_scenario.lanelet_network, second_scenario.lanelet_network)
+        self.assertEqual(
+            get_lanelet_network_fingerprint(first_scenario.lanelet_network),
+            get_lanelet_network_fingerprint(second_scenario.lanelet_network),
+        )
+
+    def test_lanelet_network_index_is_rebound(self):
+        first_scenario, second_scenario = self.mona_scenarios
+        first_index = get_lanelet_network_index(first_scenario.lanelet_network)
+        cyclic_lanelet_ids = first_index.cyclic_lanelet_ids
+        second_index = get_lanelet_network_index(second_scenario.lanelet_network)
+
+        self.assertIsNot(first_index, second_index)
+        self.assertIs(cyclic_lanelet_ids, second_index.cyclic_lanelet_ids)
+        for lanelet in second_scenario.lanelet_network.lanelets:
+            self.assertIs(lanelet, second_index.find_lanelet_by_id(lanelet.lanelet_id))
+            intersection = second_index.get_intersection_by_lanelet_id(lanelet.lanelet_id)
+            if intersection is not None:
+                self.assertIn(intersection, second_scenario.lanelet_network.intersections)
+
+    def test_map_tag_cache(self):
+        map_tag_cache = MapTagCache()
+        for scenario in self.scenarios + self.mona_scenarios:
+            self.assertEqual(
+                find_map_tags(scenario),
+                map_tag_cache.get_map_tags(scenario),
+                msg=get_scenario_for_error(str(scenario.scenario_id)),
+            )
+
+    def test_map_tag_cache_max_size(self):
+        first_scenario, second_scenario = self.scenarios[:2]
+        for max_size, expected_detections in [(1, 3), (2, 2)]:
+            map_tag_cache = MapTagCache(max_size=max_size)
+            with mock.patch("commonroad_labeling.common.map_cache.find_map_tags", wraps=find_map_tags) as find_tags:
+                for scenario in [first_scenario, second_scenario, first_scenario]:
+                    map_tag_cache.get_map_tags(scenario)
+            self.assertEqual(expected_detections, find_tags.call_count, msg=f"max_size={max_size}")
+
+    def test_map_tag_cache_on_disk(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for scenario in self.scenarios:
+                expected_tags = MapTagCache(pathlib.Path(cache_dir)).get_map_tags(scenario)
+                self.assertEqual(
+                    expected_tags,
+                    MapTagCache(pathlib.Path(cache_dir)).get_map_tags(scenario),
+                    msg=get_scenario_for_error(str(scenario.scenario_id)),
+                )
+            self.assertEqual(len(self.scenarios), len(list(pathlib.Path(cache_dir).glob("*/*.json"))))
+
+    def test_map_tag_cache_on_disk_is_versioned(self):
+        scenario = self.scenarios[0]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            MapTagCache(pathlib.Path(cache_dir), detector_set_version="outdated").get_map_tags(scenario)
+            with mock.patch("commonroad_labeling.common.map_cache.find_map_tags", wraps=find_map_tags) as find_tags:
+                MapTagCache(pathlib.Path(cache_dir)).get_map_tags(scenario)
+                find_tags.assert_called_once()
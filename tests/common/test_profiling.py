@@ -0,0 +1,152 @@
+import csv
+import json
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+from commonroad.common.file_reader import CommonRoadFileReader
+from commonroad.scenario.lanelet import LaneletNetwork
+
+from commonroad_labeling.common.general import find_scenario_tags, get_detected_tags_by_file
+from commonroad_labeling.common.map_cache import MapTagCache
+from commonroad_labeling.common.profiling import CSV_COLUMNS, ProfileEntry, Profiler, get_active_profiler
+from commonroad_labeling.common.tag import Tag
+from commonroad_labeling.road_configuration.scenario.scenario_obstacle import ObstacleStatic
+
+SCENARIO_NAMES = ["DEU_BadEssen-2_5_I-1-1.cr.xml", "USA_Lanker-1_12_I-1-1.cr.xml"]
+
+STAGES = ["load", "lanelet_assignment", "map_tags", "obstacle_tags", "route_planning", "route_tags"]
+
+
+class ProfilingTest(unittest.TestCase):
+    def setUp(self):
+        self.paths = [pathlib.Path.cwd().joinpath("..", "scenarios", scenario_name) for scenario_name in SCENARIO_NAMES]
+
+    def test_profiler_records_files(self):
+        with Profiler() as profiler:
+            self.assertIs(profiler, get_active_profiler())
+            for path in self.paths:
+                find_scenario_tags(path, MapTagCache())
+
+        self.assertEqual(self.paths, [file_profile.path for file_profile in profiler.files])
+        for file_profile in profiler.files:
+            self.assertEqual(STAGES, list(file_profile.stages))
+            for entry in file_profile.stages.values():
+                self.assertEqual(1, entry.calls)
+                self.assertGreaterEqual(entry.seconds, 0.0)
+            self.assertGreater(file_profile.stages["route_planning"].find_lanelet_by_position, 0)
+            self.assertEqual(1, file_profile.detectors["LaneletTagScanner"].calls)
+            self.assertEqual(1, file_profile.detectors["ObstacleStatic"].calls)
+            self.assertGreater(file_profile.detectors["RouteLaneletLayoutSingleLane"].calls, 0)
+            self.assertGreater(sum(entry.find_lanelet_by_id for entry in file_profile.detectors.values()), 0)
+
+    def test_profiler_disabled(self):
+        get_tag_if_fulfilled = Tag.get_tag_if_fulfilled
+        find_lanelet_by_id = LaneletNetwork.find_lanelet_by_id
+        profiler = Profiler()
+        profiler.enable()
+        self.assertIsNot(get_tag_if_fulfilled, Tag.get_tag_if_fulfilled)
+        with self.assertRaises(RuntimeError):
+            Profiler().enable()
+        profiler.disable()
+
+        self.assertIsNone(get_active_profiler())
+        self.assertIs(get_tag_if_fulfilled, Tag.get_tag_if_fulfilled)
+        self.assertIs(find_lanelet_by_id, LaneletNetwork.find_lanelet_by_id)
+        find_scenario_tags(self.paths[0])
+        self.assertEqual([], profiler.files)
+
+    def test_profiler_aggregation(self):
+        profilers = []
+        for path in self.paths:
+            with Profiler() as profiler:
+                find_scenario_tags(path, MapTagCache())
+            profilers.append(profiler)
+
+        merged_profiler = Profiler()
+        for profiler in profilers:
+            merged_profiler.merge(profiler)
+        totals = merged_profiler.get_totals()
+
+        self.assertEqual(len(self.paths), len(merged_profiler.files))
+        for stage in STAGES:
+            expected_entry = ProfileEntry()
+            for profiler in profilers:
+                expected_entry.add(profiler.files[0].stages[stage])
+            self.assertEqual(expected_entry, totals.stages[stage])
+        self.assertEqual(len(self.paths), totals.detectors["LaneletTagScanner"].calls)
+
+    def test_profiler_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for path in self.paths:
+                shutil.copy(path, directory)
+            with Profiler() as profiler:
+                get_detected_tags_by_file(pathlib.Path(directory), workers=2, chunk_size=1)
+
+            self.assertEqual(
+                sorted(pathlib.Path(directory).joinpath(scenario_name) for scenario_name in SCENARIO_NAMES),
+                sorted(file_profile.path for file_profile in profiler.files),
+            )
+        for file_profile in profiler.files:
+            self.assertEqual(STAGES, list(file_profile.stages))
+            self.assertEqual(1, file_profile.detectors["LaneletTagScanner"].calls)
+        self.assertEqual(len(self.paths), profiler.get_totals().stages["load"].calls)
+
+    def test_profiler_export(self):
+        with Profiler() as profiler:
+            for path in self.paths:
+                find_scenario_tags(path, MapTagCache())
+
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = pathlib.Path(directory).joinpath("profile.json")
+            profiler.save_json(json_path)
+            with open(json_path) as file:
+                report = json.load(file)
+            self.assertEqual(profiler.get_report(), report)
+            self.assertEqual([str(path) for path in self.paths], [file["path"] for file in report["files"]])
+
+            csv_path = pathlib.Path(directory).joinpath("profile.csv")
+            profiler.save_csv(csv_path)
+            with open(csv_path, newline="") as file:
+                rows = list(csv.DictReader(file))
+
+        self.assertEqual(CSV_COLUMNS, list(rows[0]))
+        total_rows = [row for row in rows if row["path"] == ""]
+        self.assertEqual(STAGES, [row["name"] for row in total_rows if row["kind"] == "stage"])
+        for path in self.paths:
+            file_rows = [row for row in rows if row["path"] == str(path)]
+            self.assertEqual(len(STAGES), len([row for row in file_rows if row["kind"] == "stage"]))
+            self.assertIn("ObstacleStatic", [row["name"] for row in file_rows if row["kind"] == "detector"])
+
+    def test_profiler_keyword_arguments(self):
+        scenario, _ = CommonRoadFileReader(self.paths[0]).open()
+        lanelet_network = scenario.lanelet_network
+        lanelet = lanelet_network.lanelets[0]
+        with Profiler() as profiler:
+            profiler.start_file(self.paths[0])
+            self.assertIs(lanelet, lanelet_network.find_lanelet_by_id(lanelet_id=lanelet.lanelet_id))
+            self.assertEqual(
+                lanelet_network.find_lanelet_by_position([lanelet.center_vertices[0]]),
+                lanelet_network.find_lanelet_by_position(point_list=[lanelet.center_vertices[0]]),
+            )
+            profiler.record_stage("lookups", 0.0)
+            ObstacleStatic(scenario=scenario).get_tag_if_fulfilled()
+
+        entry = profiler.files[0].stages["lookups"]
+        self.assertEqual(1, entry.find_lanelet_by_id)
+        self.assertEqual(2, entry.find_lanelet_by_position)
+        self.assertEqual(1, profiler.files[0].detectors["ObstacleStatic"].calls)
+
+    def test_profiler_failed_file(self):
+        scenario, _ = CommonRoadFileReader(self.paths[0]).open()
+        missing_path = self.paths[0].with_name("missing.xml")
+        with Profiler() as profiler:
+            with self.assertRaises(Exception):
+                find_scenario_tags(missing_path)
+            ObstacleStatic(scenario).get_tag_if_fulfilled()
+
+        # Measurements after the failed file are not attributed to it
+        self.assertEqual([missing_path, None], [file_profile.path for file_profile in profiler.files])
+        self.assertNotIn("ObstacleStatic", profiler.files[0].detectors)
+        self.assertIn("ObstacleStatic", profiler.files[1].detectors)
@@ -0,0 +1,135 @@
+import pathlib
+import tempfile
+import unittest
+
+from commonroad_labeling.common.detector_registry import DETECTORS, DetectorDependency
+from commonroad_labeling.common.general import find_scenario_tags
+from commonroad_labeling.common.map_cache import MapTagCache
+from commonroad_labeling.common.profiling import Profiler
+from commonroad_labeling.common.query_planner import (
+    DEFAULT_DEPENDENCY_COSTS,
+    PROFILER_STAGE_DEPENDENCIES,
+    DetectorCostModel,
+    QueryPlanner,
+    get_missing_dependencies,
+    get_undecided_tags,
+)
+from commonroad_labeling.common.tag import TagEnum
+from commonroad_labeling.common.tag_query import parse_tag_query
+
+SCENARIO_NAMES = ["DEU_BadEssen-2_5_I-1-1.cr.xml", "DEU_Hoerstein-1_1_I-1.cr.xml", "USA_Lanker-1_12_I-1-1.cr.xml"]
+
+QUERIES = [
+    "SCENARIO_LANELET_LAYOUT_INTERSECTION",
+    "ROUTE_LANELET_LAYOUT_ROUNDABOUT AND SCENARIO_TRAFFIC_SIGN_TRAFFIC_LIGHT",
+    "intersection AND turn_left AND NOT traffic_light",
+    "(scenario_obstacle|traffic AND NOT route_obstacle) OR one_way",
+    "NOT ROUTE_OBSTACLE_ONCOMING_TRAFFIC",
+]
+
+
+class QueryPlannerTest(unittest.TestCase):
+    def setUp(self):
+        self.paths = [pathlib.Path.cwd().joinpath("..", "scenarios", scenario_name) for scenario_name in SCENARIO_NAMES]
+        self.tags_by_path = {path: find_scenario_tags(path) for path in self.paths}
+
+    def test_query_planner_matches_full_labeling(self):
+        for query in QUERIES:
+            planner = QueryPlanner(query)
+            for path in self.paths:
+                result = planner.evaluate_file(path)
+                self.assertIsNone(result.error)
+                self.assertEqual(planner.query.evaluate(self.tags_by_path[path]), result.matches, msg=f"{query} {path}")
+                self.assertLessEqual(result.tags, self.tags_by_path[path])
+
+    def test_query_planner_short_circuits(self):
+        planner = QueryPlanner("SCENARIO_LANELET_LAYOUT_INTERSECTION AND ROUTE_OBSTACLE_STATIC")
+        for path in self.paths:
+            result = planner.evaluate_file(path)
+            if TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION not in self.tags_by_path[path]:
+                # The map detector rejects the file before its obstacles are parsed or its routes are planned
+                self.assertFalse(result.matches)
+                self.assertEqual(1, len(result.detectors))
+                self.assertEqual({DetectorDependency.MAP}, result.detectors[0].dependencies)
+            else:
+                self.assertEqual(TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION, next(iter(result.detectors[0].tags)))
+
+    def test_query_planner_find_matching_files(self):
+        query = "SCENARIO_LANELET_LAYOUT_INTERSECTION OR SCENARIO_LANELET_LAYOUT_ROUNDABOUT"
+        self.assertEqual(
+            sorted(path for path in self.paths if parse_tag_query(query).evaluate(self.tags_by_path[path])),
+            [path for path in self.paths if path in QueryPlanner(query).find_matching_files(path)],
+        )
+
+    def test_get_undecided_tags(self):
+        query = parse_tag_query(
+            "(SCENARIO_LANELET_LAYOUT_INTERSECTION AND ROUTE_OBSTACLE_STATIC) OR SCENARIO_TRAFFIC_SIGN_STOP_LINE"
+        )
+        self.assertEqual(query.get_tags(), get_undecided_tags(query, set(), set()))
+        self.assertEqual(
+            {TagEnum.SCENARIO_TRAFFIC_SIGN_STOP_LINE},
+            get_undecided_tags(query, set(), {TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION}),
+        )
+        self.assertEqual(
+            set(),
+            get_undecided_tags(
+                query, {TagEnum.SCENARIO_TRAFFIC_SIGN_STOP_LINE}, {TagEnum.SCENARIO_TRAFFIC_SIGN_STOP_LINE}
+            ),
+        )
+
+    def test_detector_cost_model(self):
+        route_detector = next(detector for detector in DETECTORS if DetectorDependency.ROUTES in detector.dependencies)
+        map_detector = DETECTORS[0]
+        self.assertEqual(
+            [DetectorDependency.OBSTACLES, DetectorDependency.ROUTES],
+            get_missing_dependencies(route_detector.dependencies, ()),
+        )
+        self.assertEqual([], get_missing_dependencies(map_detector.dependencies, [DetectorDependency.OBSTACLES]))
+
+        cost_model = DetectorCostModel()
+        self.assertLess(cost_model.get_detector_cost(map_detector), cost_model.get_detector_cost(route_detector))
+        self.assertLess(
+            cost_model.get_detector_cost(route_detector, [DetectorDependency.MAP, DetectorDependency.OBSTACLES]),
+            cost_model.get_detector_cost(route_detector),
+        )
+
+        cost_model.observe_dependency(DetectorDependency.MAP, 1.0)
+        cost_model.observe_dependency(DetectorDependency.MAP, 3.0)
+        cost_model.observe_detector(map_detector, 0.5)
+        self.assertEqual(2.0, cost_model.get_dependency_cost(DetectorDependency.MAP))
+        self.assertEqual(2.5, cost_model.get_detector_cost(map_detector))
+        self.assertEqual(
+            DEFAULT_DEPENDENCY_COSTS[DetectorDependency.ROUTES],
+            cost_model.get_dependency_cost(DetectorDependency.ROUTES),
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory, "costs.json")
+            cost_model.save(path)
+            loaded_cost_model = DetectorCostModel.load(path)
+        self.assertEqual(2.5, loaded_cost_model.get_detector_cost(map_detector))
+        self.assertEqual(
+            cost_model.get_detector_cost(route_detector), loaded_cost_model.get_detector_cost(route_detector)
+        )
+
+    def test_detector_cost_model_from_profiler(self):
+        with Profiler() as profiler:
+            for path in self.paths:
+                find_scenario_tags(path, MapTagCache())
+        totals = profiler.get_totals()
+
+        cost_model = DetectorCostModel.from_profiler(profiler)
+        for stage, dependency in PROFILER_STAGE_DEPENDENCIES.items():
+            self.assertAlmostEqual(
+                totals.stages[stage].seconds / len(self.paths), cost_model.get_dependency_cost(dependency)
+            )
+        self.assertEqual(
+            DEFAULT_DEPENDENCY_COSTS[DetectorDependency.MAP], cost_model.get_dependency_cost(DetectorDependency.MAP)
+        )
+
+        route_detector = next(detector for detector in DETECTORS if DetectorDependency.ROUTES in detector.dependencies)
+        entry = totals.detectors[route_detector.detector_class.__name__]
+        self.assertAlmostEqual(
+            entry.seconds / entry.calls,
+            cost_model.get_detector_cost(route_detector, route_detector.dependencies),
+        )
@@ -0,0 +1,60 @@
+import pathlib
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from commonroad_labeling.common import general
+from commonroad_labeling.common.general import get_detected_tags_by_file
+from commonroad_labeling.common.result_cache import ResultCache, get_detector_set_version, get_file_content_hash
+from commonroad_labeling.common.tag import TagEnum
+
+SCENARIO_NAMES = ["DEU_BadEssen-2_5_I-1-1.cr.xml", "USA_Lanker-1_12_I-1-1.cr.xml"]
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.scenario_dir = pathlib.Path(self.directory.name).joinpath("scenarios")
+        self.scenario_dir.mkdir()
+        for scenario_name in SCENARIO_NAMES:
+            shutil.copy(pathlib.Path.cwd().joinpath("..", "scenarios", scenario_name), self.scenario_dir)
+        self.result_cache = ResultCache(pathlib.Path(self.directory.name).joinpath("cache"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_result_cache(self):
+        content_hash = get_file_content_hash(self.scenario_dir.joinpath(SCENARIO_NAMES[0]))
+        self.assertIsNone(self.result_cache.get(content_hash))
+
+        tags = {TagEnum.SCENARIO_LANELET_LAYOUT_ONE_WAY}
+        self.result_cache.put(content_hash, tags)
+        self.assertEqual(tags, self.result_cache.get(content_hash))
+        self.assertEqual(get_detector_set_version(), self.result_cache.detector_set_version)
+
+        outdated_result_cache = ResultCache(self.result_cache.cache_dir, detector_set_version="outdated")
+        self.assertIsNone(outdated_result_cache.get(content_hash))
+
+    def test_result_cache_removes_temporary_file_on_failure(self):
+        with mock.patch("json.dump", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.result_cache.put("failing", {TagEnum.SCENARIO_LANELET_LAYOUT_ONE_WAY})
+        self.assertEqual([], list(self.result_cache.version_dir.iterdir()))
+
+    def test_get_detected_tags_by_file_with_result_cache(self):
+        tags_by_file = get_detected_tags_by_file(self.scenario_dir, result_cache=self.result_cache)
+        self.assertTrue(all(tags is not None for tags in tags_by_file.values()))
+
+        # Unchanged files must not be parsed again
+        with mock.patch.object(general, "find_scenario_tags", side_effect=RuntimeError) as find_scenario_tags:
+            self.assertEqual(tags_by_file, get_detected_tags_by_file(self.scenario_dir, result_cache=self.result_cache))
+            find_scenario_tags.assert_not_called()
+
+        # Modified files must be labeled again
+        modified_path = self.scenario_dir.joinpath(SCENARIO_NAMES[0])
+        with open(modified_path, "a") as modified_file:
+            modified_file.write("\n")
+        with mock.patch.object(general, "find_scenario_tags", wraps=general.find_scenario_tags) as find_scenario_tags:
+            self.assertEqual(tags_by_file, get_detected_tags_by_file(self.scenario_dir, result_cache=self.result_cache))
+            self.assertEqual([modified_path], [call.args[0] for call in find_scenario_tags.call_args_list])
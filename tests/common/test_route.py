@@ -0,0 +1,37 @@
+import pathlib
+import unittest
+
+from commonroad.common.file_reader import CommonRoadFileReader
+
+from commonroad_labeling.common.general import find_scenario_tags, get_planned_routes
+from commonroad_labeling.common.map_cache import MapTagCache
+from commonroad_labeling.common.route import LaneletRoute, RouteMode
+
+SCENARIO_NAMES = ["DEU_Hoerstein-1_1_I-1.cr.xml", "USA_Peach-3_3_I-1-1.cr.xml", "ZAM_Tjunction-1_97_T-1.xml"]
+
+
+class RouteTest(unittest.TestCase):
+    def setUp(self):
+        self.paths = [pathlib.Path.cwd().joinpath("..", "scenarios", scenario_name) for scenario_name in SCENARIO_NAMES]
+
+    def test_lanelet_routes(self):
+        for path in self.paths:
+            scenario, planning_problem_set = CommonRoadFileReader(path).open()
+            reference_paths = get_planned_routes(scenario, planning_problem_set)
+            lanelet_routes = get_planned_routes(scenario, planning_problem_set, route_mode=RouteMode.LANELET_SEQUENCE)
+
+            self.assertTrue(all(isinstance(route, LaneletRoute) for route in lanelet_routes))
+            self.assertTrue(all(route.lanelet_network is scenario.lanelet_network for route in lanelet_routes))
+            self.assertEqual(
+                [tuple(route.lanelet_ids) for route in reference_paths],
+                [route.lanelet_ids for route in lanelet_routes],
+                msg=path.name,
+            )
+
+    def test_find_scenario_tags_route_modes(self):
+        for path in self.paths:
+            self.assertEqual(
+                find_scenario_tags(path, MapTagCache(), route_mode=RouteMode.REFERENCE_PATH),
+                find_scenario_tags(path, MapTagCache(), route_mode=RouteMode.LANELET_SEQUENCE),
+                msg=path.name,
+            )
@@ -0,0 +1,122 @@
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from commonroad.common.file_reader import CommonRoadFileReader
+from commonroad_route_planner.lane_changing.lane_change_methods.method_interface import LaneChangeMethod
+
+from commonroad_labeling.common import route_cache as route_cache_module
+from commonroad_labeling.common.general import find_scenario_tags
+from commonroad_labeling.common.map_cache import MapTagCache
+from commonroad_labeling.common.route import RouteMode
+from commonroad_labeling.common.route_cache import RouteCache, get_planning_problem_fingerprint, plan_reference_paths
+
+SCENARIO_NAMES = ["DEU_Hoerstein-1_1_I-1.cr.xml", "USA_Peach-3_3_I-1-1.cr.xml", "ZAM_Tjunction-1_97_T-1.xml"]
+
+
+class RouteCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = pathlib.Path(self.directory.name)
+        self.paths = [pathlib.Path.cwd().joinpath("..", "scenarios", scenario_name) for scenario_name in SCENARIO_NAMES]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_route_cache(self):
+        for path in self.paths:
+            scenario, planning_problem_set = CommonRoadFileReader(path).open()
+            for planning_problem in planning_problem_set.planning_problem_dict.values():
+                expected_routes = plan_reference_paths(scenario.lanelet_network, planning_problem)
+                self.assertEqual(
+                    [route.lanelet_ids for route in expected_routes],
+                    [
+                        route.lanelet_ids
+                        for route in RouteCache(self.cache_dir).get_routes(scenario.lanelet_network, planning_problem)
+                    ],
+                )
+
+                # Cached routes must be loaded without planning them again
+                with mock.patch.object(route_cache_module, "plan_reference_paths", side_effect=AssertionError):
+                    routes = RouteCache(self.cache_dir).get_routes(scenario.lanelet_network, planning_problem)
+
+                self.assertEqual(len(expected_routes), len(routes))
+                for expected_route, route in zip(expected_routes, routes):
+                    self.assertIs(scenario.lanelet_network, route.lanelet_network)
+                    self.assertEqual(expected_route.lanelet_ids, route.lanelet_ids)
+                    self.assertEqual(expected_route.num_lane_change_actions, route.num_lane_change_actions)
+                    self.assertEqual(expected_route.lane_change_method, route.lane_change_method)
+                    self.assertEqual(expected_route.prohibited_lanelet_ids, route.prohibited_lanelet_ids)
+                    self.assertEqual(expected_route.length_reference_path, route.length_reference_path)
+                    np.testing.assert_array_equal(expected_route.reference_path, route.reference_path)
+                    np.testing.assert_array_equal(expected_route.path_curvature, route.path_curvature)
+                    self.assertEqual(
+                        [section.adjacent_lanelet_ids for section in expected_route.sections],
+                        [section.adjacent_lanelet_ids for section in route.sections],
+                    )
+
+        self.assertEqual(len(SCENARIO_NAMES), len(list(self.cache_dir.glob("*.npz"))))
+
+    def test_route_cache_planner_settings(self):
+        scenario, planning_problem_set = CommonRoadFileReader(self.paths[0]).open()
+        planning_problem = next(iter(planning_problem_set.planning_problem_dict.values()))
+        expected_routes = plan_reference_paths(scenario.lanelet_network, planning_problem)
+        for expected_route in expected_routes:
+            expected_route.lane_change_method = LaneChangeMethod.CUBIC_SPLINE
+            expected_route.prohibited_lanelet_ids = expected_route.lanelet_ids[:1]
+        expected_routes[0].prohibited_lanelet_ids = None
+
+        with mock.patch.object(route_cache_module, "plan_reference_paths", return_value=expected_routes):
+            RouteCache(self.cache_dir).get_routes(scenario.lanelet_network, planning_problem)
+        with mock.patch.object(route_cache_module, "plan_reference_paths", side_effect=AssertionError):
+            routes = RouteCache(self.cache_dir).get_routes(scenario.lanelet_network, planning_problem)
+
+        self.assertEqual(
+            [route.lane_change_method for route in expected_routes], [route.lane_change_method for route in routes]
+        )
+        self.assertEqual(
+            [route.prohibited_lanelet_ids for route in expected_routes],
+            [route.prohibited_lanelet_ids for route in routes],
+        )
+
+    def test_route_cache_format_version(self):
+        scenario, planning_problem_set = CommonRoadFileReader(self.paths[0]).open()
+        planning_problem = next(iter(planning_problem_set.planning_problem_dict.values()))
+        RouteCache(self.cache_dir).get_routes(scenario.lanelet_network, planning_problem)
+
+        # Files written in an older format must not be loaded
+        with (
+            mock.patch.object(
+                route_cache_module, "ROUTE_CACHE_FORMAT_VERSION", route_cache_module.ROUTE_CACHE_FORMAT_VERSION - 1
+            ),
+            mock.patch.object(route_cache_module, "plan_reference_paths", wraps=plan_reference_paths) as plan_routes,
+        ):
+            RouteCache(self.cache_dir).get_routes(scenario.lanelet_network, planning_problem)
+            plan_routes.assert_called_once()
+
+    def test_planning_problem_fingerprint(self):
+        _, planning_problem_set = CommonRoadFileReader(self.paths[0]).open()
+        planning_problem = next(iter(planning_problem_set.planning_problem_dict.values()))
+        fingerprint = get_planning_problem_fingerprint(planning_problem)
+        self.assertEqual(fingerprint, get_planning_problem_fingerprint(planning_problem))
+
+        planning_problem.initial_state.velocity += 1.0
+        self.assertNotEqual(fingerprint, get_planning_problem_fingerprint(planning_problem))
+
+    def test_find_scenario_tags_with_route_cache(self):
+        route_cache = RouteCache(self.cache_dir)
+        for path in self.paths:
+            expected_tags = find_scenario_tags(path, MapTagCache())
+            self.assertEqual(
+                expected_tags,
+                find_scenario_tags(path, MapTagCache(), route_cache=route_cache, route_mode=RouteMode.REFERENCE_PATH),
+            )
+            with mock.patch.object(route_cache_module, "plan_reference_paths", side_effect=AssertionError):
+                self.assertEqual(
+                    expected_tags,
+                    find_scenario_tags(
+                        path, MapTagCache(), route_cache=route_cache, route_mode=RouteMode.REFERENCE_PATH
+                    ),
+                )
@@ -0,0 +1,51 @@
+import unittest
+from collections import Counter
+from unittest import mock
+
+from commonroad_labeling.common.detector_registry import DETECTORS, DetectorDependency
+from commonroad_labeling.common.route_evaluation import RouteTagEvaluator
+from commonroad_labeling.road_configuration.scenario.scenario_obstacle import ObstacleTraffic
+from commonroad_labeling.util_tests import get_scenario_for_error, get_scenarios_with_routes
+
+
+class RouteTagEvaluatorTest(unittest.TestCase):
+    def setUp(self):
+        self.scenarios_and_routes = get_scenarios_with_routes()
+        self.detector_classes = [
+            detector.detector_class for detector in DETECTORS if DetectorDependency.ROUTES in detector.dependencies
+        ]
+
+    def test_find_tags(self):
+        for scenario, routes in self.scenarios_and_routes:
+            expected_tags = set()
+            for route in routes:
+                for detector_class in self.detector_classes:
+                    expected_tags.add(detector_class(route, scenario).get_tag_if_fulfilled())
+            expected_tags.discard(None)
+
+            self.assertEqual(
+                expected_tags,
+                RouteTagEvaluator(scenario, routes).find_tags(self.detector_classes),
+                msg=get_scenario_for_error(str(scenario.scenario_id)),
+            )
+
+    def test_find_tags_without_routes(self):
+        scenario, _ = self.scenarios_and_routes[0]
+        self.assertEqual(set(), RouteTagEvaluator(scenario, []).find_tags(self.detector_classes))
+
+    def test_lanelets_evaluated_once(self):
+        for scenario, routes in self.scenarios_and_routes:
+            with mock.patch.object(
+                ObstacleTraffic,
+                "is_fulfilled_for_lanelet",
+                autospec=True,
+                side_effect=ObstacleTraffic.is_fulfilled_for_lanelet,
+            ) as is_fulfilled_for_lanelet:
+                RouteTagEvaluator(scenario, routes).find_tags(self.detector_classes)
+
+            # Traffic ahead, traffic behind and oncoming traffic share the results of `ObstacleTraffic`
+            lanelet_counts = Counter(call.args[1].lanelet_id for call in is_fulfilled_for_lanelet.call_args_list)
+            self.assertTrue(
+                all(count == 1 for count in lanelet_counts.values()),
+                msg=get_scenario_for_error(str(scenario.scenario_id)),
+            )
@@ -0,0 +1,110 @@
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+from commonroad.common.file_writer import CommonRoadFileWriter, OverwriteExistingFile
+from commonroad.scenario.obstacle import ObstacleType
+
+from commonroad_labeling.common.general import find_scenario_tags, get_planned_routes
+from commonroad_labeling.common.lanelet_network_index import get_lanelet_network_index
+from commonroad_labeling.common.route import RouteMode
+from commonroad_labeling.common.synthetic_scenario import (
+    PLANNING_PROBLEM_ID_OFFSET,
+    create_synthetic_scenario,
+    get_obstacle_state_count,
+)
+from commonroad_labeling.common.tag import TagEnum
+
+
+class SyntheticScenarioTest(unittest.TestCase):
+    def test_grid_size(self):
+        for rows, columns, lanes in [(1, 1, 1), (2, 3, 1), (3, 3, 2)]:
+            scenario, _ = create_synthetic_scenario(rows, columns, lanes_per_direction=lanes)
+            roads = rows * (columns + 1) + columns * (rows + 1)
+            # Every node connects each incoming lane to the lanes of all other roads
+            node_degrees = [
+                (row not in (0, rows)) + (column not in (0, columns)) + 2
+                for row in range(rows + 1)
+                for column in range(columns + 1)
+            ]
+            connecting_lanelets = lanes * sum(degree * (degree - 1) for degree in node_degrees)
+            self.assertEqual(2 * lanes * roads + connecting_lanelets, len(scenario.lanelet_network.lanelets))
+            self.assertEqual(sum(degree >= 3 for degree in node_degrees), len(scenario.lanelet_network.intersections))
+
+        scenario, _ = create_synthetic_scenario(3, 3, intersection_count=2)
+        self.assertEqual(2, len(scenario.lanelet_network.intersections))
+
+    def test_ring_roads(self):
+        scenario, planning_problem_set = create_synthetic_scenario(0, 0, ring_count=3, ring_segments=5)
+        self.assertEqual(15, len(scenario.lanelet_network.lanelets))
+        index = get_lanelet_network_index(scenario.lanelet_network)
+        self.assertEqual(set(index.lanelets), set(index.cyclic_lanelet_ids))
+        self.assertTrue(all(index.is_one_way(lanelet_id) for lanelet_id in index.lanelets))
+        self.assertEqual(1, len(planning_problem_set.planning_problem_dict))
+
+        with self.assertRaises(ValueError):
+            create_synthetic_scenario(0, 0)
+
+    def test_obstacles(self):
+        scenario, planning_problem_set = create_synthetic_scenario(
+            2, 2, dynamic_obstacle_count=20, time_steps=30, static_obstacle_count=4, pedestrian_share=0.5
+        )
+        self.assertEqual(20, len(scenario.dynamic_obstacles))
+        self.assertEqual(4, len(scenario.static_obstacles))
+        self.assertEqual(20 * 31 + 4, get_obstacle_state_count(scenario))
+        self.assertEqual(
+            {ObstacleType.CAR, ObstacleType.PEDESTRIAN},
+            {obstacle.obstacle_type for obstacle in scenario.dynamic_obstacles},
+        )
+        for obstacle in scenario.dynamic_obstacles:
+            self.assertEqual(30, obstacle.prediction.final_time_step)
+            # Obstacles stay on the road network
+            self.assertTrue(
+                all(
+                    scenario.lanelet_network.find_lanelet_by_position([state.position])[0]
+                    for state in obstacle.prediction.trajectory.state_list
+                )
+            )
+
+        # The planning problem is based on the first car
+        planning_problem_id = next(iter(planning_problem_set.planning_problem_dict))
+        ego_obstacle = scenario.obstacle_by_id(planning_problem_id - PLANNING_PROBLEM_ID_OFFSET)
+        self.assertEqual(ObstacleType.CAR, ego_obstacle.obstacle_type)
+        self.assertTrue(get_planned_routes(scenario, planning_problem_set, route_mode=RouteMode.LANELET_SEQUENCE))
+
+    def test_seed(self):
+        scenario, _ = create_synthetic_scenario(2, 2, dynamic_obstacle_count=5)
+        same_scenario, _ = create_synthetic_scenario(2, 2, dynamic_obstacle_count=5)
+        other_scenario, _ = create_synthetic_scenario(2, 2, dynamic_obstacle_count=5, seed=1)
+        positions = [obstacle.initial_state.position for obstacle in scenario.dynamic_obstacles]
+        np.testing.assert_array_equal(
+            positions, [obstacle.initial_state.position for obstacle in same_scenario.dynamic_obstacles]
+        )
+        self.assertFalse(
+            np.array_equal(
+                positions, [obstacle.initial_state.position for obstacle in other_scenario.dynamic_obstacles]
+            )
+        )
+
+    def test_labeling(self):
+        scenario, planning_problem_set = create_synthetic_scenario(
+            2, 2, lanes_per_direction=2, ring_count=1, dynamic_obstacle_count=10, static_obstacle_count=2
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory).joinpath("synthetic.xml")
+            CommonRoadFileWriter(scenario, planning_problem_set).write_to_file(str(path), OverwriteExistingFile.ALWAYS)
+            tags = find_scenario_tags(path)
+
+        self.assertLessEqual(
+            {
+                TagEnum.SCENARIO_LANELET_LAYOUT_MULTI_LANE,
+                TagEnum.SCENARIO_LANELET_LAYOUT_BIDIRECTIONAL,
+                TagEnum.SCENARIO_LANELET_LAYOUT_ONE_WAY,
+                TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION,
+                TagEnum.SCENARIO_LANELET_LAYOUT_ROUNDABOUT,
+                TagEnum.SCENARIO_OBSTACLE_STATIC,
+                TagEnum.SCENARIO_OBSTACLE_TRAFFIC,
+            },
+            tags,
+        )
@@ -0,0 +1,64 @@
+import pathlib
+import random
+import tempfile
+import unittest
+
+from commonroad_labeling.common.tag import TagEnum
+from commonroad_labeling.common.tag_index import TagIndex
+from commonroad_labeling.common.tag_query import parse_tag_query
+
+QUERIES = [
+    "intersection AND turn_left AND NOT traffic_light",
+    "SCENARIO_OBSTACLE OR (roundabout AND NOT one_way)",
+    "NOT route_lanelet_layout",
+    "scenario_lanelet_layout|intersection",
+]
+
+
+class TagIndexTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.tags_by_file = {
+            pathlib.Path(f"scenario_{index:03d}.xml"): set(random.sample(list(TagEnum), random.randint(0, 15)))
+            for index in range(200)
+        }
+        self.tags_by_file[pathlib.Path("failed.xml")] = None
+
+    def test_add_and_get_tags(self):
+        with TagIndex() as tag_index:
+            path = pathlib.Path("scenario.xml")
+            self.assertIsNone(tag_index.get_tags(path))
+
+            tag_index.add(path, {TagEnum.SCENARIO_LANELET_LAYOUT_ONE_WAY, TagEnum.ROUTE_LANELET_LAYOUT_ONE_WAY})
+            self.assertEqual(1, tag_index.count("one_way"))
+
+            tag_index.add(path, {TagEnum.SCENARIO_LANELET_LAYOUT_ROUNDABOUT})
+            self.assertEqual({TagEnum.SCENARIO_LANELET_LAYOUT_ROUNDABOUT}, tag_index.get_tags(path))
+            self.assertEqual(0, tag_index.count("one_way"))
+            self.assertEqual([path], tag_index.query("roundabout"))
+
+            tag_index.add(path, None)
+            self.assertIsNone(tag_index.get_tags(path))
+            self.assertEqual([], tag_index.query("NOT roundabout"))
+
+            tag_index.remove(path)
+            self.assertEqual(0, tag_index.count("NOT roundabout"))
+
+    def test_query(self):
+        with tempfile.TemporaryDirectory() as directory:
+            database_path = pathlib.Path(directory).joinpath("tags.sqlite")
+            with TagIndex(database_path) as tag_index:
+                tag_index.add_tags_by_file(self.tags_by_file)
+
+            # Queries must match evaluating them on every file, files that could not be labeled never match
+            with TagIndex(database_path) as tag_index:
+                for text in QUERIES:
+                    with self.subTest(query=text):
+                        query = parse_tag_query(text)
+                        expected_paths = sorted(
+                            path
+                            for path, tags in self.tags_by_file.items()
+                            if tags is not None and query.evaluate(tags)
+                        )
+                        self.assertEqual(expected_paths, tag_index.query(text))
+                        self.assertEqual(len(expected_paths), tag_index.count(query))
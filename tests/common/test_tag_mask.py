@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from commonroad_labeling.common.tag import TagEnum
+from commonroad_labeling.common.tag_mask import TAG_BITS, TagMask, get_tag_counts, get_tag_mask_array, get_tag_sets
+
+
+class TagMaskTest(unittest.TestCase):
+    def test_tag_bits_are_stable(self):
+        # Bits of existing tags must never change, since tag masks may be stored
+        self.assertEqual(1 << 0, TAG_BITS[TagEnum.SCENARIO_LANELET_LAYOUT_SINGLE_LANE])
+        self.assertEqual(1 << 8, TAG_BITS[TagEnum.SCENARIO_TRAFFIC_SIGN_SPEED_LIMIT])
+        self.assertEqual(1 << 16, TAG_BITS[TagEnum.ROUTE_LANELET_LAYOUT_SINGLE_LANE])
+        self.assertEqual(1 << 37, TAG_BITS[TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_PROCEED_STRAIGHT])
+        self.assertEqual(len(TagEnum), len(set(TAG_BITS.values())))
+        self.assertLess(max(TAG_BITS.values()), 1 << 64)
+
+    def test_tag_mask_conversion(self):
+        tags = {TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION, TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_TURN_LEFT}
+        mask = TagMask.from_tags([*tags, None])
+        self.assertEqual(tags, mask.to_tags())
+        self.assertEqual(2, len(mask))
+        self.assertIn(TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION, mask)
+        self.assertNotIn(TagEnum.SCENARIO_TRAFFIC_SIGN_TRAFFIC_LIGHT, mask)
+        self.assertEqual(set(TagEnum), TagMask.all().to_tags())
+        self.assertEqual(set(), TagMask().to_tags())
+
+    def test_tag_mask_set_operations(self):
+        first_tags = {TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION, TagEnum.SCENARIO_TRAFFIC_SIGN_STOP_LINE}
+        second_tags = {TagEnum.SCENARIO_TRAFFIC_SIGN_STOP_LINE, TagEnum.ROUTE_OBSTACLE_STATIC}
+        first_mask = TagMask.from_tags(first_tags)
+        second_mask = TagMask.from_tags(second_tags)
+
+        for result, expected_tags in [
+            (first_mask | second_mask, first_tags | second_tags),
+            (first_mask & second_mask, first_tags & second_tags),
+            (first_mask ^ second_mask, first_tags ^ second_tags),
+            (first_mask - second_mask, first_tags - second_tags),
+            (~first_mask, set(TagEnum) - first_tags),
+        ]:
+            self.assertIsInstance(result, TagMask)
+            self.assertEqual(expected_tags, result.to_tags())
+
+        self.assertTrue((first_mask & second_mask).issubset(first_mask))
+        self.assertFalse(first_mask.issubset(second_mask))
+        self.assertTrue((first_mask - second_mask).isdisjoint(second_mask))
+        self.assertEqual(first_mask, TagMask.from_tags(first_tags))
+        self.assertEqual(hash(first_mask), hash(TagMask.from_tags(first_tags)))
+
+    def test_tag_mask_array(self):
+        tag_sets = [
+            {TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION},
+            None,
+            {TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION, TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_PROCEED_STRAIGHT},
+            set(),
+        ]
+        masks = get_tag_mask_array(tag_sets)
+        self.assertEqual(np.uint64, masks.dtype)
+        self.assertEqual([tags or set() for tags in tag_sets], get_tag_sets(masks))
+
+        tag_counts = get_tag_counts(masks)
+        self.assertEqual(2, tag_counts[TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION])
+        self.assertEqual(1, tag_counts[TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_PROCEED_STRAIGHT])
+        self.assertEqual(0, tag_counts[TagEnum.SCENARIO_TRAFFIC_SIGN_TRAFFIC_LIGHT])
@@ -0,0 +1,86 @@
+import unittest
+
+from commonroad_labeling.common.tag import TagEnum, TagGroupEnum
+from commonroad_labeling.common.tag_query import (
+    TagQueryAnd,
+    TagQueryNot,
+    TagQueryOr,
+    get_tags_of_group,
+    has_group,
+    has_tag,
+    parse_tag_query,
+)
+
+
+class TagQueryTest(unittest.TestCase):
+    def test_parse_tag_query_precedence(self):
+        query = parse_tag_query("intersection AND turn_left AND NOT traffic_light OR roundabout")
+        self.assertIsInstance(query, TagQueryOr)
+        self.assertIsInstance(query.operands[0], TagQueryAnd)
+        self.assertEqual(3, len(query.operands[0].operands))
+        self.assertIsInstance(query.operands[0].operands[2], TagQueryNot)
+
+        self.assertEqual(
+            has_tag(TagEnum.SCENARIO_LANELET_LAYOUT_ROUNDABOUT),
+            parse_tag_query("scenario_lanelet_layout|roundabout"),
+        )
+        self.assertEqual(
+            has_tag(TagEnum.SCENARIO_LANELET_LAYOUT_ROUNDABOUT) & ~has_group(TagGroupEnum.SCENARIO_OBSTACLE),
+            parse_tag_query("(SCENARIO_LANELET_LAYOUT_ROUNDABOUT and not scenario_obstacle)"),
+        )
+
+    def test_evaluate(self):
+        query = parse_tag_query("intersection AND turn_left AND NOT traffic_light")
+        self.assertEqual(
+            {
+                TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION,
+                TagEnum.ROUTE_LANELET_LAYOUT_INTERSECTION,
+                TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_TURN_LEFT,
+                TagEnum.SCENARIO_TRAFFIC_SIGN_TRAFFIC_LIGHT,
+                TagEnum.ROUTE_TRAFFIC_SIGN_TRAFFIC_LIGHT,
+            },
+            query.get_tags(),
+        )
+        self.assertTrue(
+            query.evaluate({TagEnum.ROUTE_LANELET_LAYOUT_INTERSECTION, TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_TURN_LEFT})
+        )
+        self.assertFalse(
+            query.evaluate(
+                {
+                    TagEnum.ROUTE_LANELET_LAYOUT_INTERSECTION,
+                    TagEnum.EGO_VEHICLE_GOAL_INTERSECTION_TURN_LEFT,
+                    TagEnum.SCENARIO_TRAFFIC_SIGN_TRAFFIC_LIGHT,
+                }
+            )
+        )
+        self.assertFalse(query.evaluate(set()))
+
+        group_query = parse_tag_query("route_obstacle")
+        self.assertEqual(get_tags_of_group(TagGroupEnum.ROUTE_OBSTACLE), group_query.get_tags())
+        self.assertTrue(group_query.evaluate({TagEnum.ROUTE_OBSTACLE_ONCOMING_TRAFFIC}))
+
+    def test_evaluate_partial(self):
+        query = parse_tag_query("SCENARIO_LANELET_LAYOUT_INTERSECTION AND NOT SCENARIO_TRAFFIC_SIGN_TRAFFIC_LIGHT")
+        intersection = TagEnum.SCENARIO_LANELET_LAYOUT_INTERSECTION
+        traffic_light = TagEnum.SCENARIO_TRAFFIC_SIGN_TRAFFIC_LIGHT
+        self.assertIsNone(query.evaluate_partial(set(), set()))
+        self.assertFalse(query.evaluate_partial(set(), {intersection}))
+        self.assertIsNone(query.evaluate_partial({intersection}, {intersection}))
+        self.assertFalse(query.evaluate_partial({traffic_light}, {traffic_light}))
+        self.assertTrue(query.evaluate_partial({intersection}, {intersection, traffic_light}))
+
+        or_query = parse_tag_query("SCENARIO_LANELET_LAYOUT_INTERSECTION OR SCENARIO_TRAFFIC_SIGN_TRAFFIC_LIGHT")
+        self.assertTrue(or_query.evaluate_partial({traffic_light}, {traffic_light}))
+        self.assertIsNone(or_query.evaluate_partial(set(), {traffic_light}))
+        self.assertFalse(or_query.evaluate_partial(set(), {intersection, traffic_light}))
+
+        # Once all tags are decided, the partial evaluation equals the evaluation
+        all_tags = set(TagEnum)
+        for tags in [set(), {intersection}, {traffic_light}, {intersection, traffic_light}]:
+            self.assertEqual(query.evaluate(tags), query.evaluate_partial(tags, all_tags))
+            self.assertEqual(or_query.evaluate(tags), or_query.evaluate_partial(tags, all_tags))
+
+    def test_parse_tag_query_errors(self):
+        for text in ["", "intersection AND", "(intersection", "intersection)", "NOT", "unknown_tag", "AND roundabout"]:
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_tag_query(text)
@@ -4,7 +4,7 @@ import pytest
 
 from commonroad_labeling.criticality.analyzer import cm_analyzer
 from commonroad_labeling.criticality.analyzer.cm_analyzer import (
-    NEGATIVE_MONOTONE_METRICS,
+    get_negative_monotone_metrics,
     min_max_scale_df,
     variance_chooser,
 )
@@ -169,21 +169,23 @@ def test_variance_chooser_some_columns_removed():
 
 
 def test_monotonicity_adjustment_all_neg_mono_metrics():
-    df = pd.DataFrame({metric.measure_name: [0.1 + i * 0.1 for i in range(10)] for metric in NEGATIVE_MONOTONE_METRICS})
+    negative_monotone_metrics = get_negative_monotone_metrics()
+    df = pd.DataFrame({metric.measure_name: [0.1 + i * 0.1 for i in range(10)] for metric in negative_monotone_metrics})
     adjusted_df = cm_analyzer.monotonicity_adjustment(df)
     # All metrics should be inverted
-    for metric in NEGATIVE_MONOTONE_METRICS:
+    for metric in negative_monotone_metrics:
         assert (1 - df[metric.measure_name] == adjusted_df[metric.measure_name]).all()
     # The adjusted dataframe should have exactly one column for each metric
-    assert len(adjusted_df.columns) == len(NEGATIVE_MONOTONE_METRICS)
+    assert len(adjusted_df.columns) == len(negative_monotone_metrics)
 
 
 def test_monotonicity_adjustment_partial_neg_mono_metrics():
-    df = pd.DataFrame({metric.measure_name: [0.1 + i * 0.1 for i in range(10)] for metric in NEGATIVE_MONOTONE_METRICS})
+    negative_monotone_metrics = get_negative_monotone_metrics()
+    df = pd.DataFrame({metric.measure_name: [0.1 + i * 0.1 for i in range(10)] for metric in negative_monotone_metrics})
     df["NonNegativeMetric"] = [0.4 + i * 0.1 for i in range(10)]
     adjusted_df = cm_analyzer.monotonicity_adjustment(df)
     for column in df.columns:
-        if column in [metric.measure_name for metric in NEGATIVE_MONOTONE_METRICS]:
+        if column in [metric.measure_name for metric in negative_monotone_metrics]:
             assert (1 - df[column] == adjusted_df[column]).all()
         else:
             assert (df[column] == adjusted_df[column]).all()
@@ -1,5 +1,8 @@
 import unittest
 
+from commonroad.scenario.lanelet import LaneletNetwork
+from commonroad.scenario.scenario import Scenario
+
 from commonroad_labeling.common.tag import TagEnum
 from commonroad_labeling.road_configuration.scenario.scenario_lanelet_layout import (
     LaneletLayoutBidirectional,
@@ -11,7 +14,12 @@ from commonroad_labeling.road_configuration.scenario.scenario_lanelet_layout imp
     LaneletLayoutRoundabout,
     LaneletLayoutSingleLane,
 )
-from commonroad_labeling.util_tests import expected_scenario_tags, get_scenario_for_error, get_scenarios
+from commonroad_labeling.util_tests import (
+    create_straight_lanelet,
+    expected_scenario_tags,
+    get_scenario_for_error,
+    get_scenarios,
+)
 
 
 class ScenarioLaneletLayoutTest(unittest.TestCase):
@@ -119,3 +127,25 @@ class ScenarioLaneletLayoutTest(unittest.TestCase):
                     LaneletLayoutRoundabout(scenario).is_fulfilled(),
                     msg=get_scenario_for_error(str(scenario.scenario_id)),
                 )
+
+    def test_lanelet_layout_roundabout_long_lanelet_chain(self):
+        chain_length = 5000
+        lanelets = []
+        for lanelet_id in range(1, chain_length + 1):
+            successor = [lanelet_id + 1] if lanelet_id < chain_length else [chain_length - 2]
+            predecessor = [lanelet_id - 1] if lanelet_id > 1 else []
+            if lanelet_id == chain_length - 2:
+                predecessor.append(chain_length)
+            lanelets.append(create_straight_lanelet(lanelet_id, predecessor=predecessor, successor=successor))
+        lanelets.append(create_straight_lanelet(chain_length + 1))
+
+        scenario = Scenario(0.1)
+        scenario.add_objects(LaneletNetwork.create_from_lanelet_list(lanelets))
+        detector = LaneletLayoutRoundabout(scenario)
+
+        self.assertTrue(detector.is_fulfilled())
+        self.assertTrue(detector.is_fulfilled_for_lanelet(scenario.lanelet_network.find_lanelet_by_id(1)))
+        self.assertTrue(detector.is_fulfilled_for_lanelet(scenario.lanelet_network.find_lanelet_by_id(chain_length)))
+        self.assertFalse(
+            detector.is_fulfilled_for_lanelet(scenario.lanelet_network.find_lanelet_by_id(chain_length + 1))
+        )
@@ -0,0 +1,50 @@
+import unittest
+
+from commonroad_labeling.road_configuration.scenario.scenario_lanelet_scan import (
+    LANELET_SCANNED_TAG_CLASSES,
+    LaneletTagScanner,
+)
+from commonroad_labeling.util_tests import get_scenario_for_error, get_scenarios
+
+
+class ScenarioLaneletScanTest(unittest.TestCase):
+    def setUp(self):
+        self.scenarios = get_scenarios()
+
+    def test_lanelet_tag_scanner_find_tags(self):
+        for scenario in self.scenarios:
+            expected_tags = {
+                scenario_tag_class(scenario).get_tag_if_fulfilled()
+                for scenario_tag_class in LANELET_SCANNED_TAG_CLASSES
+            } - {None}
+            self.assertEqual(
+                expected_tags,
+                LaneletTagScanner(scenario).find_tags(),
+                msg=get_scenario_for_error(str(scenario.scenario_id)),
+            )
+
+    def test_lanelet_tag_scanner_lanelet_masks(self):
+        for scenario in self.scenarios:
+            scanner = LaneletTagScanner(scenario)
+            lanelet_masks = scanner.get_lanelet_masks()
+            for scenario_tag in scanner.scenario_tags:
+                self.assertEqual(
+                    {
+                        lanelet.lanelet_id
+                        for lanelet in scenario.lanelet_network.lanelets
+                        if scenario_tag.is_fulfilled_for_lanelet(lanelet)
+                    },
+                    {
+                        lanelet_id
+                        for lanelet_id, lanelet_mask in lanelet_masks.items()
+                        if lanelet_mask & scanner.get_bit(scenario_tag.tag)
+                    },
+                    msg=get_scenario_for_error(str(scenario.scenario_id)),
+                )
+
+            # Tags found from memoized bitmaps must match the tags found by scanning
+            self.assertEqual(
+                LaneletTagScanner(scenario).find_tags(),
+                scanner.find_tags(),
+                msg=get_scenario_for_error(str(scenario.scenario_id)),
+            )
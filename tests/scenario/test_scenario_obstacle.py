@@ -1,10 +1,19 @@
+import pathlib
 import unittest
+from unittest import mock
 
+from commonroad.common.file_reader import CommonRoadFileReader
+
+from commonroad_labeling.common.lanelet_spatial_index import LaneletSpatialIndex
 from commonroad_labeling.common.tag import TagEnum
 from commonroad_labeling.road_configuration.scenario.scenario_obstacle import (
+    ObstacleLaneletOccupancy,
     ObstacleOtherDynamic,
     ObstacleStatic,
     ObstacleTraffic,
+    extract_dynamic_obstacles_from_scenario,
+    extract_lanelet_ids_for_single_obstacle,
+    get_obstacle_lanelet_occupancy,
 )
 from commonroad_labeling.util_tests import expected_scenario_tags, get_scenario_for_error, get_scenarios
 
@@ -45,3 +54,45 @@ class ScenarioObstacleTest(unittest.TestCase):
                 self.assertFalse(
                     ObstacleStatic(scenario).is_fulfilled(), msg=get_scenario_for_error(str(scenario.scenario_id))
                 )
+
+    def test_obstacle_lanelet_occupancy(self):
+        for scenario in self.scenarios:
+            occupancy = get_obstacle_lanelet_occupancy(scenario)
+            self.assertIs(occupancy, get_obstacle_lanelet_occupancy(scenario))
+            for is_traffic in [True, False]:
+                expected_lanelet_ids = set()
+                for obstacle in extract_dynamic_obstacles_from_scenario(scenario, is_traffic):
+                    lanelet_ids = extract_lanelet_ids_for_single_obstacle(scenario, obstacle)
+                    expected_lanelet_ids.update(lanelet_ids)
+                    for lanelet_id in lanelet_ids:
+                        self.assertIn(
+                            obstacle.obstacle_id,
+                            occupancy.get_obstacle_ids(lanelet_id, is_traffic),
+                            msg=get_scenario_for_error(str(scenario.scenario_id)),
+                        )
+
+                self.assertEqual(
+                    expected_lanelet_ids,
+                    occupancy.get_occupied_lanelet_ids(is_traffic),
+                    msg=get_scenario_for_error(str(scenario.scenario_id)),
+                )
+
+    def test_obstacle_lanelet_occupancy_reader_assignment(self):
+        for path in pathlib.Path.cwd().joinpath("..", "scenarios").glob("*.cr.xml"):
+            scenario, _ = CommonRoadFileReader(path).open(lanelet_assignment=True)
+            # Only obstacles without a trajectory are not assigned by the reader and matched in a single batched query
+            with mock.patch.object(
+                LaneletSpatialIndex, "query", autospec=True, side_effect=LaneletSpatialIndex.query
+            ) as query:
+                reused_occupancy = ObstacleLaneletOccupancy(scenario)
+            self.assertLessEqual(query.call_count, 1, msg=path.name)
+
+            # Without the reader's assignment, all obstacles are assigned to lanelets by the index itself
+            batched_occupancy = ObstacleLaneletOccupancy(CommonRoadFileReader(path).open()[0])
+            self.assertEqual(
+                reused_occupancy.traffic_obstacle_ids, batched_occupancy.traffic_obstacle_ids, msg=path.name
+            )
+            self.assertEqual(
+                reused_occupancy.other_dynamic_obstacle_ids, batched_occupancy.other_dynamic_obstacle_ids, msg=path.name
+            )
+            self.assertEqual(reused_occupancy.static_obstacle_ids, batched_occupancy.static_obstacle_ids, msg=path.name)
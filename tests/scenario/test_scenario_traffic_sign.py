@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from commonroad_labeling.common.tag import TagEnum
 from commonroad_labeling.road_configuration.scenario.scenario_traffic_sign import (
@@ -6,7 +7,9 @@ from commonroad_labeling.road_configuration.scenario.scenario_traffic_sign impor
     TrafficSignRightOfWay,
     TrafficSignSpeedLimit,
     TrafficSignStopLine,
+    TrafficSignTag,
     TrafficSignTrafficLight,
+    get_traffic_sign_group_table,
 )
 from commonroad_labeling.util_tests import expected_scenario_tags, get_scenario_for_error, get_scenarios
 
@@ -77,3 +80,65 @@ class ScenarioTrafficSignTest(unittest.TestCase):
                     TrafficSignTrafficLight(scenario).is_fulfilled(),
                     msg=get_scenario_for_error(str(scenario.scenario_id)),
                 )
+
+    def test_traffic_sign_group_table(self):
+        traffic_sign_tag_classes = [TrafficSignSpeedLimit, TrafficSignRightOfWay, TrafficSignNoRightOfWay]
+        self.assertEqual(
+            len(traffic_sign_tag_classes),
+            len({traffic_sign_tag_class.group_bit for traffic_sign_tag_class in traffic_sign_tag_classes}),
+        )
+        for scenario in self.scenarios:
+            table = get_traffic_sign_group_table(scenario.lanelet_network)
+            self.assertIs(table, get_traffic_sign_group_table(scenario.lanelet_network))
+            for traffic_sign in scenario.lanelet_network.traffic_signs:
+                for traffic_sign_tag_class in traffic_sign_tag_classes:
+                    self.assertEqual(
+                        any(
+                            element.traffic_sign_element_id in traffic_sign_tag_class.traffic_signs
+                            for element in traffic_sign.traffic_sign_elements
+                        ),
+                        bool(
+                            table.mask_by_traffic_sign_id[traffic_sign.traffic_sign_id]
+                            & traffic_sign_tag_class.group_bit
+                        ),
+                        msg=get_scenario_for_error(str(scenario.scenario_id)),
+                    )
+
+    def test_traffic_sign_tag_subclass(self):
+        with self.assertRaises(TypeError):
+
+            class TrafficSignWithoutGroup(TrafficSignTag):
+                def get_traffic_signs(self):
+                    return TrafficSignSpeedLimit.traffic_signs
+
+                def get_tag(self) -> TagEnum:
+                    return TagEnum.SCENARIO_TRAFFIC_SIGN_SPEED_LIMIT
+
+        tables = [get_traffic_sign_group_table(scenario.lanelet_network) for scenario in self.scenarios]
+
+        # The group of the subclass defined below is removed from the global registry after the test
+        with (
+            mock.patch.dict(TrafficSignTag.group_mask_by_traffic_sign),
+            mock.patch.object(TrafficSignTag, "_group_count", TrafficSignTag._group_count),
+        ):
+            # Groups defined after a table was built are classified when the table is requested again
+            class TrafficSignSpeedLimitCopy(TrafficSignTag):
+                traffic_signs = TrafficSignSpeedLimit.traffic_signs
+
+                def get_tag(self) -> TagEnum:
+                    return TagEnum.SCENARIO_TRAFFIC_SIGN_SPEED_LIMIT
+
+            for scenario, table in zip(self.scenarios, tables):
+                self.assertIs(table, get_traffic_sign_group_table(scenario.lanelet_network))
+                self.assertEqual(
+                    TrafficSignSpeedLimit(scenario).is_fulfilled(),
+                    TrafficSignSpeedLimitCopy(scenario).is_fulfilled(),
+                    msg=get_scenario_for_error(str(scenario.scenario_id)),
+                )
+            group_count = TrafficSignTag._group_count
+
+        self.assertEqual(group_count - 1, TrafficSignTag._group_count)
+        self.assertNotIn(
+            TrafficSignSpeedLimitCopy.group_bit,
+            [mask & TrafficSignSpeedLimitCopy.group_bit for mask in TrafficSignTag.group_mask_by_traffic_sign.values()],
+        )